@@ -1,31 +1,60 @@
 """Petra asset query"""
 
 import json
+import os
+import shutil
 import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Deque, Dict, Iterator, List, Optional
 import pandas as pd
-import numpy as np
 import pyodbc
+import shapely
+from shapely.geometry.base import BaseGeometry
 
 from purr_petra.core.dbisam import db_exec
 from purr_petra.core.database import get_db
-from purr_petra.core.crud import get_repo_by_id, get_file_depot
-from purr_petra.assets.collect.xformer import formatters
+from purr_petra.core.crud import (
+    get_file_depot,
+    get_repo_by_id,
+    get_well_index_build,
+    resolve_wsns,
+    wells_in_bounds,
+)
 from purr_petra.core.util import async_wrap, import_dict_from_file
-from purr_petra.assets.collect.post_process import post_process
+from purr_petra.core.tasks import (
+    ProgressTracker,
+    TaskCancelled,
+    raise_if_cancelled,
+)
+from purr_petra.assets.collect.las_export import write_well_las
+from purr_petra.assets.collect.post_process import GroupCarry
+from purr_petra.assets.collect.schema import build_frame
+from purr_petra.assets.collect.sidecar import SidecarWriter
+from purr_petra.assets.collect.transform import (
+    TRANSFORM_PROCS,
+    submit_chunk,
+    transform_frame,
+    transform_pool,
+)
 from purr_petra.assets.collect.xformer import (
     PURR_WHERE,
     transform_dataframe_to_json,
-    standardize_df_columns,
 )
 from purr_petra.assets.collect.sql_helper import (
-    get_column_info,
+    RecipeId,
     make_where_clause,
+    make_wsn_where_clause,
     create_selectors,
     chunk_ids,
+    parse_id,
 )
 from purr_petra.core.logger import logger
+from purr_petra.core.schemas import CurveWindow, ExportFormat
+from purr_petra.recon.recon import refresh_well_index
+from purr_petra.recon.repo_fs import repo_fingerprint
 
 
 # because DBISAM isn't exactly popular...
@@ -33,137 +62,543 @@ warnings.filterwarnings(
     "ignore", message="pandas only supports SQLAlchemy connectable.*"
 )
 
+# number of ids in the first chunk of a streamed response (time to first doc)
+STREAM_FIRST_CHUNK = 50
+
+# most locally resolved wsns to pass to an identifier query as an IN list.
+# UWI filters resolving to more use their LIKE filters instead (cheaper for
+# DBISAM to parse); area filters have no LIKE form, so they run in batches.
+MAX_WSN_IN = 5000
+
+# threads writing LAS files (one well at a time each) for las exports
+LAS_WRITERS = int(os.environ.get("PURR_PETRA_LAS_WRITERS", "4"))
+
 ##############################################################################
 
 
-def fetch_id_list(conn, id_sql):
+def fetch_id_list(conn, id_sql) -> List[RecipeId]:
     """
     Executes and asset recipe's identifier SQL and returns ids.
     :return: Results will be either be a single "keylist"
-    [{keylist: ["1-62", "1-82", "2-83", "2-84"]}]
+    [{keylist: "1-62,1-82,2-83,2-84"}]
     or a list of key ids
     [{key: "1-62"}, {key: "1-82"}, {key: "2-83"}, {key: "2-84"}]
-    Force int() or str(); the typical case is a list of int
+    Keys are parsed to ints, or to int tuples for compound identifier_keys:
+    [(1, 62), (1, 82), (2, 83), (2, 84)]
     """
-
-    def int_or_string(obj):
-        try:
-            return int(obj)
-        except ValueError:
-            return f"'{str(obj).strip()}'"
-
     res = db_exec(conn, id_sql)
 
-    ids = []
+    keys = []
 
     if not res:
         logger.info("no ids found")
     elif "keylist" in res[0] and res[0]["keylist"] is not None:
-        ids = res[0]["keylist"].split(",")
+        keys = res[0]["keylist"].split(",")
     elif "key" in res[0] and res[0]["key"] is not None:
-        ids = [k["key"] for k in res]
+        keys = [k["key"] for k in res]
     else:
         logger.info("key or keylist missing; cannot make id list")
 
-    return [int_or_string(i) for i in ids]
+    ids = []
+    for key in keys:
+        parsed = parse_id(key)
+        if parsed is None:
+            logger.warning(f"skipping malformed id: {key}")
+            continue
+        ids.append(parsed)
+    return ids
+
+
+def local_wsns(
+    repo_id: str,
+    fs_path: Optional[str],
+    uwi_list: List[str],
+    area: Optional[BaseGeometry] = None,
+    conn: Optional[Dict[str, Any]] = None,
+) -> Optional[List[int]]:
+    """Resolve UWI patterns and/or an area (bbox or polygon) to wsns with the
+    local well index (built by recon) instead of querying DBISAM. The index is
+    only used while the repo's DB files are unchanged since it was built.
 
+    Args:
+        repo_id (str): ID from a specific project
+        fs_path (Optional[str]): The repo's fs_path, for its fingerprint
+        uwi_list (List[str]): List of UWI strings with optional wildcards
+        area (Optional[BaseGeometry]): Only wells with a surface location
+            inside this lon/lat geometry
+        conn (Optional[Dict[str, Any]]): DBISAM connection params; if given, a
+            missing or stale index is rebuilt first
 
-def collect_and_assemble_docs(args: Dict[str, Any]):
-    """todo"""
+    Returns:
+        Optional[List[int]]: Sorted wsns, or None if there is no current index
+    """
+    if not fs_path:
+        return None
+    db = next(get_db())
+    try:
+        build = get_well_index_build(db, repo_id)
+        current = build is not None and build.fingerprint == repo_fingerprint(fs_path)
+        if not current and conn is not None:
+            current = refresh_well_index(
+                {"id": repo_id, "fs_path": fs_path, "conn": conn}
+            )
+        if not current:
+            return None
+
+        if area is None:
+            return resolve_wsns(db, repo_id, uwi_list)
+
+        rows = wells_in_bounds(db, repo_id, area.bounds)
+        inside = shapely.intersects_xy(
+            area, [r[1] for r in rows], [r[2] for r in rows]
+        )
+        wsns = {r[0] for r, hit in zip(rows, inside) if hit}
+        if uwi_list:
+            wsns &= set(resolve_wsns(db, repo_id, uwi_list))
+        return sorted(wsns)
+    finally:
+        db.close()
+
+
+def fetch_ids_for_wsns(
+    conn: Dict[str, Any], recipe: Dict[str, Any], wsns: List[int]
+) -> List[RecipeId]:
+    """Run the recipe identifier query for known wsns, MAX_WSN_IN at a time
+
+    Args:
+        conn (Dict[str, Any]): DBISAM connection params
+        recipe (Dict[str, Any]): The asset recipe
+        wsns (List[int]): wsns resolved by local_wsns
+
+    Returns:
+        List[RecipeId]: ids, as from fetch_id_list
+    """
+    ids = []
+    for i in range(0, len(wsns), MAX_WSN_IN):
+        where = make_wsn_where_clause(wsns[i : i + MAX_WSN_IN])
+        id_sql = recipe["identifier"].replace(PURR_WHERE, where)
+        logger.debug(id_sql)
+        ids.extend(fetch_id_list(conn, id_sql))
+    return ids
+
+
+def load_recipe(asset: str) -> Dict[str, Any]:
+    """Import the recipe dict for an asset type from the recipes directory
+
+    Args:
+        asset (str): An asset (i.e. datatype) such as "well" or "vector_log"
+
+    Returns:
+        Dict[str, Any]: The asset recipe
+    """
+    recipe_path = Path(Path(__file__).resolve().parent, f"recipes/{asset}.py")
+    return import_dict_from_file(recipe_path, "recipe")
+
+
+def splits_groups(recipe: Dict[str, Any]) -> bool:
+    """Compound-key recipes that aggregate by wsn can chunk by id count
+    alone, carrying a well's rows between chunks (see GroupCarry), rather
+    than keeping every well's ids in one (possibly huge) chunk."""
+    return bool(recipe.get("post_process")) and len(recipe["identifier_keys"]) > 1
+
+
+def prepare_selectors(args: Dict[str, Any]) -> List[str]:
+    """Run the recipe identifier query and build chunked selector SQL.
+
+    UWI filters are resolved to wsns with the local well index when possible,
+    and area filters always are. A wsn-keyed recipe whose wsns fit in one
+    chunk skips the identifier query altogether; otherwise the identifier
+    query filters on those wsns rather than on UWI patterns.
+
+    Args:
+        args (Dict[str, Any]): collection args (recipe, conn, uwi_list...)
+
+    Returns:
+        List[str]: One selector SQL statement per chunk of ids
+    """
     conn_params = args["conn"]
     recipe = args["recipe"]
-    out_file = args["out_file"]
-    xforms = recipe["xforms"]
+    tracker = args.setdefault("tracker", ProgressTracker())
+
+    tracker.stage("identify")
 
     # control memory usage by the number of "ids" in the where clause
     chunk_size = recipe["chunk_size"] if "chunk_size" in recipe else 1000
 
-    where = make_where_clause(args["uwi_list"])
+    uwi_list = args["uwi_list"]
+    area = args.get("area")
+
+    ids = None
+    wsns = None
+    if uwi_list or area is not None:
+        # a spatial filter has no DBISAM equivalent, so (re)build the index
+        wsns = local_wsns(
+            args["repo_id"],
+            args.get("fs_path"),
+            uwi_list,
+            area,
+            conn_params if area is not None else None,
+        )
+        if wsns is None and area is not None:
+            raise ValueError(
+                f"no well index for {args['repo_id']}; cannot filter by area"
+            )
+    if wsns is not None:
+        logger.debug(f"local well index resolved {len(wsns)} wsns")
+        wsn_keyed = recipe["identifier_keys"] == ["w.wsn"]
+        if not wsns or (wsn_keyed and len(wsns) <= chunk_size):
+            ids = wsns
+        elif area is not None or len(wsns) <= MAX_WSN_IN:
+            ids = fetch_ids_for_wsns(conn_params, recipe, wsns)
+
+    if ids is None:
+        where = make_where_clause(uwi_list)
+
+        id_sql = recipe["identifier"].replace(PURR_WHERE, where)
+
+        logger.debug(id_sql)
+
+        ids = fetch_id_list(conn_params, id_sql)
 
-    id_sql = recipe["identifier"].replace(PURR_WHERE, where)
+    logger.debug(ids)
 
-    logger.debug(id_sql)
+    chunked_ids = chunk_ids(
+        ids, chunk_size, args.get("first_chunk_size"), splits_groups(recipe)
+    )
 
-    ids = fetch_id_list(conn_params, id_sql)
+    tracker.plan(len(chunked_ids), len(ids))
 
-    logger.debug(ids)
+    return create_selectors(chunked_ids, recipe)
 
-    chunked_ids = chunk_ids(ids, chunk_size)
 
-    if len(chunked_ids) == 0:
-        msg = "Query returned zero hits"
-        logger.info(msg)
-        return msg
+def iter_fetched_chunks(
+    args: Dict[str, Any], selectors: List[str]
+) -> Iterator[pd.DataFrame]:
+    """Execute each selector and yield its rows as fetched (see build_frame).
 
-    selectors = create_selectors(chunked_ids, recipe)
+    When chunks split a well's rows (see splits_groups), each chunk's last
+    well is carried over to the next, so every yielded chunk holds whole
+    wells. An empty frame is yielded for chunks that produce no rows, so
+    callers can count every chunk.
 
-    all_columns = set()
+    Args:
+        args (Dict[str, Any]): collection args (recipe, conn, uwi_list...)
+        selectors (List[str]): selector SQL from prepare_selectors
 
-    docs_written = 0
+    Yields:
+        pd.DataFrame: typed rows from a single chunk
+    """
+    conn_params = args["conn"]
+    recipe = args["recipe"]
+    tracker = args.setdefault("tracker", ProgressTracker())
+
+    tracker.stage("collect")
+
+    carry = GroupCarry() if splits_groups(recipe) else None
+
+    for i, q in enumerate(selectors):
+        raise_if_cancelled(args.get("task_id"))
+
+        logger.debug(q)
+
+        # pylint: disable=c-extension-no-member
+        with pyodbc.connect(**conn_params) as conn:
+            cursor = conn.cursor()
+            cursor.execute(q)
+
+            df = build_frame(
+                args.get("asset", "unknown"),
+                [col[0] for col in cursor.description],
+                [col[1] for col in cursor.description],
+                cursor.fetchall(),
+                recipe.get("columns"),
+                recipe["xforms"],
+            )
+
+        tracker.fetched(len(df))
+
+        # useful for diagnostics:
+        # duplicates = df[df.duplicated(subset=["w_uwi"])]
+
+        if carry is not None:
+            df = carry.feed(df, final=i == len(selectors) - 1)
 
-    with open(out_file, "w", encoding="utf-8") as f:
-        f.write("[")  # Start of JSON array
+        yield df
 
-        for q in selectors:
-            logger.debug(q)
 
-            # pylint: disable=c-extension-no-member
-            with pyodbc.connect(**conn_params) as conn:
-                cursor = conn.cursor()
-                cursor.execute(q)
+def iter_frame_chunks(
+    args: Dict[str, Any], selectors: List[str]
+) -> Iterator[pd.DataFrame]:
+    """Execute each selector and yield its formatted, post-processed rows.
 
-                column_names, column_types = get_column_info(cursor)
+    Nothing beyond the current chunk (plus the rows of one well carried over
+    from the previous chunk, see GroupCarry) is held in memory, so callers may
+    write (or stream) each chunk before the next query is run. An empty frame
+    is yielded for chunks that produce no rows, so callers can count every
+    chunk.
 
-                df = pd.DataFrame(
-                    [tuple(row) for row in cursor.fetchall()], columns=column_names
-                )
+    Args:
+        args (Dict[str, Any]): collection args (recipe, conn, uwi_list...)
+        selectors (List[str]): selector SQL from prepare_selectors
+
+    Yields:
+        pd.DataFrame: rows from a single chunk
+    """
+    for df in iter_fetched_chunks(args, selectors):
+        if df.empty:
+            yield df
+            continue
+
+        yield transform_frame(
+            df, args["recipe"], args.get("curve_window"), args.get("sidecar")
+        )
+
+
+def iter_doc_chunks(
+    args: Dict[str, Any], selectors: List[str]
+) -> Iterator[List[Dict[str, Any]]]:
+    """Execute each selector and yield its chunk of assembled JSON docs. An
+    empty list is yielded for chunks that produce no docs (see
+    iter_frame_chunks).
+
+    Args:
+        args (Dict[str, Any]): collection args (recipe, conn, uwi_list...)
+        selectors (List[str]): selector SQL from prepare_selectors
+
+    Yields:
+        List[Dict[str, Any]]: docs assembled from a single chunk
+    """
+    for df in iter_frame_chunks(args, selectors):
+        if df.empty:
+            yield []
+            continue
+
+        # transform this chunk by table prefixes
+        json_data = transform_dataframe_to_json(df, args["recipe"]["prefixes"])
+
+        logger.info(f"assembled {len(json_data)} docs")
+
+        yield json_data
+
+
+def iter_json_chunks(
+    args: Dict[str, Any], selectors: List[str]
+) -> Iterator[List[str]]:
+    """Execute each selector and yield its docs serialized to JSON strings.
 
-                # useful for diagnostics:
-                # duplicates = df[df.duplicated(subset=["w_uwi"])]
+    With a transform pool (see transform_pool), chunks are transformed in
+    worker processes while the next chunks are queried, up to
+    TRANSFORM_PROCS chunks ahead; docs still come out in chunk order.
+    Sidecar exports are transformed here (see iter_doc_chunks).
 
-                df = standardize_df_columns(df, column_types)
+    Args:
+        args (Dict[str, Any]): collection args (recipe, conn, uwi_list...)
+        selectors (List[str]): selector SQL from prepare_selectors
 
-                if not df.empty:
-                    all_columns.update(df.columns)
+    Yields:
+        List[str]: JSON docs from a single chunk
+    """
+    executor = transform_pool() if args.get("sidecar") is None else None
+    if executor is None:
+        for json_data in iter_doc_chunks(args, selectors):
+            yield [json.dumps(json_obj, default=str) for json_obj in json_data]
+        return
 
-                    for col in df.columns:
-                        col_type = str(df.dtypes[col])
+    recipe = args["recipe"]
+    window = args.get("curve_window")
+    pending: Deque[Future] = deque()
+    try:
+        for df in iter_fetched_chunks(args, selectors):
+            pending.append(submit_chunk(executor, df, recipe, window))
+            while pending and (len(pending) > TRANSFORM_PROCS or pending[0].done()):
+                json_data = pending.popleft().result()
+                logger.info(f"assembled {len(json_data)} docs")
+                yield json_data
+        while pending:
+            json_data = pending.popleft().result()
+            logger.info(f"assembled {len(json_data)} docs")
+            yield json_data
+    finally:
+        for future in pending:
+            future.cancel()
 
-                        xform = xforms.get(col, col_type)
 
-                        formatter = formatters.get(xform, lambda x: x)
+def collect_and_assemble_docs(args: Dict[str, Any]):
+    """Collect docs chunk by chunk and write them to a JSON array file.
 
-                        # pylint: disable=cell-var-from-loop
-                        df[col] = df[col].apply(formatter)
+    If use_sidecar is set and the recipe lists sidecar columns, those values
+    go to a .bin file alongside out_file (see SidecarWriter).
 
-                    df = df.replace({np.nan: None})
+    Cancellation is checked between chunks; a cancelled export deletes its
+    partial out_file (and sidecar) before re-raising TaskCancelled.
+    """
+    out_file = Path(args["out_file"])
+    sidecar_file = None
+    if args.get("use_sidecar") and args["recipe"].get("sidecar"):
+        sidecar_file = out_file.with_suffix(".bin")
+    tracker = args.setdefault("tracker", ProgressTracker())
 
-                    if postproc := recipe.get("post_process"):
-                        post_processor = post_process[postproc]
-                        if post_processor:
-                            logger.info(f"post-processing: {postproc}")
-                            df = post_processor(df)
+    selectors = prepare_selectors(args)
 
-                    # transform this chunk by table prefixes
-                    json_data = transform_dataframe_to_json(df, recipe["prefixes"])
+    raise_if_cancelled(args.get("task_id"))
 
-                    logger.info(f"assembled {len(json_data)} docs")
+    if len(selectors) == 0:
+        tracker.stage("done")
+        msg = "Query returned zero hits"
+        logger.info(msg)
+        return msg
 
-                    for json_obj in json_data:
-                        json_str = json.dumps(json_obj, default=str)
-                        f.write(json_str + ",")
-                        docs_written += 1
+    docs_written = 0
 
-        f.seek(f.tell() - 1, 0)  # Remove the last comma
-        f.write("]")
+    try:
+        with open(out_file, "w", encoding="utf-8") as f, (
+            SidecarWriter(sidecar_file) if sidecar_file else nullcontext()
+        ) as sidecar:
+            args["sidecar"] = sidecar
+            f.write("[")  # Start of JSON array
+
+            for json_data in iter_json_chunks(args, selectors):
+                for json_obj in json_data:
+                    if docs_written > 0:
+                        f.write(",")
+                    f.write(json_obj)
+                    docs_written += 1
+                tracker.chunk_done(len(json_data), f.tell())
+
+            f.write("]")
+    except TaskCancelled:
+        out_file.unlink(missing_ok=True)
+        if sidecar_file:
+            sidecar_file.unlink(missing_ok=True)
+        logger.info(f"cancelled; removed partial export: {out_file}")
+        raise
+
+    tracker.stage("done")
 
     end_msg = f"json docs written: {docs_written}"
     logger.info(end_msg)
-    return {"message": end_msg, "out_file": out_file}
+    result = {"message": end_msg, "out_file": str(out_file)}
+    if sidecar_file:
+        result["sidecar_file"] = str(sidecar_file)
+    return result
+
+
+def collect_las_files(args: Dict[str, Any]):
+    """Collect vector_log curves chunk by chunk and write LAS 2.0 files, one
+    per well and LAS id, into the out_file directory (see write_well_las).
+
+    Each chunk's wells are written by a pool of LAS_WRITERS threads while the
+    next chunk is queried. Cancellation is checked between chunks; a
+    cancelled export deletes its partial directory before re-raising
+    TaskCancelled.
+    """
+    out_dir = Path(args["out_file"])
+    tracker = args.setdefault("tracker", ProgressTracker())
+
+    selectors = prepare_selectors(args)
+
+    raise_if_cancelled(args.get("task_id"))
+
+    if len(selectors) == 0:
+        tracker.stage("done")
+        msg = "Query returned zero hits"
+        logger.info(msg)
+        return msg
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    files_written = 0
+
+    def finish(pending: List[Future]) -> None:
+        nonlocal files_written
+        written = sum(len(future.result()) for future in pending)
+        files_written += written
+        tracker.chunk_done(written)
+
+    try:
+        with ThreadPoolExecutor(max_workers=LAS_WRITERS) as pool:
+            pending: Optional[List[Future]] = None
+            for df in iter_frame_chunks(args, selectors):
+                if pending is not None:
+                    finish(pending)
+                pending = [
+                    pool.submit(write_well_las, row, out_dir)
+                    for row in df.to_dict("records")
+                ]
+            if pending is not None:
+                finish(pending)
+    except TaskCancelled:
+        shutil.rmtree(out_dir, ignore_errors=True)
+        logger.info(f"cancelled; removed partial export: {out_dir}")
+        raise
+
+    tracker.stage("done")
+
+    end_msg = f"las files written: {files_written}"
+    logger.info(end_msg)
+    return {"message": end_msg, "out_file": str(out_dir)}
+
+
+def stream_docs(
+    repo_id: str,
+    asset: str,
+    uwi_list: List[str],
+    area: Optional[BaseGeometry] = None,
+    curves: Optional[CurveWindow] = None,
+) -> Iterator[str]:
+    """Yield asset docs as newline-delimited JSON, one line per doc.
+
+    This is a plain (sync) generator; Starlette iterates it in a threadpool
+    so the blocking pyodbc calls do not stall the event loop. Only the
+    current chunk is ever materialized, and the first chunk is kept small
+    so the first docs arrive quickly.
+
+    Args:
+        repo_id (str): ID from a specific project
+        asset (str): An asset (i.e. datatype) to query from project database
+        uwi_list (List[str]): List of UWI strings
+        area (Optional[BaseGeometry]): Optional lon/lat bbox or polygon filter
+        curves (Optional[CurveWindow]): Optional depth window/resampling
+
+    Yields:
+        str: A JSON doc followed by a newline
+    """
+    db = next(get_db())
+    repo = get_repo_by_id(db, repo_id)
+    db.close()
+
+    if repo is None:
+        return
+
+    collection_args = {
+        "recipe": load_recipe(asset),
+        "asset": asset,
+        "repo_id": repo_id,
+        "conn": repo.conn,
+        "fs_path": repo.fs_path,
+        "uwi_list": uwi_list,
+        "area": area,
+        "curve_window": curves,
+        "first_chunk_size": STREAM_FIRST_CHUNK,
+    }
+
+    selectors = prepare_selectors(collection_args)
+
+    for json_data in iter_json_chunks(collection_args, selectors):
+        for json_obj in json_data:
+            yield json_obj + "\n"
 
 
 async def selector(
-    repo_id: str, asset: str, export_file: str, uwi_list: List[str]
+    repo_id: str,
+    asset: str,
+    export_file: str,
+    uwi_list: List[str],
+    task_id: Optional[str] = None,
+    tracker: Optional[ProgressTracker] = None,
+    area: Optional[BaseGeometry] = None,
+    sidecar: bool = False,
+    curves: Optional[CurveWindow] = None,
+    fmt: ExportFormat = ExportFormat.JSON,
 ) -> str:
     """Main entry point to collect data from a Petra project
 
@@ -172,6 +607,12 @@ async def selector(
         asset (str): An asset (i.e. datatype) to query from project database
         export_file (str): Export file name with timestamp
         uwi_list (str): List of UWI strings
+        task_id (Optional[str]): Task uuid, used to check for cancellation
+        tracker (Optional[ProgressTracker]): Reports progress to task status
+        area (Optional[BaseGeometry]): Optional lon/lat bbox or polygon filter
+        sidecar (bool): Write the recipe's sidecar columns to a binary .bin file
+        curves (Optional[CurveWindow]): Optional depth window/resampling
+        fmt (ExportFormat): json (one file) or las (a directory of LAS files)
 
     Returns:
         str: A summary of the selector job--probably from export_json()
@@ -190,17 +631,28 @@ async def selector(
 
     conn = repo.conn
 
-    recipe_path = Path(Path(__file__).resolve().parent, f"recipes/{asset}.py")
-    recipe = import_dict_from_file(recipe_path, "recipe")
+    recipe = load_recipe(asset)
 
     collection_args = {
         "recipe": recipe,
+        "asset": asset,
         "repo_id": repo_id,
         "conn": conn,
+        "fs_path": repo.fs_path,
         "uwi_list": uwi_list,
+        "area": area,
+        "use_sidecar": sidecar,
+        "curve_window": curves,
         "out_file": out_file,
+        "task_id": task_id,
+        "tracker": tracker or ProgressTracker(),
     }
 
+    if fmt == ExportFormat.LAS:
+        collection_args["out_file"] = out_file.with_suffix("")
+        async_collect_las_files = async_wrap(collect_las_files)
+        return await async_collect_las_files(collection_args)
+
     async_collect_and_assemble_docs = async_wrap(collect_and_assemble_docs)
     result = await async_collect_and_assemble_docs(collection_args)
 
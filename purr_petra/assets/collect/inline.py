@@ -0,0 +1,166 @@
+"""Synchronous collection of a few wells (the /inline endpoint)
+
+Looking up a handful of wells should cost little more than the DBISAM query
+itself. Unlike an export, an inline query has no task, no identifier query
+(the wells' wsns, from the local well index, go straight into the selector),
+no DataFrame and no file in the depot: each fetched row is formatted a cell
+at a time with the same formatters, sentinel masking and post processing as
+a collection, so the docs are the same as an export's.
+
+The number of wells is capped by PURR_PETRA_INLINE_MAX_WELLS; curve windows
+(top, base, step) are not supported here.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Sequence
+import numpy as np
+import pyodbc
+from purr_petra.assets.collect.handle_query import load_recipe
+from purr_petra.assets.collect.post_process import agg_specs, flexible_agg_rows
+from purr_petra.assets.collect.schema import column_kind
+from purr_petra.assets.collect.sentinels import (
+    FLOAT_LIST_XFORMS,
+    is_sentinel,
+    recipe_sentinels,
+    sentinel_mask,
+)
+from purr_petra.assets.collect.sql_helper import make_wsn_where_clause
+from purr_petra.assets.collect.xformer import (
+    PURR_WHERE,
+    formatters,
+    series_row_to_json,
+)
+from purr_petra.core.logger import logger
+
+# most wells an inline query may resolve to
+INLINE_MAX_WELLS = int(os.environ.get("PURR_PETRA_INLINE_MAX_WELLS", "25"))
+
+# column kind -> the formatter for a typed column of that kind
+KIND_FORMATTERS = {"int": "Int64", "float": "float64", "str": "string"}
+
+
+@lru_cache(maxsize=None)
+def cached_recipe(asset: str) -> Dict[str, Any]:
+    """load_recipe, imported once per asset (treat it as read-only)"""
+    return load_recipe(asset)
+
+
+def scrub_list(values: Any, sentinels: np.ndarray) -> Any:
+    """Mask sentinels in one parsed float list (see scrub_list_column)"""
+    if not isinstance(values, list):
+        return values
+    return [None if is_sentinel(v, sentinels) else v for v in values]
+
+
+def cell_formatter(
+    name: str, kind: str, recipe: Dict[str, Any], sentinels: np.ndarray
+) -> Callable[[Any], Any]:
+    """The per-cell equivalent of transform_frame for one fetched column:
+    its formatter (by xform, else by kind), with sentinels masked in scalar
+    floats before formatting and in float lists after.
+
+    Args:
+        name (str): column name, from cursor.description
+        kind (str): the column's kind, as build_frame would type it
+        recipe (Dict[str, Any]): the asset recipe
+        sentinels (np.ndarray): from recipe_sentinels
+
+    Returns:
+        Callable[[Any], Any]: formats one fetched value
+    """
+    xform = recipe["xforms"].get(name, KIND_FORMATTERS.get(kind))
+    fmt = formatters.get(xform, lambda x: x)
+
+    if kind == "float" and name != recipe.get("curves", {}).get("nullval"):
+        return lambda x: fmt(None if is_sentinel(x, sentinels) else x)
+    if xform in FLOAT_LIST_XFORMS:
+        return lambda x: scrub_list(fmt(x), sentinels)
+    return fmt
+
+
+def scrub_digits(
+    row: Dict[str, Any], curves: Dict[str, str], sentinels: np.ndarray
+) -> None:
+    """Set a formatted row's null curve samples to NaN (see scrub_curve_digits)"""
+    digits = row.get(curves["digits"])
+    if not isinstance(digits, np.ndarray) or digits.size == 0:
+        return
+    nullval = row.get(curves["nullval"])
+    nullvals = None if nullval is None else np.float64(nullval)
+    mask = sentinel_mask(digits.astype(np.float64), sentinels, nullvals)
+    if mask.any():
+        row[curves["digits"]] = np.where(mask, np.nan, digits)
+
+
+def format_rows(
+    asset: str,
+    recipe: Dict[str, Any],
+    column_names: List[str],
+    column_types: List[type],
+    rows: List[Sequence[Any]],
+) -> List[Dict[str, Any]]:
+    """Format (and post-process) fetched rows without building a DataFrame
+
+    Args:
+        asset (str): The asset type, for drift warnings
+        recipe (Dict[str, Any]): the asset recipe
+        column_names (List[str]): from cursor.description
+        column_types (List[type]): Python types from cursor.description
+        rows (List[Sequence[Any]]): cursor.fetchall()
+
+    Returns:
+        List[Dict[str, Any]]: one dict per doc, as transform_frame's rows
+    """
+    sentinels = recipe_sentinels(recipe)
+    declared = recipe.get("columns") or {}
+    cells = [
+        cell_formatter(
+            name, column_kind(asset, name, py_type, declared)[0], recipe, sentinels
+        )
+        for name, py_type in zip(column_names, column_types)
+    ]
+    curves = recipe.get("curves")
+
+    formatted = []
+    for row in rows:
+        out = {name: fmt(v) for name, fmt, v in zip(column_names, cells, row)}
+        if curves:
+            scrub_digits(out, curves, sentinels)
+        formatted.append(out)
+
+    if postproc := recipe.get("post_process"):
+        formatted = flexible_agg_rows(formatted, *agg_specs[postproc])
+    return formatted
+
+
+def inline_json(conn: Dict[str, Any], asset: str, wsns: List[int]) -> str:
+    """Collect an asset for a few known wells and serialize it as a JSON array
+
+    Args:
+        conn (Dict[str, Any]): DBISAM connection params
+        asset (str): An asset (i.e. datatype) such as "well" or "vector_log"
+        wsns (List[int]): wsns resolved by local_wsns, at most INLINE_MAX_WELLS
+
+    Returns:
+        str: the docs, as from an export
+    """
+    if not wsns:
+        return "[]"
+
+    recipe = cached_recipe(asset)
+    sql = recipe["selector"].replace(PURR_WHERE, make_wsn_where_clause(wsns))
+    logger.debug(sql)
+
+    # pylint: disable=c-extension-no-member
+    with pyodbc.connect(**conn) as cn:
+        cursor = cn.cursor()
+        cursor.execute(sql)
+        column_names = [col[0] for col in cursor.description]
+        column_types = [col[1] for col in cursor.description]
+        rows = cursor.fetchall()
+
+    formatted = format_rows(asset, recipe, column_names, column_types, rows)
+    docs = [series_row_to_json(row, recipe["prefixes"]) for row in formatted]
+    return json.dumps(docs, default=str)
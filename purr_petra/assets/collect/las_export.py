@@ -0,0 +1,266 @@
+"""LAS 2.0 export of vector_log curves
+
+Works on post-processed vector_log rows (one row per well, with aligned lists
+of curves). Curves are grouped by LAS id (x_lasid), so each LAS file Petra
+imported comes back out as its own file, named <uwi>_<wsn>_<lasid>.las (the
+wsn keeps wells that share a UWI apart). Curves with no LAS id go to
+<uwi>_<wsn>.las, and a well with no UWI is named by its wsn alone.
+
+The stored LAS header (g_lashdr) is reused for its ~Version, ~Well, ~Parameter
+and ~Other sections; ~Curve and the data are rebuilt from the curves that were
+actually exported. STRT, STOP, STEP and NULL are rewritten to match the data.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from purr_petra.assets.collect.resample import DEFAULT_NULL, EPSILON
+from purr_petra.assets.collect.xformer import none_if_null
+
+# header sections carried over from g_lashdr (by first letter after ~)
+KEEP_SECTIONS = {"V", "W", "P", "O"}
+
+WELL_DEPTH_LINES = re.compile(r"^\s*(STRT|STOP|STEP|NULL)\s*\.", re.IGNORECASE)
+
+
+def safe_name(value: Any) -> str:
+    """Make a string usable as a LAS mnemonic or file name"""
+    return re.sub(r"[^A-Za-z0-9_\-]+", "_", str(value)).strip("_")
+
+
+def las_line(mnem: str, unit: str, value: Any, desc: str) -> str:
+    """Format a header line: MNEM.UNIT  VALUE : DESCRIPTION"""
+    value = "" if value is None else value
+    return f" {f'{mnem}.{unit}':<12} {value!s:<24} : {desc}"
+
+
+def header_sections(lashdr: Optional[str]) -> Dict[str, List[str]]:
+    """Split a stored LAS header into its ~sections, keeping only those in
+    KEEP_SECTIONS (keyed by first letter, e.g. "W")
+
+    Args:
+        lashdr (Optional[str]): decoded g_lashdr (see loglas_lashdr)
+
+    Returns:
+        Dict[str, List[str]]: section lines, including the ~ line itself
+    """
+    sections: Dict[str, List[str]] = {}
+    current = None
+    for line in (lashdr or "").splitlines():
+        if line.startswith("~"):
+            letter = line[1:2].upper()
+            current = letter if letter in KEEP_SECTIONS else None
+            if current is not None:
+                sections.setdefault(current, [line])
+            continue
+        if current is not None and line.strip():
+            sections[current].append(line)
+    return sections
+
+
+def depth_unit(well_lines: List[str]) -> str:
+    """The depth unit from the stored STRT line, defaulting to feet"""
+    for line in well_lines:
+        if m := re.match(r"^\s*STRT\s*\.(\S*)", line, re.IGNORECASE):
+            return m.group(1) or "F"
+    return "F"
+
+
+def curve_matrix(
+    curves: List[Dict[str, Any]], null: float
+) -> Tuple[np.ndarray, float, float]:
+    """Lay curves out on one depth index, built from their starts and steps
+
+    Curves that sit on the index (their start and step are multiples of the
+    finest step) are copied in by slice; any others are interpolated onto it.
+    Depths a curve does not cover are null.
+
+    Args:
+        curves (List[Dict[str, Any]]): digits, start, step and nullval
+        null (float): the file's NULL value
+
+    Returns:
+        Tuple[np.ndarray, float, float]: (depth + curve columns, start, step)
+    """
+    step = min(c["step"] for c in curves)
+    start = min(c["start"] for c in curves)
+    stop = max(c["start"] + c["step"] * (c["digits"].size - 1) for c in curves)
+    n = int(round((stop - start) / step)) + 1
+
+    matrix = np.full((n, len(curves) + 1), null, dtype=np.float64)
+    depths = start + step * np.arange(n)
+    matrix[:, 0] = depths
+
+    for j, c in enumerate(curves, start=1):
+        digits = c["digits"]
+        values = np.where(np.isnan(digits) | (digits == c["nullval"]), null, digits)
+        first, every = (c["start"] - start) / step, c["step"] / step
+        if abs(first - round(first)) < EPSILON and abs(every - round(every)) < EPSILON:
+            first, every = int(round(first)), int(round(every))
+            matrix[first : first + every * values.size : every, j] = values
+        else:
+            own = c["start"] + c["step"] * np.arange(values.size)
+            inside = (depths >= own[0] - EPSILON) & (depths <= own[-1] + EPSILON)
+            data = np.where(values == null, np.nan, values)
+            interp = np.interp(depths[inside], own, data)
+            matrix[inside, j] = np.where(np.isnan(interp), null, interp)
+
+    return matrix, start, step
+
+
+def build_las(
+    row: Dict[str, Any], curves: List[Dict[str, Any]], lashdr: Optional[str]
+) -> Tuple[str, np.ndarray]:
+    """Build the header text and data matrix for one LAS file
+
+    Args:
+        row (Dict[str, Any]): the well's post-processed vector_log row
+        curves (List[Dict[str, Any]]): this file's curves
+        lashdr (Optional[str]): stored LAS header, if any
+
+    Returns:
+        Tuple[str, np.ndarray]: (header through ~ASCII, data matrix)
+    """
+    sections = header_sections(lashdr)
+    null = DEFAULT_NULL
+    matrix, start, step = curve_matrix(curves, null)
+    stop = start + step * (len(matrix) - 1)
+
+    version = [
+        line
+        for line in sections.get("V", [])[1:]
+        if not re.match(r"^\s*(VERS|WRAP)\s*\.", line, re.IGNORECASE)
+    ]
+    lines = [
+        "~Version Information",
+        las_line("VERS", "", "2.0", "CWLS LOG ASCII STANDARD - VERSION 2.0"),
+        las_line("WRAP", "", "NO", "ONE LINE PER DEPTH STEP"),
+        *version,
+    ]
+
+    well = sections.get("W", [])[1:]
+    unit = depth_unit(well)
+    lines += [
+        "~Well Information",
+        las_line("STRT", unit, f"{start:.4f}", "START DEPTH"),
+        las_line("STOP", unit, f"{stop:.4f}", "STOP DEPTH"),
+        las_line("STEP", unit, f"{step:.4f}", "STEP"),
+        las_line("NULL", "", null, "NULL VALUE"),
+    ]
+    if well:
+        lines += [line for line in well if not WELL_DEPTH_LINES.match(line)]
+    else:
+        lines += [
+            las_line("COMP", "", row.get("w_operator"), "COMPANY"),
+            las_line("WELL", "", row.get("w_wellname"), "WELL"),
+            las_line("CNTY", "", row.get("w_county"), "COUNTY"),
+            las_line("STAT", "", row.get("w_state"), "STATE"),
+            las_line("UWI", "", row.get("w_uwi"), "UNIQUE WELL ID"),
+        ]
+
+    lines += ["~Curve Information", las_line("DEPT", unit, "", "DEPTH")]
+    seen: Dict[str, int] = {}
+    for c in curves:
+        mnem = safe_name(c["name"] or "CURVE") or "CURVE"
+        seen[mnem] = seen.get(mnem, 0) + 1
+        if seen[mnem] > 1:
+            mnem = f"{mnem}_{seen[mnem]}"
+        units = safe_name(c["units"] or "")
+        lines.append(las_line(mnem, units, "", c["desc"] or ""))
+
+    for letter in ("P", "O"):
+        lines += sections.get(letter, [])
+
+    lines.append("~ASCII")
+    return "\n".join(lines) + "\n", matrix
+
+
+def las_files(
+    row: Dict[str, Any],
+) -> Dict[Any, Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """Group a well's curves by LAS id
+
+    Args:
+        row (Dict[str, Any]): the well's post-processed vector_log row
+
+    Returns:
+        Dict[Any, Tuple[List[Dict[str, Any]], Optional[str]]]: lasid ->
+        (curves, lashdr)
+    """
+    names = [
+        "a_digits",
+        "a_start",
+        "a_stop",
+        "a_step",
+        "a_nullval",
+        "a_units",
+        "f_logname",
+        "f_units",
+        "f_desc",
+        "x_lasid",
+        "g_lashdr",
+    ]
+    size = len(row["a_digits"])
+    files: Dict[Any, Tuple[List[Dict[str, Any]], Optional[str]]] = {}
+
+    for values in zip(*(row.get(n) or [None] * size for n in names)):
+        c = {
+            n: v if n == "a_digits" else none_if_null(v)
+            for n, v in zip(names, values)
+        }
+        digits, start, step = c["a_digits"], c["a_start"], c["a_step"]
+        if not isinstance(digits, np.ndarray) or digits.size == 0 or start is None:
+            continue
+        if not step and digits.size > 1 and c["a_stop"] is not None:
+            step = (c["a_stop"] - start) / (digits.size - 1)
+        if not step or step < 0:
+            continue
+        curves, lashdr = files.get(c["x_lasid"], ([], None))
+        curves.append(
+            {
+                "digits": digits,
+                "start": start,
+                "step": step,
+                "nullval": DEFAULT_NULL if c["a_nullval"] is None else c["a_nullval"],
+                "name": c["f_logname"],
+                "units": c["f_units"] or c["a_units"],
+                "desc": c["f_desc"],
+            }
+        )
+        files[c["x_lasid"]] = (curves, lashdr or c["g_lashdr"])
+    return files
+
+
+def write_well_las(row: Dict[str, Any], out_dir: Path) -> List[str]:
+    """Write one LAS file per LAS id for a well
+
+    Args:
+        row (Dict[str, Any]): the well's post-processed vector_log row
+        out_dir (Path): directory to write to
+
+    Returns:
+        List[str]: the files written
+    """
+    # well fields come from typed columns: their nulls are NA/NaN, not None
+    row = {k: v if isinstance(v, list) else none_if_null(v) for k, v in row.items()}
+    uwi, wsn = safe_name(row.get("w_uwi") or ""), safe_name(row["w_wsn"])
+    well_name = f"{uwi}_{wsn}" if uwi else wsn
+    written = []
+    for lasid, (curves, lashdr) in las_files(row).items():
+        header, matrix = build_las(row, curves, lashdr)
+        suffix = "" if lasid is None else f"_{safe_name(lasid)}"
+        path = out_dir / f"{well_name}{suffix}.las"
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            f.write(header)
+            pd.DataFrame(matrix).to_csv(
+                f,
+                sep=" ",
+                header=False,
+                index=False,
+                float_format="%.10g",
+                lineterminator="\n",
+            )
+        written.append(str(path))
+    return written
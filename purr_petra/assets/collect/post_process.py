@@ -1,5 +1,6 @@
+import numpy as np
 import pandas as pd
-from typing import Any, List
+from typing import Any, Dict, List
 
 pd.set_option("display.max_colwidth", None)
 pd.set_option("display.max_rows", None)
@@ -10,86 +11,186 @@ def preserve_empty_lists(values: List[Any]) -> List[Any]:
     return [sublist if sublist is not None else [] for sublist in values]
 
 
+def group_bounds(keys: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find groups with a single stable argsort instead of a groupby.
+
+    Rows with a null key are dropped (as groupby does). Rows keep their
+    original order within each group.
+
+    Returns:
+        tuple: (row order, group start offsets within that order, group keys)
+    """
+    valid = np.flatnonzero(keys.notna().to_numpy())
+    key_values = keys.to_numpy()[valid]
+    order = np.argsort(key_values, kind="stable")
+    sorted_keys = key_values[order]
+    is_start = np.ones(len(sorted_keys), dtype=bool)
+    is_start[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    starts = np.flatnonzero(is_start)
+    return valid[order], starts, sorted_keys[starts]
+
+
 def flexible_agg(
     df: pd.DataFrame, prefix_list: List[str], empty_list_cols: List[str] = []
 ) -> pd.DataFrame:
+    """Collapse child rows to one row per w_wsn: prefixed (child) columns
+    become lists, everything else takes the first non-null value.
+
+    Equivalent to groupby("w_wsn", as_index=False).agg(...) with list,
+    preserve_empty_lists and "first", but the groups come from one argsort
+    and each column is split at the group boundaries, rather than pandas
+    calling a Python function per group.
+    """
+
     def starts_with_any(col: str, prefixes: List[str]) -> bool:
         return any(col.startswith(prefix) for prefix in prefixes)
 
     agg_columns = [col for col in df.columns if starts_with_any(col, prefix_list)]
+    other_columns = [
+        col for col in df.columns if col not in agg_columns and col != "w_wsn"
+    ]
+
+    order, starts, group_keys = group_bounds(df["w_wsn"])
+    if len(order) == 0:
+        empty = df.iloc[:0][["w_wsn", *agg_columns, *other_columns]]
+        return empty.reset_index(drop=True)
+    ends = np.append(starts[1:], len(order))
+    spans = list(zip(starts.tolist(), ends.tolist()))
+
+    result: dict[str, Any] = {
+        "w_wsn": pd.Series(group_keys, dtype=df["w_wsn"].dtype)
+    }
 
-    agg_dict: dict[str, Any] = {}
     for col in agg_columns:
+        values = df[col].take(order).tolist()
         if col in empty_list_cols:
-            agg_dict[col] = preserve_empty_lists
-        else:
-            agg_dict[col] = list
+            values = preserve_empty_lists(values)
+        result[col] = pd.Series([values[a:b] for a, b in spans], dtype=object)
 
-    other_columns = [
-        col for col in df.columns if col not in agg_columns and col != "w_wsn"
-    ]
     for col in other_columns:
-        agg_dict[col] = "first"
-
-    return df.groupby("w_wsn", as_index=False).agg(agg_dict)
+        values = df[col].take(order)
+        # offset of the first non-null row in each group (or past its end)
+        n = len(order)
+        positions = np.where(values.notna().to_numpy(), np.arange(n), n)
+        firsts = np.minimum.reduceat(positions, starts)
+        found = firsts < ends
+        picked = values.iloc[np.where(found, firsts, starts)].reset_index(drop=True)
+        result[col] = picked.where(found, None) if not found.all() else picked
+
+    return pd.DataFrame(result)
+
+
+def flexible_agg_rows(
+    rows: List[Dict[str, Any]],
+    prefix_list: List[str],
+    empty_list_cols: List[str] = [],
+) -> List[Dict[str, Any]]:
+    """flexible_agg for a few rows held as dicts (see inline): the same
+    groups, in the same (wsn) order, with the same columns."""
+
+    def is_null(value: Any) -> bool:
+        return value is None or (isinstance(value, float) and value != value)
+
+    columns = list(rows[0]) if rows else ["w_wsn"]
+    agg_columns = [c for c in columns if any(c.startswith(p) for p in prefix_list)]
+    other_columns = [c for c in columns if c not in agg_columns and c != "w_wsn"]
+
+    groups: Dict[Any, List[Dict[str, Any]]] = {}
+    for row in rows:
+        if not is_null(row["w_wsn"]):
+            groups.setdefault(row["w_wsn"], []).append(row)
+
+    result = []
+    for wsn in sorted(groups):
+        group = groups[wsn]
+        out = {"w_wsn": wsn}
+        for col in agg_columns:
+            values = [row[col] for row in group]
+            if col in empty_list_cols:
+                values = preserve_empty_lists(values)
+            out[col] = values
+        for col in other_columns:
+            out[col] = next((r[col] for r in group if not is_null(r[col])), None)
+        result.append(out)
+    return result
+
+
+class GroupCarry:
+    """Holds back each chunk's last wsn group until the next chunk arrives.
+
+    When chunks are cut by row count (chunk_ids with split_groups), a well's
+    rows may span two or more chunks. Chunks arrive in wsn order, so only the
+    highest wsn in a chunk can be incomplete: those rows are carried into the
+    next chunk, and everything before them is safe to aggregate.
+    """
+
+    def __init__(self):
+        self.pending = None
+
+    def feed(self, df: pd.DataFrame, final: bool = False) -> pd.DataFrame:
+        """Prepend carried rows to this chunk and hold back its last group
+
+        Args:
+            df (pd.DataFrame): A chunk of rows, not yet aggregated
+            final (bool): True for the last chunk; nothing is held back
+
+        Returns:
+            pd.DataFrame: Rows whose wsn groups are complete
+        """
+        if self.pending is not None:
+            df = pd.concat([self.pending, df], ignore_index=True)
+            self.pending = None
+        if final or df.empty:
+            return df
+        last = df["w_wsn"] == df["w_wsn"].max()
+        self.pending = df[last]
+        return df[~last].reset_index(drop=True)
+
+
+# prefixes each post processor collapses into lists, and the columns among
+# them whose nulls become empty lists
+agg_specs = {
+    "dst_agg": (["f_"], ["f_recov"]),
+    "formation_agg": (["f_", "z_", "t_"], []),
+    "ip_agg": (["p_"], ["p_treat"]),
+    "perforation_agg": (["p_"], []),
+    "production_agg": (["a_"], []),
+    "raster_log_agg": (["i_", "g_"], []),
+    "vector_log_agg": (["a_", "f_", "x_", "g_"], []),
+    "zone_agg": (["n_", "f_", "z_"], []),
+}
 
 
 def dst_agg(df: pd.DataFrame) -> pd.DataFrame:
-    return flexible_agg(
-        df,
-        prefix_list=["f_"],
-        empty_list_cols=["f_recov"],
-    )
+    return flexible_agg(df, *agg_specs["dst_agg"])
 
 
 def formation_agg(df: pd.DataFrame) -> pd.DataFrame:
-    return flexible_agg(
-        df,
-        prefix_list=["f_", "z_", "t_"],
-    )
+    return flexible_agg(df, *agg_specs["formation_agg"])
 
 
 def ip_agg(df: pd.DataFrame) -> pd.DataFrame:
-    return flexible_agg(
-        df,
-        prefix_list=["p_"],
-        empty_list_cols=["p_treat"],
-    )
+    return flexible_agg(df, *agg_specs["ip_agg"])
 
 
 def perforation_agg(df: pd.DataFrame) -> pd.DataFrame:
-    return flexible_agg(
-        df,
-        prefix_list=["p_"],
-    )
+    return flexible_agg(df, *agg_specs["perforation_agg"])
 
 
 def production_agg(df: pd.DataFrame) -> pd.DataFrame:
-    return flexible_agg(
-        df,
-        prefix_list=["a_"],
-    )
+    return flexible_agg(df, *agg_specs["production_agg"])
 
 
 def raster_log_agg(df: pd.DataFrame) -> pd.DataFrame:
-    return flexible_agg(
-        df,
-        prefix_list=["i_", "g_"],
-    )
+    return flexible_agg(df, *agg_specs["raster_log_agg"])
 
 
 def vector_log_agg(df: pd.DataFrame) -> pd.DataFrame:
-    return flexible_agg(
-        df,
-        prefix_list=["a_", "f_", "x_", "g_"],
-    )
+    return flexible_agg(df, *agg_specs["vector_log_agg"])
 
 
 def zone_agg(df: pd.DataFrame) -> pd.DataFrame:
-    return flexible_agg(
-        df,
-        prefix_list=["n_", "f_", "z_"],
-    )
+    return flexible_agg(df, *agg_specs["zone_agg"])
 
 
 post_process = {
@@ -1,5 +1,6 @@
 """Petra core"""
 
+from purr_petra.assets.collect.schema import LOCAT_COLUMNS, UWI_COLUMNS, WELL_COLUMNS
 from purr_petra.assets.collect.xformer import PURR_DELIM, PURR_NULL, PURR_WHERE
 
 identifier_keys = ["w.wsn"]
@@ -86,5 +87,23 @@ recipe = {
         "c_desc": "array_of_string",
         "c_remark": "array_of_string",
     },
+    "columns": {
+        **WELL_COLUMNS,
+        **LOCAT_COLUMNS,
+        **UWI_COLUMNS,
+        "c_recid": "str",
+        "c_wsn": "str",
+        "c_flags": "str",
+        "c_lithcode": "str",
+        "c_date": "str",
+        "c_top": "str",
+        "c_base": "str",
+        "c_recover": "str",
+        "c_type": "str",
+        "c_qual": "str",
+        "c_fmname": "str",
+        "c_desc": "str",
+        "c_remark": "str",
+    },
     "chunk_size": 1000,
 }
@@ -1,5 +1,6 @@
 """Petra dst"""
 
+from purr_petra.assets.collect.schema import LOCAT_COLUMNS, UWI_COLUMNS, WELL_COLUMNS
 from purr_petra.assets.collect.xformer import PURR_DELIM, PURR_NULL, PURR_WHERE
 
 identifier_keys = ["w.wsn", "f.recid"]
@@ -89,6 +90,38 @@ recipe = {
         "f_mts": "memo_to_string",
         "f_chgdate": "excel_date",
     },
+    "columns": {
+        **WELL_COLUMNS,
+        **LOCAT_COLUMNS,
+        **UWI_COLUMNS,
+        "f_recid": "int",
+        "f_wsn": "int",
+        "f_numrecov": "int",
+        "f_nummts": "int",
+        "f_flags": "int",
+        "f_date": "float",
+        "f_top": "float",
+        "f_base": "float",
+        "f_ihp": "float",
+        "f_fhp": "float",
+        "f_ffp": "float",
+        "f_isp": "float",
+        "f_fsp": "float",
+        "f_bht": "float",
+        "f_bhp": "float",
+        "f_choke": "str",
+        "f_cushamt": "float",
+        "f_testtype": "str",
+        "f_fmname": "str",
+        "f_cushtype": "str",
+        "f_ohtime": "float",
+        "f_sitime": "float",
+        "f_remark": "str",
+        "f_recov": "bytes",
+        "f_mts": "str",
+        "f_chgdate": "float",
+        "f_unitstype": "int",
+    },
     "post_process": "dst_agg",
     "chunk_size": 5000,
 }
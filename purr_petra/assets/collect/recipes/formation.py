@@ -1,5 +1,6 @@
 """Petra formation"""
 
+from purr_petra.assets.collect.schema import LOCAT_COLUMNS, WELL_COLUMNS
 from purr_petra.assets.collect.xformer import PURR_WHERE
 
 identifier_keys = ["w.wsn", "f.fid"]
@@ -113,6 +114,47 @@ recipe = {
         "t_chgdate": "excel_date",
         "t_data": "parse_zztops",
     },
+    "columns": {
+        **WELL_COLUMNS,
+        **LOCAT_COLUMNS,
+        "f_fid": "int",
+        "f_zid": "int",
+        "f_name": "str",
+        "f_source": "str",
+        "f_desc": "str",
+        "f_units": "str",
+        "f_kind": "str",
+        "f_ndec": "int",
+        "f_adddate": "float",
+        "f_chgdate": "float",
+        "f_remarks": "str",
+        "f_flags": "int",
+        "f_unitstype": "int",
+        "z_fid": "int",
+        "z_wsn": "int",
+        "z_zid": "int",
+        "z_z": "float",
+        "z_postdepth": "float",
+        "z_quality": "str",
+        "z_symbol": "int",
+        "z_chgdate": "float",
+        "z_textlen": "int",
+        "z_text": "str",
+        "z_datalen": "int",
+        "z_data": "bytes",
+        "t_recid": "int",
+        "t_wsn": "int",
+        "t_fid": "int",
+        "t_flags": "int",
+        "t_symbol": "int",
+        "t_iunits": "int",
+        "t_npts": "int",
+        "t_datasize": "int",
+        "t_adddate": "float",
+        "t_chgdate": "float",
+        "t_data": "bytes",
+        "t_remarks": "str",
+    },
     "post_process": "formation_agg",
     "chunk_size": 1000,
 }
@@ -1,5 +1,6 @@
 """Petra ip"""
 
+from purr_petra.assets.collect.schema import LOCAT_COLUMNS, UWI_COLUMNS, WELL_COLUMNS
 from purr_petra.assets.collect.xformer import PURR_WHERE
 
 identifier_keys = ["w.wsn", "p.recid"]
@@ -92,6 +93,42 @@ recipe = {
         "p_treat": "pdtest_treatment",
         "p_chgdate": "excel_date",
     },
+    "columns": {
+        **WELL_COLUMNS,
+        **LOCAT_COLUMNS,
+        **UWI_COLUMNS,
+        "p_recid": "int",
+        "p_wsn": "int",
+        "p_numtreat": "int",
+        "p_flags": "int",
+        "p_date": "float",
+        "p_top": "float",
+        "p_base": "float",
+        "p_oilvol": "float",
+        "p_gasvol": "float",
+        "p_wtrvol": "float",
+        "p_ftp": "float",
+        "p_fcp": "float",
+        "p_stp": "float",
+        "p_scp": "float",
+        "p_bht": "float",
+        "p_bhp": "float",
+        "p_choke": "str",
+        "p_duration": "float",
+        "p_caof": "float",
+        "p_oilgty": "float",
+        "p_gasgty": "float",
+        "p_gor": "float",
+        "p_testtype": "str",
+        "p_fmname": "str",
+        "p_oilunit": "str",
+        "p_gasunit": "str",
+        "p_wtrunit": "str",
+        "p_remark": "str",
+        "p_treat": "bytes",
+        "p_chgdate": "float",
+        "p_unitstype": "int",
+    },
     "post_process": "ip_agg",
     "chunk_size": 1000,
 }
@@ -7,6 +7,7 @@ completion may even be indicated by the API number's last 4 digits:
 maybe in 11th position like 0100 if it's a horizontal well"
 """
 
+from purr_petra.assets.collect.schema import LOCAT_COLUMNS, UWI_COLUMNS, WELL_COLUMNS
 from purr_petra.assets.collect.xformer import PURR_WHERE
 
 identifier_keys = ["w.wsn", "p.recid"]
@@ -84,6 +85,27 @@ recipe = {
         "p_remark": "memo_to_string",
         "p_chgdate": "excel_date",
     },
+    "columns": {
+        **WELL_COLUMNS,
+        **LOCAT_COLUMNS,
+        **UWI_COLUMNS,
+        "p_recid": "int",
+        "p_wsn": "int",
+        "p_flags": "int",
+        "p_date": "float",
+        "p_enddate": "float",
+        "p_top": "float",
+        "p_base": "float",
+        "p_diameter": "float",
+        "p_numshots": "int",
+        "p_method": "str",
+        "p_comptype": "str",
+        "p_perftype": "str",
+        "p_remark": "str",
+        "p_fmname": "str",
+        "p_chgdate": "float",
+        "p_source": "str",
+    },
     "post_process": "perforation_agg",
     "chunk_size": 1000,
 }
@@ -1,5 +1,6 @@
 """Petra production"""
 
+from purr_petra.assets.collect.schema import LOCAT_COLUMNS, UWI_COLUMNS, WELL_COLUMNS
 from purr_petra.assets.collect.xformer import PURR_DELIM, PURR_NULL, PURR_WHERE
 
 # identifier_keys = ["w.wsn", "f.mid"]
@@ -129,6 +130,38 @@ recipe = {
         "a_dec": "array_of_float",
         "a_chgdate": "array_of_excel_date",
     },
+    "columns": {
+        **WELL_COLUMNS,
+        **LOCAT_COLUMNS,
+        **UWI_COLUMNS,
+        "f_mid": "int",
+        "f_name": "str",
+        "f_desc": "str",
+        "f_units": "str",
+        "f_flags": "int",
+        "f_nullvalue": "float",
+        "f_unitstype": "int",
+        "f_chgdate": "float",
+        "a_recid": "str",
+        "a_wsn": "str",
+        "a_mid": "str",
+        "a_year": "str",
+        "a_flags": "str",
+        "a_cum": "str",
+        "a_jan": "str",
+        "a_feb": "str",
+        "a_mar": "str",
+        "a_apr": "str",
+        "a_may": "str",
+        "a_jun": "str",
+        "a_jul": "str",
+        "a_aug": "str",
+        "a_sep": "str",
+        "a_oct": "str",
+        "a_nov": "str",
+        "a_dec": "str",
+        "a_chgdate": "str",
+    },
     "post_process": "production_agg",
     "chunk_size": 1000,
 }
@@ -1,5 +1,6 @@
 """Petra raster_log"""
 
+from purr_petra.assets.collect.schema import LOCAT_COLUMNS, UWI_COLUMNS, WELL_COLUMNS
 from purr_petra.assets.collect.xformer import PURR_WHERE
 
 identifier_keys = ["w.wsn", "i.ign"]
@@ -71,6 +72,21 @@ recipe = {
     "xforms": {
         "w_chgdate": "excel_date",
     },
+    "columns": {
+        **WELL_COLUMNS,
+        **LOCAT_COLUMNS,
+        **UWI_COLUMNS,
+        "i_wsn": "int",
+        "i_ign": "int",
+        "i_flags": "int",
+        "i_imagefilename": "str",
+        "i_calibfilename": "str",
+        "g_ign": "int",
+        "g_flags": "int",
+        "g_groupname": "str",
+        "g_desc": "str",
+        "g_path": "str",
+    },
     "post_process": "raster_log_agg",
     "chunk_size": 1000,
 }
@@ -1,5 +1,6 @@
 """Petra survey"""
 
+from purr_petra.assets.collect.schema import LOCAT_COLUMNS, UWI_COLUMNS
 from purr_petra.assets.collect.xformer import PURR_DELIM, PURR_NULL, PURR_WHERE
 
 identifier_keys = ["w.wsn"]
@@ -107,5 +108,46 @@ recipe = {
         "v_d2": "array_of_float",
         "v_d3": "array_of_float",
     },
+    "columns": {
+        **LOCAT_COLUMNS,
+        **UWI_COLUMNS,
+        "w_wsn": "int!",
+        "w_uwi": "str",
+        "d_survrecid": "int",
+        "d_wsn": "int",
+        "d_flags": "int",
+        "d_datasize": "int",
+        "d_active": "int",
+        "d_adddate": "float",
+        "d_chgdate": "float",
+        "d_numrecs": "int",
+        "d_md1": "float",
+        "d_md2": "float",
+        "d_tvd1": "float",
+        "d_tvd2": "float",
+        "d_xoff1": "float",
+        "d_xoff2": "float",
+        "d_yoff1": "float",
+        "d_yoff2": "float",
+        "d_xyunits": "str",
+        "d_depunits": "str",
+        "d_dippresent": "int",
+        "d_remarks": "str",
+        "d_vs_1": "float",
+        "d_vs_2": "float",
+        "d_vs_3": "float",
+        "f_survey_type": "str",
+        "v_wsn": "str",
+        "v_md": "str",
+        "v_tvd": "str",
+        "v_xoff": "str",
+        "v_yoff": "str",
+        "v_dip": "str",
+        "v_azm": "str",
+        "v_vsection": "str",
+        "v_d1": "str",
+        "v_d2": "str",
+        "v_d3": "str",
+    },
     "chunk_size": 1000,
 }
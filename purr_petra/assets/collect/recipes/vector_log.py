@@ -1,5 +1,6 @@
 """Petra vector_log"""
 
+from purr_petra.assets.collect.schema import LOCAT_COLUMNS, UWI_COLUMNS, WELL_COLUMNS
 from purr_petra.assets.collect.xformer import PURR_WHERE
 
 identifier_keys = ["w.wsn", "a.ldsn"]
@@ -118,6 +119,60 @@ recipe = {
         "g_chgdate": "excel_date",
         "g_lashdr": "loglas_lashdr",
     },
+    "columns": {
+        **WELL_COLUMNS,
+        **LOCAT_COLUMNS,
+        **UWI_COLUMNS,
+        "a_ldsn": "int",
+        "a_wsn": "int",
+        "a_lsn": "int",
+        "a_flags": "int",
+        "a_units": "str",
+        "a_elev_zid": "int",
+        "a_elev_fid": "int",
+        "a_numpts": "int",
+        "a_start": "float",
+        "a_stop": "float",
+        "a_step": "float",
+        "a_minval": "float",
+        "a_maxval": "float",
+        "a_mean": "float",
+        "a_stddev": "float",
+        "a_nullval": "float",
+        "a_source": "str",
+        "a_digits": "bytes",
+        "a_remarks": "str",
+        "f_lsn": "int",
+        "f_logname": "str",
+        "f_desc": "str",
+        "f_units": "str",
+        "f_servid": "str",
+        "f_remarks": "str",
+        "f_flags": "int",
+        "x_ldsn": "int",
+        "x_wsn": "int",
+        "x_lsn": "int",
+        "x_flags": "int",
+        "x_adddate": "float",
+        "x_chgdate": "float",
+        "x_lasid": "int",
+        "g_lasid": "int",
+        "g_wsn": "int",
+        "g_flags": "int",
+        "g_adddate": "float",
+        "g_chgdate": "float",
+        "g_hdrsize": "int",
+        "g_lashdr": "bytes",
+    },
+    "sidecar": ["a_digits", "g_lashdr"],
+    "curves": {
+        "digits": "a_digits",
+        "start": "a_start",
+        "stop": "a_stop",
+        "step": "a_step",
+        "nullval": "a_nullval",
+        "numpts": "a_numpts",
+    },
     "post_process": "vector_log_agg",
     "chunk_size": 1000,
 }
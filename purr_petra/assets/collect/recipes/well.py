@@ -1,5 +1,6 @@
 """Petra well"""
 
+from purr_petra.assets.collect.schema import LOCAT_COLUMNS, UWI_COLUMNS, WELL_COLUMNS
 from purr_petra.assets.collect.xformer import PURR_WHERE
 
 identifier_keys = ["w.wsn"]
@@ -193,5 +194,66 @@ recipe = {
         "z_last_act_date": "excel_date",
         "z_platform": "memo_to_string",
     },
+    "columns": {
+        **WELL_COLUMNS,
+        **LOCAT_COLUMNS,
+        **UWI_COLUMNS,
+        "w_flags": "int",
+        "w_adddate": "float",
+        "w_elev_zid": "int",
+        "w_elev_fid": "int",
+        "w_symbol": "int",
+        "w_label": "str",
+        "w_symcode": "str",
+        "w_histoper": "str",
+        "w_fieldname": "str",
+        "w_fmattd": "str",
+        "w_prodfm": "str",
+        "w_remarks": "str",
+        "s_wsn": "int",
+        "s_flags": "int",
+        "s_x": "float",
+        "s_y": "float",
+        "s_z": "float",
+        "s_botlat": "float",
+        "s_botlon": "float",
+        "s_botx": "float",
+        "s_boty": "float",
+        "s_congress": "bytes",
+        "s_texasloc": "bytes",
+        "s_offshore": "bytes",
+        "b_wsn": "int",
+        "b_flags": "int",
+        "b_x": "float",
+        "b_y": "float",
+        "b_z": "float",
+        "b_lat": "float",
+        "b_lon": "float",
+        "b_congress": "bytes",
+        "b_texasloc": "bytes",
+        "b_offshore": "bytes",
+        "b_chgdate": "float",
+        "z_elev_kb": "float",
+        "z_elev_df": "float",
+        "z_elev_gr": "float",
+        "z_elev_seis": "float",
+        "z_td": "float",
+        "z_cumoil": "float",
+        "z_cumgas": "float",
+        "z_cumwtr": "float",
+        "z_whipstock": "float",
+        "z_wtrdepth": "float",
+        "z_comp_date": "float",
+        "z_spud_date": "float",
+        "z_permit_date": "float",
+        "z_rig_date": "float",
+        "z_aband_date": "float",
+        "z_report_date": "float",
+        "z_wrs_date": "float",
+        "z_last_act_date": "float",
+        "z_platform": "str",
+        "z_active_datum_value": "float",
+        "f_active_datum": "str",
+    },
     "chunk_size": 1000,
 }
@@ -1,5 +1,6 @@
 """Petra zone"""
 
+from purr_petra.assets.collect.schema import LOCAT_COLUMNS, UWI_COLUMNS, WELL_COLUMNS
 from purr_petra.assets.collect.xformer import PURR_DELIM, PURR_NULL, PURR_WHERE
 
 identifier_keys = ["w.wsn", "n.zid"]
@@ -146,6 +147,51 @@ recipe = {
         "n_chgdate": "excel_date",
         "n_remarks": "memo_to_string",  # array_of_memo?
     },
+    "columns": {
+        **WELL_COLUMNS,
+        **LOCAT_COLUMNS,
+        **UWI_COLUMNS,
+        "n_zid": "int",
+        "n_name": "str",
+        "n_desc": "str",
+        "n_kind": "str",
+        "n_umode": "int",
+        "n_lmode": "int",
+        "n_utopid": "int",
+        "n_ltopid": "int",
+        "n_udepth": "float",
+        "n_ldepth": "float",
+        "n_uoffset": "float",
+        "n_loffset": "float",
+        "n_adddate": "float",
+        "n_chgdate": "float",
+        "n_remarks": "str",
+        "f_fid": "str",
+        "f_zid": "str",
+        "f_name": "str",
+        "f_source": "str",
+        "f_desc": "str",
+        "f_units": "str",
+        "f_kind": "str",
+        "f_ndec": "str",
+        "f_adddate": "str",
+        "f_chgdate": "str",
+        "f_remarks": "str",
+        "f_flags": "str",
+        "f_unitstype": "str",
+        "z_fid": "str",
+        "z_wsn": "str",
+        "z_zid": "str",
+        "z_z": "str",
+        "z_postdepth": "str",
+        "z_quality": "str",
+        "z_symbol": "str",
+        "z_chgdate": "str",
+        "z_textlen": "str",
+        "z_text": "str",
+        "z_datalen": "str",
+        "z_data": "str",
+    },
     "post_process": "zone_agg",
     "chunk_size": 1000,
 }
@@ -0,0 +1,143 @@
+"""Depth windowing and resampling of log curve digits (vector_log)
+
+Curves are regularly sampled: sample i is at depth start + i * step. A
+CurveWindow trims each curve to top/base and optionally resamples it to a
+new step, so only the requested samples are serialized. Null samples
+(a_nullval) never contribute to resampled values, and samples that cannot
+be computed come out as nullval.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from purr_petra.assets.collect.xformer import none_if_null
+from purr_petra.core.schemas import CurveWindow, ResampleMethod
+
+# LAS convention, used when a curve has no a_nullval of its own
+DEFAULT_NULL = -999.25
+
+# depth comparisons tolerate float noise in start/step
+EPSILON = 1e-6
+
+
+def resample_curve(
+    values: np.ndarray,
+    start: float,
+    step: float,
+    nullval: float,
+    window: CurveWindow,
+) -> Tuple[Optional[np.ndarray], Optional[float], Optional[float]]:
+    """Trim (and optionally resample) one curve
+
+    Args:
+        values (np.ndarray): curve samples, e.g. from logdata_digits
+        start (float): depth of the first sample
+        step (float): depth increment between samples
+        nullval (float): sample value meaning "no data"
+        window (CurveWindow): top, base, step and method
+
+    Returns:
+        Tuple: (new samples, new start, new step); samples are None if the
+        window does not overlap the curve
+    """
+    depths = start + step * np.arange(values.size)
+    lo = max(window.top, depths[0]) if window.top is not None else depths[0]
+    hi = min(window.base, depths[-1]) if window.base is not None else depths[-1]
+    if lo > hi + EPSILON:
+        return None, None, None
+
+    if window.step is None:
+        first = int(np.ceil((lo - start) / step - EPSILON))
+        last = int(np.floor((hi - start) / step + EPSILON))
+        return values[first : last + 1].copy(), start + first * step, step
+
+    data = np.where(values == nullval, np.nan, values)
+
+    if window.method == ResampleMethod.DECIMATE:
+        every = max(1, int(round(window.step / step)))
+        first = int(np.ceil((lo - start) / step - EPSILON))
+        last = int(np.floor((hi - start) / step + EPSILON))
+        out = data[first : last + 1 : every]
+        out = np.where(np.isnan(out), nullval, out)
+        return out, start + first * step, step * every
+
+    # new samples on multiples of the target step, e.g. 2 ft: 1000, 1002...
+    grid_start = np.ceil(lo / window.step - EPSILON) * window.step
+    grid = np.arange(grid_start, hi + EPSILON, window.step)
+    if grid.size == 0:
+        return None, None, None
+
+    if window.method == ResampleMethod.NEAREST:
+        idx = np.clip(np.rint((grid - start) / step).astype(int), 0, values.size - 1)
+        out = data[idx]
+    elif window.method == ResampleMethod.MEAN:
+        # average the samples within half a target step of each new depth
+        edges = np.searchsorted(depths, grid - window.step / 2 - EPSILON, "left")
+        ends = np.searchsorted(depths, grid + window.step / 2 - EPSILON, "left")
+        valid = ~np.isnan(data)
+        sums = np.concatenate(([0.0], np.cumsum(np.where(valid, data, 0.0))))
+        counts = np.concatenate(([0], np.cumsum(valid)))
+        n = counts[ends] - counts[edges]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = np.where(n > 0, (sums[ends] - sums[edges]) / n, np.nan)
+    else:
+        # linear: a null neighbour makes the interpolated sample null too
+        out = np.interp(grid, depths, data)
+
+    return np.where(np.isnan(out), nullval, out), float(grid[0]), window.step
+
+
+def resample_curves(
+    df: pd.DataFrame, cols: Dict[str, str], window: CurveWindow
+) -> pd.DataFrame:
+    """Apply a CurveWindow to every curve (row) of a formatted chunk
+
+    Args:
+        df (pd.DataFrame): formatted rows; digits are NumPy arrays
+        cols (Dict[str, str]): recipe "curves" column names for digits,
+            start, stop, step, nullval and numpts
+        window (CurveWindow): top, base, step and method
+
+    Returns:
+        pd.DataFrame: rows with trimmed digits and updated start, stop, step,
+        nullval and numpts
+    """
+    keys = ["digits", "start", "stop", "step", "nullval", "numpts"]
+    out: Dict[str, List[Any]] = {k: [] for k in keys}
+
+    for row in zip(*(df[cols[k]] for k in keys)):
+        curve = dict(zip(keys, row))
+        for k in keys[1:]:
+            # start, stop... are typed columns: nulls are NaN/NA, not None
+            curve[k] = none_if_null(curve[k])
+        digits, start, step = curve["digits"], curve["start"], curve["step"]
+
+        if not isinstance(digits, np.ndarray) or digits.size == 0 or start is None:
+            for k in keys:
+                out[k].append(curve[k])
+            continue
+
+        if not step and digits.size > 1 and curve["stop"] is not None:
+            step = (curve["stop"] - start) / (digits.size - 1)
+        if not step or step < 0:
+            # unknown or decreasing depths: leave the curve as it is
+            for k in keys:
+                out[k].append(curve[k])
+            continue
+
+        nullval = DEFAULT_NULL if curve["nullval"] is None else curve["nullval"]
+        values, new_start, new_step = resample_curve(
+            digits, start, step, nullval, window
+        )
+        size = 0 if values is None else values.size
+        out["digits"].append(values)
+        out["start"].append(new_start)
+        out["stop"].append(new_start + new_step * (size - 1) if size else None)
+        out["step"].append(new_step)
+        out["nullval"].append(nullval)
+        out["numpts"].append(size)
+
+    df = df.copy()
+    for k in keys:
+        df[cols[k]] = pd.Series(out[k], index=df.index, dtype=object)
+    return df
@@ -1,16 +1,53 @@
 """FastAPI Routing for Assets"""
 
 import asyncio
+import hashlib
+import json
 import uuid
-from typing import Dict, List, Optional
+from pathlib import Path as FilePath
+from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
-from fastapi import APIRouter, HTTPException, status, Query, Path
-from pydantic import BaseModel
-
-from purr_petra.assets.collect.handle_query import selector
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    status,
+    Query,
+    Path,
+    Response,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+from shapely import wkt
+from shapely.errors import ShapelyError
+from shapely.geometry import MultiPolygon, Polygon, box
+from shapely.geometry.base import BaseGeometry
+from sqlalchemy.orm import Session
+
+from purr_petra.assets.collect.handle_query import local_wsns, selector, stream_docs
+from purr_petra.assets.collect.inline import INLINE_MAX_WELLS, inline_json
 from purr_petra.core.database import get_db
 from purr_petra.core.crud import fetch_repo_ids
-from purr_petra.core.util import timestamp_filename
+import purr_petra.core.crud as crud
+from purr_petra.core.util import async_wrap, timestamp_filename
+from purr_petra.recon.repo_fs import repo_fingerprint
+from purr_petra.core.scheduler import (
+    Lane,
+    admit,
+    pick_lane,
+    repo_queries,
+    scheduler,
+)
+from purr_petra.core.tasks import (
+    ProgressTracker,
+    TaskCancelled,
+    cancel_task,
+    describe_task,
+    evict_tasks,
+    finish_task,
+    start_task,
+)
 import purr_petra.core.schemas as schemas
 from purr_petra.core.logger import logger
 
@@ -92,25 +129,410 @@ def parse_uwis(uwis: Optional[str]) -> List[str]:
         return []
 
 
-router = APIRouter()
+def parse_area(
+    bbox: Optional[str], polygon: Optional[str]
+) -> Optional[BaseGeometry]:
+    """Parse an optional spatial filter: either a bbox as
+    "min_lon,min_lat,max_lon,max_lat" or a WKT (multi)polygon, both in the
+    repo's lon/lat (storage datum).
+
+    Args:
+        bbox (Optional[str]): bbox query string
+        polygon (Optional[str]): WKT query string
+
+    Returns:
+        Optional[BaseGeometry]: The area, or None if neither was given
+
+    Raises:
+        HTTPException: 400 if both were given or either is malformed
+    """
+    if bbox and polygon:
+        raise HTTPException(status_code=400, detail="Use either bbox or polygon")
+    if bbox:
+        try:
+            min_lon, min_lat, max_lon, max_lat = (float(b) for b in bbox.split(","))
+        except ValueError as ve:
+            raise HTTPException(
+                status_code=400,
+                detail="bbox must be: min_lon,min_lat,max_lon,max_lat",
+            ) from ve
+        if min_lon > max_lon or min_lat > max_lat:
+            raise HTTPException(status_code=400, detail=f"Empty bbox: {bbox}")
+        return box(min_lon, min_lat, max_lon, max_lat)
+    if polygon:
+        try:
+            area = wkt.loads(polygon)
+        except ShapelyError as se:
+            raise HTTPException(status_code=400, detail=f"Invalid WKT: {se}") from se
+        if not isinstance(area, (Polygon, MultiPolygon)) or not area.is_valid:
+            raise HTTPException(
+                status_code=400, detail="polygon must be a valid WKT (MULTI)POLYGON"
+            )
+        return area
+    return None
+
+
+def parse_curve_window(
+    asset: str,
+    top: Optional[float],
+    base: Optional[float],
+    step: Optional[float],
+    method: Optional[schemas.ResampleMethod],
+) -> Optional[schemas.CurveWindow]:
+    """Parse optional vector_log depth window and resampling parameters
+
+    Args:
+        asset (str): The asset type; only vector_log has curves
+        top (Optional[float]): Shallowest depth to keep
+        base (Optional[float]): Deepest depth to keep
+        step (Optional[float]): New depth step to resample to
+        method (Optional[schemas.ResampleMethod]): How to resample
+
+    Returns:
+        Optional[schemas.CurveWindow]: The window, or None if nothing was given
+
+    Raises:
+        HTTPException: 400 for a non-curve asset or an invalid window
+    """
+    if top is None and base is None and step is None and method is None:
+        return None
+    if asset != AssetTypeEnum.VECTOR_LOG.value:
+        raise HTTPException(
+            status_code=400,
+            detail="top, base, step and method only apply to vector_log",
+        )
+    if method is not None and step is None:
+        raise HTTPException(status_code=400, detail="method requires a step")
+    try:
+        return schemas.CurveWindow(
+            top=top,
+            base=base,
+            step=step,
+            method=method or schemas.ResampleMethod.LINEAR,
+        )
+    except ValidationError as ve:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid curve window: {ve.errors()[0]['msg']}"
+        ) from ve
+
+
+def request_key(
+    repo_id: str, asset: str, uwi_list: Optional[List[str]], **options: Any
+) -> str:
+    """Normalized key for an asset request, used to coalesce duplicates and
+    (with a repo fingerprint and format in options) to find reusable exports.
+    UWIs are deduplicated and sorted so order and repeats don't matter.
+
+    Args:
+        repo_id (str): The repo_id
+        asset (str): The asset type
+        uwi_list (Optional[List[str]]): parsed UWIs (see parse_uwis)
+        **options: Anything else that changes the output, e.g. format
+
+    Returns:
+        str: A sha1 hex digest of the normalized request
+    """
+    norm = {
+        "repo_id": repo_id,
+        "asset": asset,
+        "uwis": sorted(set(uwi_list or [])),
+        **options,
+    }
+    return hashlib.sha1(json.dumps(norm, sort_keys=True).encode()).hexdigest()
+
+
+def attach_response(db: Session, leader) -> schemas.AssetCollectionResponse:
+    """Response for a duplicate request that attached to a running task"""
+    logger.info(f"coalesced duplicate request onto task: {leader.id}")
+    res = describe_task(db, leader, schemas.AssetCollectionResponse)
+    res.coalesced = True
+    return res
+
+
+def reject_unknown_uwis(
+    repo_id: str,
+    fs_path: str,
+    uwi_list: List[str],
+    area: Optional[BaseGeometry] = None,
+) -> None:
+    """Fail fast, without touching DBISAM, when the local well index shows
+    that no well matches the UWI (and area) filter. Blocking (a scan of the
+    repo's DB files, then SQLite), so the routes run it in a thread.
+
+    Args:
+        repo_id (str): The repo_id
+        fs_path (str): The repo's fs_path
+        uwi_list (List[str]): parsed UWIs (see parse_uwis)
+        area (Optional[BaseGeometry]): parsed area (see parse_area)
+
+    Raises:
+        HTTPException: 404 if no indexed well matches the filter
+    """
+    if not uwi_list and area is None:
+        return
+    if local_wsns(repo_id, fs_path, uwi_list, area) == []:
+        criteria = list(uwi_list or []) + ([area.wkt] if area is not None else [])
+        raise HTTPException(
+            status_code=404,
+            detail=f"No wells in {repo_id} match: {', '.join(criteria)}",
+        )
+
+
+def inline_docs(
+    repo: Any,
+    asset: str,
+    uwi_list: List[str],
+    area: Optional[BaseGeometry] = None,
+) -> str:
+    """Resolve the wells from the local well index and collect them inline.
+    Blocking (SQLite, then DBISAM), so the route runs it in a thread. A stale
+    index is not rebuilt here: that is a recon's job, not a quick lookup's.
+
+    Args:
+        repo (Any): The Repo, for its fs_path and conn
+        asset (str): An asset (i.e. datatype) such as "well" or "vector_log"
+        uwi_list (List[str]): parsed UWIs (see parse_uwis)
+        area (Optional[BaseGeometry]): parsed area (see parse_area)
+
+    Raises:
+        HTTPException: 409 if there is no current well index, 400 if more
+        than INLINE_MAX_WELLS wells match
+
+    Returns:
+        str: the docs, as a JSON array
+    """
+    wsns = local_wsns(repo.id, repo.fs_path, uwi_list, area)
+    if wsns is None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"No current well index for {repo.id}; run recon, or use "
+            "the stream or POST",
+        )
+    if len(wsns) > INLINE_MAX_WELLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{len(wsns)} wells match, more than the {INLINE_MAX_WELLS} "
+            "allowed inline; use the stream or POST",
+        )
+    return inline_json(repo.conn, asset, wsns)
+
 
-task_storage: Dict[str, schemas.AssetCollectionResponse] = {}
+def reuse_export(
+    db: Session, key: str
+) -> Optional[schemas.AssetCollectionResponse]:
+    """If an identical export of the unchanged repo is still in the file_depot,
+    record an already-completed task that points at it.
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        key (str): Export key (request_key plus repo fingerprint and format)
+
+    Returns:
+        Optional[schemas.AssetCollectionResponse]: The completed task, or None
+    """
+    export = crud.get_export(db, key)
+    if export is None:
+        return None
+    files = [export.out_file, export.task_message.get("sidecar_file")]
+    if not all(FilePath(f).exists() for f in files if f):
+        logger.info(f"export file is gone, forgetting it: {export.out_file}")
+        crud.delete_export(db, key)
+        return None
+
+    logger.info(f"reusing unchanged export: {export.out_file}")
+    task = crud.create_task(
+        db,
+        {
+            "id": str(uuid.uuid4()),
+            "kind": "asset",
+            "repo_id": export.repo_id,
+            "task_status": schemas.TaskStatus.COMPLETED.value,
+            "task_message": {**export.task_message, "reused": True},
+            "progress": schemas.TaskProgress(stage="done").model_dump(),
+        },
+    )
+    return describe_task(db, task, schemas.AssetCollectionResponse)
+
+
+def prepare_export(
+    repo_id: str,
+    asset: str,
+    fs_path: str,
+    uwi_list: List[str],
+    area: Optional[BaseGeometry],
+    options: Dict[str, Any],
+) -> Tuple[Optional[Dict[str, Any]], Optional[schemas.AssetCollectionResponse]]:
+    """The blocking checks before a POST queues an export: reject_unknown_uwis,
+    then the repo fingerprint and reuse_export. Both scan the repo's DB files,
+    so the route runs this in a thread.
+
+    Args:
+        repo_id (str): The repo_id
+        asset (str): An asset (i.e. datatype) such as "well" or "vector_log"
+        fs_path (str): The repo's fs_path
+        uwi_list (List[str]): parsed UWIs (see parse_uwis)
+        area (Optional[BaseGeometry]): parsed area (see parse_area)
+        options (Dict[str, Any]): the request options, as in its request_key
+
+    Raises:
+        HTTPException: 404 if no indexed well matches the filter
+
+    Returns:
+        Tuple: the export to record when done (None if the repo has no
+        fingerprint), and the reused export's completed task, if any
+    """
+    reject_unknown_uwis(repo_id, fs_path, uwi_list, area)
+
+    fingerprint = repo_fingerprint(fs_path)
+    if not fingerprint:
+        return None, None
+    export = {
+        "key": request_key(
+            repo_id,
+            asset,
+            uwi_list,
+            fingerprint=fingerprint,
+            **{"format": schemas.ExportFormat.JSON.value, **options},
+        ),
+        "repo_id": repo_id,
+        "asset": asset,
+        "fingerprint": fingerprint,
+    }
+    # an identical export of the unchanged repo already exists: reuse it
+    db = next(get_db())
+    try:
+        return export, reuse_export(db, export["key"])
+    finally:
+        db.close()
+
+
+def record_export(export: Dict[str, Any], fs_path: str, res: Any) -> None:
+    """Remember a finished export for reuse, unless the repo changed while it
+    was being collected (the file might then mix old and new data). Blocking
+    (a scan of the repo's DB files), so it is run in a thread.
+
+    Args:
+        export (Dict[str, Any]): key, repo_id, asset and fingerprint
+        fs_path (str): The repo's fs_path, to re-check its fingerprint
+        res (Any): The selector result; only exports with an out_file count
+    """
+    if not isinstance(res, dict) or "out_file" not in res:
+        return
+    if repo_fingerprint(fs_path) != export["fingerprint"]:
+        logger.info(f"repo changed during export, not reusable: {res['out_file']}")
+        return
+    db = next(get_db())
+    try:
+        crud.save_export(
+            db, {**export, "out_file": res["out_file"], "task_message": res}
+        )
+    finally:
+        db.close()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Compare an If-None-Match header (possibly a list, or *) to an ETag"""
+    if not if_none_match:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+class CountedStream(StreamingResponse):
+    """A StreamingResponse that holds its repo's query count (taken with
+    repo_queries.acquire) until it is sent, fails or the client goes away"""
+
+    def __init__(self, repo_id: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.repo_id = repo_id
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            repo_queries.release(self.repo_id)
+
+
+router = APIRouter()
 
 
 async def process_asset_collection(
-    task_id: str, repo_id: str, asset: str, export_file: str, uwi_list: str
+    task_id: str,
+    repo_id: str,
+    asset: str,
+    export_file: str,
+    uwi_list: str,
+    lane: Lane,
+    export: Optional[Dict[str, Any]] = None,
+    fs_path: Optional[str] = None,
+    area: Optional[BaseGeometry] = None,
+    sidecar: bool = False,
+    curves: Optional[schemas.CurveWindow] = None,
+    fmt: schemas.ExportFormat = schemas.ExportFormat.JSON,
+):
+    """Wait for a scheduler slot, trigger selector and update the task's status"""
+    async with scheduler.slot(lane):
+        return await run_asset_collection(
+            task_id,
+            repo_id,
+            asset,
+            export_file,
+            uwi_list,
+            export,
+            fs_path,
+            area,
+            sidecar,
+            curves,
+            fmt,
+        )
+
+
+async def run_asset_collection(
+    task_id: str,
+    repo_id: str,
+    asset: str,
+    export_file: str,
+    uwi_list: str,
+    export: Optional[Dict[str, Any]] = None,
+    fs_path: Optional[str] = None,
+    area: Optional[BaseGeometry] = None,
+    sidecar: bool = False,
+    curves: Optional[schemas.CurveWindow] = None,
+    fmt: schemas.ExportFormat = schemas.ExportFormat.JSON,
 ):
-    """Trigger selector and update task_storage"""
+    """Trigger selector, update the task's status and record the export"""
     try:
-        task_storage[task_id].task_status = schemas.TaskStatus.IN_PROGRESS
-        res = await selector(repo_id, asset, export_file, uwi_list)
+        if not start_task(task_id):
+            logger.info(f"Task cancelled before start: {task_id}")
+            return None
+        tracker = ProgressTracker(task_id)
+        res = await selector(
+            repo_id,
+            asset,
+            export_file,
+            uwi_list,
+            task_id,
+            tracker,
+            area,
+            sidecar,
+            curves,
+            fmt,
+        )
         logger.info(res)
-        task_storage[task_id].task_message = res
-        task_storage[task_id].task_status = schemas.TaskStatus.COMPLETED
+        finish_task(task_id, schemas.TaskStatus.COMPLETED, task_message=res)
+        if export is not None:
+            async_record_export = async_wrap(record_export)
+            await async_record_export(export, fs_path, res)
         return res
+    except TaskCancelled:
+        finish_task(
+            task_id, schemas.TaskStatus.CANCELLED, task_message="cancelled by request"
+        )
+        logger.info(f"Task cancelled: {task_id}")
     except Exception as e:  # pylint: disable=broad-except
-        task_storage[task_id].task_status = schemas.TaskStatus.FAILED
+        finish_task(task_id, schemas.TaskStatus.FAILED, task_message=str(e))
         logger.error(f"Task failed for {task_id}: {str(e)}")
+    return None
 
 
 # ASSETS ######################################################################
@@ -123,7 +545,25 @@ async def process_asset_collection(
     description=(
         "Specify a repo_id, asset (data type) and an optional uwi filter. "
         "Query results will be written to files stored in the 'file_depot' "
-        "directory."
+        "directory. Jobs are queued by lane (a few exact UWIs are "
+        "'interactive', everything else is 'bulk'); a 429 is returned if the "
+        "queue is full or the repo already has too many active jobs. "
+        "Repeating a request that is still running (same repo_id, asset and "
+        "UWIs, in any order) returns the running task with coalesced=true. "
+        "If the repo's DB files are unchanged since an identical export that "
+        "is still in the file_depot, the task completes at once with that "
+        "file (reused=true in task_message). Once recon has indexed the repo's "
+        "wells, a uwi filter that matches no well returns a 404 at once. "
+        "Add a bbox or WKT polygon to select wells by surface location; "
+        "these resolve against recon's local spatial index. Set sidecar=true "
+        "to write bulky values (e.g. vector_log curve digits and LAS headers) "
+        "to a deduplicated binary .bin file next to the export; the JSON docs "
+        "then carry references (offset, length, dtype) into that file. "
+        "For vector_log, top and base keep only curve samples in that depth "
+        "interval and step resamples curves server-side (see method), so "
+        "only the requested samples are exported. Use format=las to get "
+        "vector_log curves as LAS 2.0 files (one per well and LAS id) in a "
+        "file_depot directory instead of JSON."
     ),
     status_code=status.HTTP_202_ACCEPTED,
 )
@@ -136,26 +576,99 @@ async def asset_collection(
         description="Enter full or partial uwi(s); use * or % as wildcard."
         "Separate UWIs with spaces or commas. Leave blank to select all.",
     ),
+    bbox: str = Query(
+        None,
+        description="Only wells located in this box: "
+        "min_lon,min_lat,max_lon,max_lat (in the repo's lon/lat datum)",
+    ),
+    polygon: str = Query(
+        None,
+        description="Only wells located in this WKT POLYGON or MULTIPOLYGON "
+        "(in the repo's lon/lat datum). Use either bbox or polygon.",
+    ),
+    sidecar: bool = Query(
+        False,
+        description="Write curve digits and LAS headers to a binary sidecar",
+    ),
+    top: float = Query(
+        None, description="vector_log only: drop curve samples above this depth"
+    ),
+    base: float = Query(
+        None, description="vector_log only: drop curve samples below this depth"
+    ),
+    step: float = Query(
+        None,
+        gt=0,
+        description="vector_log only: resample curves to this depth step",
+    ),
+    method: schemas.ResampleMethod = Query(
+        None,
+        description="How to resample to step: linear (default), nearest, "
+        "mean (average of samples within step/2) or decimate (every nth sample)",
+    ),
+    fmt: schemas.ExportFormat = Query(
+        schemas.ExportFormat.JSON,
+        alias="format",
+        description="json, or (vector_log only) las: one LAS 2.0 file per "
+        "well and LAS id, written to a directory in the file_depot",
+    ),
+    db: Session = Depends(get_db),
 ):
     """Query a Repo for Asset data"""
     RepoId.validate_repo_id(repo_id)
     asset = asset.value
 
     uwi_list = parse_uwis(uwi_query)
+    area = parse_area(bbox, polygon)
+    curves = parse_curve_window(asset, top, base, step, method)
+    if fmt == schemas.ExportFormat.LAS and asset != AssetTypeEnum.VECTOR_LOG.value:
+        raise HTTPException(status_code=400, detail="format=las is only for vector_log")
+    if fmt == schemas.ExportFormat.LAS and sidecar:
+        raise HTTPException(status_code=400, detail="sidecar does not apply to las")
+    options = {"area": area.wkt} if area is not None else {}
+    if sidecar:
+        options["sidecar"] = True
+    if fmt != schemas.ExportFormat.JSON:
+        options["format"] = fmt.value
+    if curves is not None:
+        options["curves"] = curves.model_dump(mode="json")
+    key = request_key(repo_id, asset, uwi_list, **options)
+
+    evict_tasks()
+
+    fs_path = crud.get_repo_by_id(db, repo_id).fs_path
+    async_prepare_export = async_wrap(prepare_export)
+    export, reused = await async_prepare_export(
+        repo_id, asset, fs_path, uwi_list, area, options
+    )
+    if reused is not None:
+        return reused
 
-    task_id = str(uuid.uuid4())
+    # an identical request is already running: attach to it
+    if leader := crud.find_active_task(db, key):
+        return attach_response(db, leader)
 
-    export_file = timestamp_filename(repo_id=repo_id, asset=asset)
+    admit(db, repo_id)
+    lane = pick_lane(uwi_list)
 
-    new_collect = schemas.AssetCollectionResponse(
-        id=task_id,
-        repo_id=repo_id,
-        asset=asset,
-        uwi_list=uwi_list,
-        task_status=schemas.TaskStatus.PENDING,
-        task_message=f"export file (pending): {export_file}",
+    task_id = str(uuid.uuid4())
+
+    export_file = timestamp_filename(repo_id=repo_id, asset=asset, ext=fmt.value)
+
+    new_collect, created = crud.create_or_attach_task(
+        db,
+        {
+            "id": task_id,
+            "kind": "asset",
+            "repo_id": repo_id,
+            "lane": lane.value,
+            "request_key": key,
+            "task_status": schemas.TaskStatus.PENDING.value,
+            "task_message": f"export file (pending): {export_file}",
+        },
     )
-    task_storage[task_id] = new_collect
+    if not created:
+        return attach_response(db, new_collect)
 
     # noinspection PyAsyncCall
     asyncio.create_task(
@@ -165,9 +678,140 @@ async def asset_collection(
             asset,
             export_file,
             uwi_list,
+            lane,
+            export,
+            fs_path,
+            area,
+            sidecar,
+            curves,
+            fmt,
         )
     )
-    return new_collect
+    return describe_task(db, new_collect, schemas.AssetCollectionResponse)
+
+
+@router.get(
+    "/asset/{repo_id}/{asset}/stream",
+    summary="Stream Asset data from a Repo as NDJSON",
+    description=(
+        "Specify a repo_id, asset (data type) and optional uwi and bbox or "
+        "polygon filters. Docs are streamed back as newline-delimited JSON (one doc per line) "
+        "as each chunk is collected, rather than written to the file_depot. "
+        "Best suited to small and medium queries. For vector_log, top, base, "
+        "step and method window and resample curves as for the POST. "
+        "A stream starts at once, without a scheduler slot, so it is not "
+        "deferred when the host is busy. It gets a 429 if the job queue is full "
+        "or the repo's job limit is reached. While it runs, it counts toward "
+        "that limit, but only in the uvicorn worker that serves it."
+    ),
+    response_class=StreamingResponse,
+)
+async def asset_stream(
+    repo_id: str = Path(..., description="repo_id"),
+    asset: AssetTypeEnum = Path(..., description="asset type"),
+    uwi_query: str = Query(
+        None,
+        min_length=3,
+        description="Enter full or partial uwi(s); use * or % as wildcard."
+        "Separate UWIs with spaces or commas. Leave blank to select all.",
+    ),
+    bbox: str = Query(
+        None,
+        description="Only wells located in this box: "
+        "min_lon,min_lat,max_lon,max_lat (in the repo's lon/lat datum)",
+    ),
+    polygon: str = Query(
+        None,
+        description="Only wells located in this WKT POLYGON or MULTIPOLYGON "
+        "(in the repo's lon/lat datum). Use either bbox or polygon.",
+    ),
+    top: float = Query(
+        None, description="vector_log only: drop curve samples above this depth"
+    ),
+    base: float = Query(
+        None, description="vector_log only: drop curve samples below this depth"
+    ),
+    step: float = Query(
+        None,
+        gt=0,
+        description="vector_log only: resample curves to this depth step",
+    ),
+    method: schemas.ResampleMethod = Query(
+        None,
+        description="How to resample to step: linear (default), nearest, "
+        "mean (average of samples within step/2) or decimate (every nth sample)",
+    ),
+    db: Session = Depends(get_db),
+):
+    """Stream Asset data from a Repo as NDJSON"""
+    RepoId.validate_repo_id(repo_id)
+
+    uwi_list = parse_uwis(uwi_query)
+    area = parse_area(bbox, polygon)
+    curves = parse_curve_window(asset.value, top, base, step, method)
+
+    fs_path = crud.get_repo_by_id(db, repo_id).fs_path
+    async_reject_unknown_uwis = async_wrap(reject_unknown_uwis)
+    await async_reject_unknown_uwis(repo_id, fs_path, uwi_list, area)
+
+    admit(db, repo_id)
+    repo_queries.acquire(repo_id)
+    return CountedStream(
+        repo_id,
+        stream_docs(repo_id, asset.value, uwi_list, area, curves),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/asset/{repo_id}/{asset}/inline",
+    summary="Get Asset data for a few wells from a Repo as JSON",
+    description=(
+        "Specify a repo_id, asset (data type) and uwi(s), with optional bbox or "
+        "polygon filters. The docs come back directly as a JSON array, with no "
+        "task, identifier query or file_depot: meant for quick lookups of up to "
+        f"{INLINE_MAX_WELLS} wells (PURR_PETRA_INLINE_MAX_WELLS). Needs a well "
+        "index that is current (recon rebuilds it), else 409. Use the stream "
+        "or POST for more wells, or to window vector_log curves. Runs at once, "
+        "without a scheduler slot. It gets a 429 if the job queue is full or "
+        "the repo's job limit is reached. While it runs, it counts toward that "
+        "limit, but only in the uvicorn worker that serves it."
+    ),
+)
+async def asset_inline(
+    repo_id: str = Path(..., description="repo_id"),
+    asset: AssetTypeEnum = Path(..., description="asset type"),
+    uwi_query: str = Query(
+        ...,
+        min_length=3,
+        description="Enter full or partial uwi(s); use * or % as wildcard."
+        "Separate UWIs with spaces or commas.",
+    ),
+    bbox: str = Query(
+        None,
+        description="Only wells located in this box: "
+        "min_lon,min_lat,max_lon,max_lat (in the repo's lon/lat datum)",
+    ),
+    polygon: str = Query(
+        None,
+        description="Only wells located in this WKT POLYGON or MULTIPOLYGON "
+        "(in the repo's lon/lat datum). Use either bbox or polygon.",
+    ),
+    db: Session = Depends(get_db),
+):
+    """Get Asset data for a few wells from a Repo as JSON"""
+    RepoId.validate_repo_id(repo_id)
+
+    uwi_list = parse_uwis(uwi_query)
+    area = parse_area(bbox, polygon)
+
+    repo = crud.get_repo_by_id(db, repo_id)
+
+    admit(db, repo_id)
+    with repo_queries.hold(repo_id):
+        async_inline_docs = async_wrap(inline_docs)
+        content = await async_inline_docs(repo, asset.value, uwi_list, area)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get(
@@ -177,12 +821,50 @@ async def asset_collection(
     description=(
         "An assect collection job may take several minutes, so use the task_id "
         "returned by the original POST to (periodically) check the job status. "
-        "Status values are: pending, in_progress, completed or failed. Query "
-        "results will be written to the file_depot directory."
+        "Status values are: pending, in_progress, completed, failed or "
+        "cancelled; pending jobs include their queue_position. Query results "
+        "will be written to the file_depot directory. Responses carry an ETag; "
+        "send it back as If-None-Match to get a 304 while nothing has changed."
     ),
 )
-async def get_asset_collect_status(task_id: str):
+async def get_asset_collect_status(
+    task_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
     """Check status of a /asset/{repo_id}/{asset} job using the task_id"""
-    if task_id not in task_storage:
+    task = crud.get_task(db, task_id, "asset")
+    if task is None:
         raise HTTPException(status_code=404, detail="Asset collection task not found")
-    return task_storage[task_id]
+    res = describe_task(db, task, schemas.AssetCollectionResponse)
+    etag = f'"{hashlib.sha1(res.model_dump_json().encode()).hexdigest()}"'
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return res
+
+
+@router.delete(
+    "/asset/status/{task_id}",
+    response_model=schemas.AssetCollectionResponse,
+    summary="Cancel a running /asset/{repo_id}/{asset} job using the task_id.",
+    description=(
+        "Request cancellation of a pending or in_progress asset collection. "
+        "The job stops before its next chunk, removes its partial export file "
+        "and ends with a task_status of cancelled."
+    ),
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def cancel_asset_collection(task_id: str, db: Session = Depends(get_db)):
+    """Cancel a running /asset/{repo_id}/{asset} job using the task_id"""
+    task = crud.get_task(db, task_id, "asset")
+    if task is None:
+        raise HTTPException(status_code=404, detail="Asset collection task not found")
+    if not cancel_task(task_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Task already {task.task_status}",
+        )
+    db.refresh(task)
+    return describe_task(db, task, schemas.AssetCollectionResponse)
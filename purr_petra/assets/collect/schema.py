@@ -0,0 +1,164 @@
+"""Declared column schemas for asset recipes
+
+Each recipe lists the type of every selected column in its "columns" dict,
+e.g. {"w_wsn": "int!", "w_uwi": "str", "s_congress": "bytes"}. Kinds are int,
+float, str, bool, bytes, decimal and object; a trailing "!" marks a column
+that is never null.
+
+Fetched rows are built straight into typed columns of their declared kind (no
+inference or per-cell null passes). The declaration is checked against the
+driver's column types as each chunk arrives: any drift (a changed type, an
+undeclared or missing column, nulls in a "!" column) is logged once per asset
+and column. Only a column whose declared kind is missing or differs from the
+driver's type is built from the driver's type instead, so that its values
+still fit their column.
+"""
+
+from decimal import Decimal
+from typing import Any, Collection, Dict, List, Optional, Sequence, Set, Tuple
+import numpy as np
+import pandas as pd
+from purr_petra.core.logger import logger
+
+try:
+    import pyarrow  # optional: Arrow-backed (compact) string columns
+except ImportError:
+    pyarrow = None
+
+# str columns hold their text in one Arrow buffer rather than as Python objects
+STRING_DTYPE = pd.StringDtype("pyarrow" if pyarrow is not None else "python")
+
+# driver (cursor.description) type -> column kind; anything else is "object"
+PYTHON_KINDS = {
+    int: "int",
+    float: "float",
+    str: "str",
+    bool: "bool",
+    bytes: "bytes",
+    bytearray: "bytes",
+    memoryview: "bytes",
+    Decimal: "decimal",
+}
+
+# columns shared by most recipes: well header, surface location and uwi
+WELL_COLUMNS = {
+    "w_wsn": "int!",
+    "w_uwi": "str",
+    "w_shortname": "str",
+    "w_wellname": "str",
+    "w_operator": "str",
+    "w_leasename": "str",
+    "w_leasenumber": "str",
+    "w_county": "str",
+    "w_state": "str",
+    "w_chgdate": "float",
+}
+
+LOCAT_COLUMNS = {
+    "s_lat": "float",
+    "s_lon": "float",
+}
+
+UWI_COLUMNS = {
+    "u_wsn": "int",
+    "u_uwi": "str",
+    "u_label": "str",
+    "u_sortname": "str",
+    "u_flags": "int",
+}
+
+warned: Set[Tuple[str, str]] = set()
+
+
+def drift(asset: str, column: str, message: str) -> None:
+    """Log a schema drift warning, once per asset and column"""
+    if (asset, column) in warned:
+        return
+    warned.add((asset, column))
+    logger.warning(f"schema drift in {asset}.{column}: {message}")
+
+
+def parse_kind(spec: str) -> Tuple[str, bool]:
+    """Split a declared kind like "int!" into ("int", True)"""
+    return spec.rstrip("!"), spec.endswith("!")
+
+
+def column_kind(
+    asset: str, name: str, py_type: type, declared: Dict[str, str]
+) -> Tuple[str, bool]:
+    """The kind to build a fetched column as: its declared kind, or the
+    driver's (with a drift warning) if it is undeclared or declared otherwise
+
+    Args:
+        asset (str): The asset type, for drift warnings
+        name (str): column name, from cursor.description
+        py_type (type): Python type, from cursor.description
+        declared (Dict[str, str]): the recipe's "columns"
+
+    Returns:
+        Tuple[str, bool]: the kind, and whether it is declared never null
+    """
+    driver = PYTHON_KINDS.get(py_type, "object")
+    if name not in declared:
+        drift(asset, name, f"not declared (driver type: {driver})")
+        return driver, False
+    want, required = parse_kind(declared[name])
+    if want != driver:
+        drift(asset, name, f"declared {want}, driver type is {driver}")
+        return driver, False
+    return want, required
+
+
+def typed_column(values: Sequence[Any], kind: str, parsed: bool = False) -> Any:
+    """Build a column of the given kind straight from fetched values: the
+    dtypes are Int64, float64, string (Arrow-backed if available), boolean,
+    or object for everything else. Nulls stay as NA/NaN until serialization.
+
+    Text an xform parses straight away (LIST columns, memos) keeps Python
+    storage: copying it into Arrow first would only add a copy."""
+    if kind == "int":
+        return pd.array(list(values), dtype="Int64")
+    if kind == "float":
+        return np.array(values, dtype=np.float64)
+    if kind == "str":
+        return pd.array(list(values), dtype="string" if parsed else STRING_DTYPE)
+    if kind == "bool":
+        return pd.array(list(values), dtype="boolean")
+    return pd.Series(list(values), dtype=object).to_numpy()
+
+
+def build_frame(
+    asset: str,
+    column_names: List[str],
+    column_types: List[type],
+    rows: List[Sequence[Any]],
+    declared: Optional[Dict[str, str]],
+    parsed: Collection[str] = (),
+) -> pd.DataFrame:
+    """Build a typed DataFrame from fetched rows, checking for schema drift
+
+    Args:
+        asset (str): The asset type, for drift warnings
+        column_names (List[str]): from cursor.description
+        column_types (List[type]): Python types from cursor.description
+        rows (List[Sequence[Any]]): cursor.fetchall()
+        declared (Optional[Dict[str, str]]): the recipe's "columns"
+        parsed (Collection[str]): columns with an xform (the recipe's "xforms")
+
+    Returns:
+        pd.DataFrame: one typed column per selected column
+    """
+    declared = declared or {}
+    values_by_column = list(zip(*rows)) if rows else [()] * len(column_names)
+
+    data = {}
+    for name, py_type, values in zip(column_names, column_types, values_by_column):
+        kind, required = column_kind(asset, name, py_type, declared)
+        if required and any(v is None for v in values):
+            drift(asset, name, "declared not null, but has nulls")
+        data[name] = typed_column(values, kind, name in parsed)
+
+    for name in declared.keys() - set(column_names):
+        drift(asset, name, "declared, but not selected")
+
+    return pd.DataFrame(data, columns=column_names)
@@ -0,0 +1,178 @@
+"""Masking of Petra's null sentinels
+
+Petra stores missing numerics as sentinel values (1E30, sometimes widened
+from float32 to 1.0000000150474662e+30) rather than nulls, and log curves
+use their own a_nullval (typically the LAS -999.25). Left alone these leak
+into exports as real measurements.
+
+Sentinels are matched with a relative tolerance, one vectorized pass per
+column: scalar float columns are masked as fetched (before formatting), and
+float arrays (LIST floats, zztops, curve digits) once they have been parsed.
+Masked values become None (NaN inside curve digits). Defaults come from
+PURR_PETRA_NULL_SENTINELS, and a recipe may add its own "null_sentinels".
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+NULL_SENTINELS = tuple(
+    float(v)
+    for v in os.environ.get("PURR_PETRA_NULL_SENTINELS", "1e30,-999.25").split(",")
+)
+
+# float32 sentinels widened to float64 are off by ~1e-8 (relative)
+SENTINEL_RTOL = 1e-6
+
+# xforms that parse to lists of floats
+FLOAT_LIST_XFORMS = {"array_of_float", "parse_zztops"}
+
+
+def recipe_sentinels(recipe: Dict[str, Any]) -> np.ndarray:
+    """The default sentinels plus any from the recipe's "null_sentinels" """
+    return np.array(
+        [*NULL_SENTINELS, *recipe.get("null_sentinels", [])], dtype=np.float64
+    )
+
+
+def sentinel_mask(
+    values: np.ndarray, sentinels: np.ndarray, nullvals: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """True where a value is (close to) a sentinel
+
+    Args:
+        values (np.ndarray): float values; NaN never matches
+        sentinels (np.ndarray): from recipe_sentinels
+        nullvals (Optional[np.ndarray]): per-value sentinels (e.g. a_nullval
+            repeated over a curve's digits); NaN entries are ignored
+
+    Returns:
+        np.ndarray: boolean mask, same shape as values
+    """
+    mask = np.isclose(values[..., None], sentinels, rtol=SENTINEL_RTOL, atol=0)
+    mask = mask.any(axis=-1)
+    if nullvals is not None:
+        mask |= np.isclose(values, nullvals, rtol=SENTINEL_RTOL, atol=0)
+    return mask
+
+
+def is_sentinel(value: Any, sentinels: np.ndarray) -> bool:
+    """sentinel_mask for a single value (see inline); non-floats never match"""
+    if not isinstance(value, float):
+        return False
+    return bool((np.abs(value - sentinels) <= SENTINEL_RTOL * np.abs(sentinels)).any())
+
+
+def scrub_float_columns(
+    df: pd.DataFrame, recipe: Dict[str, Any], sentinels: np.ndarray
+) -> pd.DataFrame:
+    """Mask sentinels in the float64 columns of a freshly fetched chunk. The
+    column holding curve nullvals (recipe "curves") is left as is.
+
+    Args:
+        df (pd.DataFrame): typed rows from build_frame
+        recipe (Dict[str, Any]): the asset recipe
+        sentinels (np.ndarray): from recipe_sentinels
+
+    Returns:
+        pd.DataFrame: the same frame, sentinels set to NaN
+    """
+    keep = recipe.get("curves", {}).get("nullval")
+    for col in df.columns:
+        if col == keep or df[col].dtype != np.float64:
+            continue
+        values = df[col].to_numpy()
+        mask = sentinel_mask(values, sentinels)
+        if mask.any():
+            df[col] = np.where(mask, np.nan, values)
+    return df
+
+
+def scrub_list_column(col: pd.Series, sentinels: np.ndarray) -> pd.Series:
+    """Mask sentinels in a column of float lists, all rows at once"""
+    values = col.tolist()
+    rows = [i for i, x in enumerate(values) if isinstance(x, list) and x]
+    if not rows:
+        return col
+
+    lengths = [len(values[i]) for i in rows]
+    flat = np.array([v for i in rows for v in values[i]], dtype=np.float64)
+    mask = sentinel_mask(flat, sentinels)
+    if not mask.any():
+        return col
+
+    items = flat.astype(object)
+    items[mask | np.isnan(flat)] = None
+    items = items.tolist()
+    ends = np.cumsum(lengths).tolist()
+    out = list(values)
+    for i, start, end in zip(rows, [0, *ends[:-1]], ends):
+        out[i] = items[start:end]
+    return pd.Series(out, index=col.index, dtype=object)
+
+
+def scrub_curve_digits(
+    digits: pd.Series, nullvals: pd.Series, sentinels: np.ndarray
+) -> pd.Series:
+    """Set each curve's null samples (its nullval, or a sentinel) to NaN
+
+    Args:
+        digits (pd.Series): NumPy arrays, e.g. from logdata_digits
+        nullvals (pd.Series): each curve's nullval (or None)
+        sentinels (np.ndarray): from recipe_sentinels
+
+    Returns:
+        pd.Series: new arrays (never views of the fetched blobs)
+    """
+    values = digits.tolist()
+    rows = [
+        i for i, x in enumerate(values) if isinstance(x, np.ndarray) and x.size
+    ]
+    if not rows:
+        return digits
+
+    sizes = [values[i].size for i in rows]
+    flat = np.concatenate([values[i] for i in rows]).astype(np.float64)
+    own = np.array(
+        [np.nan if v is None else v for v in nullvals.iloc[rows].tolist()],
+        dtype=np.float64,
+    )
+    mask = sentinel_mask(flat, sentinels, np.repeat(own, sizes))
+    if not mask.any():
+        return digits
+
+    flat[mask] = np.nan
+    out = list(values)
+    for i, arr in zip(rows, np.split(flat, np.cumsum(sizes)[:-1])):
+        out[i] = arr
+    return pd.Series(out, index=digits.index, dtype=object)
+
+
+def scrub_array_columns(
+    df: pd.DataFrame, recipe: Dict[str, Any], sentinels: np.ndarray
+) -> pd.DataFrame:
+    """Mask sentinels in parsed float arrays: LIST floats, zztops and (using
+    the recipe "curves" map) curve digits
+
+    Args:
+        df (pd.DataFrame): formatted rows
+        recipe (Dict[str, Any]): the asset recipe
+        sentinels (np.ndarray): from recipe_sentinels
+
+    Returns:
+        pd.DataFrame: the same frame with array sentinels masked
+    """
+    float_lists: List[str] = [
+        col
+        for col, xform in recipe.get("xforms", {}).items()
+        if xform in FLOAT_LIST_XFORMS and col in df.columns
+    ]
+    for col in float_lists:
+        df[col] = scrub_list_column(df[col], sentinels)
+
+    if (curves := recipe.get("curves")) and curves["digits"] in df.columns:
+        df[curves["digits"]] = scrub_curve_digits(
+            df[curves["digits"]], df[curves["nullval"]], sentinels
+        )
+    return df
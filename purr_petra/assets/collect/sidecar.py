@@ -0,0 +1,72 @@
+"""Binary sidecar storage for bulky asset values (log curve digits, LAS headers)
+
+Instead of inlining each value in the JSON doc, the value's bytes are written
+once to a .bin file next to the export and the doc gets a reference:
+
+    {"sidecar": "nor_bd29a9_1721144912_vector_log.bin",
+     "offset": 4096, "length": 5000, "dtype": "<f8", "sha1": "..."}
+
+Values are deduplicated by content hash, so identical LAS headers shared by
+every curve of a LAS file are stored once. Numeric arrays start on 8-byte
+boundaries, so consumers can memory-map them directly, e.g.
+np.memmap(path, dtype="<f8", mode="r", offset=offset, shape=(length,)).
+For text, dtype is "utf-8" and length is in bytes.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import numpy as np
+import pandas as pd
+
+ALIGN = 8
+
+
+class SidecarWriter:
+    """Appends deduplicated values to one export's .bin sidecar file"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.refs: Dict[str, Dict[str, Any]] = {}
+        self.file = None
+
+    def __enter__(self) -> "SidecarWriter":
+        self.file = open(self.path, "wb")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.file.close()
+
+    def ref(self, value: Any) -> Optional[Dict[str, Any]]:
+        """Store a value (NumPy array or str) and return its reference
+
+        Args:
+            value (Any): A formatted cell, e.g. from logdata_digits
+
+        Returns:
+            Optional[Dict[str, Any]]: A sidecar reference, or None for nulls
+        """
+        if value is None or (np.isscalar(value) and pd.isna(value)):
+            return None
+        if isinstance(value, np.ndarray):
+            data = np.ascontiguousarray(value, dtype="<f8").tobytes()
+            dtype, length = "<f8", value.size
+        else:
+            data = str(value).encode("utf-8")
+            dtype, length = "utf-8", len(data)
+
+        digest = hashlib.sha1(data).hexdigest()
+        key = f"{dtype}:{digest}"
+        if key not in self.refs:
+            pad = -self.file.tell() % ALIGN
+            if pad:
+                self.file.write(b"\0" * pad)
+            self.refs[key] = {
+                "sidecar": self.path.name,
+                "offset": self.file.tell(),
+                "length": length,
+                "dtype": dtype,
+                "sha1": digest,
+            }
+            self.file.write(data)
+        return dict(self.refs[key])
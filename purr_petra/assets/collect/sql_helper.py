@@ -1,8 +1,14 @@
-import pyodbc
-from typing import Dict, Union, List, Literal, Tuple, TypeAlias
+from typing import Any, Dict, Iterable, Optional, Tuple, TypeAlias, Union, List
 
 from purr_petra.assets.collect.xformer import PURR_WHERE
 
+# an id from a recipe identifier query: a wsn, or for compound identifier_keys
+# a tuple of ints in the same order, e.g. (wsn, ldsn)
+RecipeId: TypeAlias = Union[int, Tuple[int, ...]]
+
+# runs of at least this many consecutive ids are written as a BETWEEN
+MIN_RANGE_RUN = 4
+
 
 def make_where_clause(uwi_list: List[str]):
     """Construct the UWI-centric part of a WHERE clause containing UWIs. The
@@ -22,20 +28,99 @@ def make_where_clause(uwi_list: List[str]):
     return clause
 
 
-def make_id_in_clauses(identifier_keys: List[str], ids: List[Union[str, int]]) -> str:
-    """Generate a SQL WHERE clause for filtering by IDs"""
+def int_predicate(column: str, values: Iterable[int]) -> str:
+    """Match a column to a set of integer ids. Sorted runs of MIN_RANGE_RUN or
+    more consecutive ids become BETWEEN ranges (DBISAM answers these with a
+    range scan of the index, and the SQL stays short), any others one IN list:
+
+    [1, 2, 3, 4, 5, 9, 12] ~~> "(w.wsn BETWEEN 1 AND 5 OR w.wsn IN (9,12))"
+
+    Args:
+        column (str): e.g. "w.wsn"
+        values (Iterable[int]): ids, in any order and possibly repeated
+
+    Returns:
+        str: the predicate, parenthesized if it has more than one term
+    """
+    ordered = sorted(set(int(v) for v in values))
+    ranges, singles = [], []
+    start = 0
+    for i in range(1, len(ordered) + 1):
+        if i < len(ordered) and ordered[i] == ordered[i - 1] + 1:
+            continue
+        if i - start >= MIN_RANGE_RUN:
+            ranges.append(f"{column} BETWEEN {ordered[start]} AND {ordered[i - 1]}")
+        else:
+            singles.extend(ordered[start:i])
+        start = i
+
+    terms = ranges
+    if singles:
+        terms.append(f"{column} IN ({','.join(str(v) for v in singles)})")
+    return terms[0] if len(terms) == 1 else f"({' OR '.join(terms)})"
+
+
+def make_wsn_where_clause(wsns: List[int]):
+    """Construct a WHERE clause from wsns already resolved from UWIs (see the
+    local well index), to stand in for make_where_clause's LIKE filters:
+    "WHERE 1=1 AND w.wsn IN (11,22,33)" (see int_predicate)
+
+    Args:
+        wsns (List[int]): List of well wsns
+    """
+    return f"WHERE 1=1 AND {int_predicate('w.wsn', wsns)}"
+
+
+def parse_id(key: Any) -> Optional[RecipeId]:
+    """Parse a key from an identifier query (its id_form, cast to text):
+    "11" ~~> 11, "11-22" ~~> (11, 22). None if a part is not an integer."""
+    try:
+        parts = tuple(int(p) for p in str(key).strip().strip("'").split("-"))
+    except ValueError:
+        return None
+    return parts[0] if len(parts) == 1 else parts
+
+
+def make_id_in_clauses(identifier_keys: List[str], ids: List[RecipeId]) -> str:
+    """Generate a SQL WHERE clause for filtering by IDs.
+
+    Every predicate is on the key columns themselves (no CAST/concatenation),
+    so DBISAM can use their indexes: a single key is an IN list, and compound
+    ids narrow by wsn first, then match the rest of each id within its wsn:
+
+    "WHERE 1=1 AND w.wsn IN (1,2) AND ((w.wsn = 1 AND a.ldsn IN (5,6)) OR
+    (w.wsn = 2 AND a.ldsn IN (7)))"
+
+    Dense runs of ids become BETWEEN ranges (see int_predicate).
+    """
     clause = "WHERE 1=1 "
-    if len(identifier_keys) == 1 and str(ids[0]).replace("'", "").isdigit():
-        no_quotes = ",".join(str(i).replace("'", "") for i in ids)
-        clause += f"AND {identifier_keys[0]} IN ({no_quotes})"
-    else:
-        idc = " || '-' || ".join(f"CAST({i} AS VARCHAR(10))" for i in identifier_keys)
-        clause += f"AND {idc} IN ({','.join(ids)})"
+    if len(identifier_keys) == 1:
+        clause += f"AND {int_predicate(identifier_keys[0], ids)}"
+        return clause
+
+    wsn_key, rest = identifier_keys[0], identifier_keys[1:]
+    # the rest of each id, by wsn (dicts keep the ids' order, without repeats)
+    by_wsn: Dict[int, Dict[Tuple[int, ...], None]] = {}
+    for item in ids:
+        by_wsn.setdefault(item[0], {})[item[1:]] = None
+
+    groups = []
+    for wsn, tails in by_wsn.items():
+        if len(rest) == 1:
+            match = int_predicate(rest[0], (t[0] for t in tails))
+            groups.append(f"({wsn_key} = {wsn} AND {match})")
+            continue
+        for tail in tails:
+            match = " AND ".join(f"{k} = {v}" for k, v in zip(rest, tail))
+            groups.append(f"({wsn_key} = {wsn} AND {match})")
+
+    clause += f"AND {int_predicate(wsn_key, by_wsn)} "
+    clause += f"AND ({' OR '.join(groups)})"
     return clause
 
 
 def create_selectors(
-    chunked_ids: List[List[Union[str, int]]], recipe: Dict[str, str]
+    chunked_ids: List[List[RecipeId]], recipe: Dict[str, Any]
 ) -> List[str]:
     """Create a list of SQL selectors based on recipe and chunked ids"""
     selectors = []
@@ -46,58 +131,48 @@ def create_selectors(
     return selectors
 
 
-ColTypes: TypeAlias = Union[
-    Literal["string", "int64", "float64", "bool", "datetime64[ns]", "object"], str
-]
+def id_wsn(item: RecipeId) -> int:
+    """The wsn (first) part of an id: 11 or (11, 22) ~~> 11"""
+    return item[0] if isinstance(item, tuple) else item
 
 
-def map_col_type(sql_type):
-    """
-    Map SQL data types to pandas data types.
-    """
-    type_map = {
-        int: "int64",
-        str: "string",
-        float: "float64",
-        bool: "bool",
-        type(None): "object",
-        "datetime64[ns]": "datetime64[ns]",
-    }
-    return type_map.get(sql_type, "object")
-
-
-def get_column_info(cursor: pyodbc.Cursor) -> Tuple[List[str], Dict[str, str]]:
-    """Return column names, types from pyodbc/SQLAnywhere"""
-    cursor_desc = cursor.description
-    column_names = [col[0] for col in cursor_desc]
-    column_types = {col[0]: map_col_type(col[1]) for col in cursor_desc}
-    return column_names, column_types
-
-
-def chunk_ids(ids, chunk):
+def chunk_ids(ids, chunk, first_chunk=None, split_groups=False):
     """
     [621, 826, 831, 834, 835, 838, 846, 847, 848]
     ...with chunk=4...
     [[621, 826, 831, 834], [835, 838, 846, 847], [848]]
 
-    ["1-62", "1-82", "2-83", "2-83", "2-83", "2-83", "2-84", "3-84", "4-84"]
+    [(1, 62), (1, 82), (2, 83), (2, 83), (2, 83), (2, 83), (2, 84), (3, 84)]
     ...with chunk=4...
     [
-        ['1-62', '1-82'],
-        ['2-83', '2-83', '2-83', '2-83', '2-84'],
-        ['3-84', '4-84']
+        [(1, 62), (1, 82)],
+        [(2, 83), (2, 83), (2, 83), (2, 83), (2, 84)],
+        [(3, 84)]
     ]
     Note how the group of 2's is kept together, even if it exceeds chunk=4
 
     :param ids: This is usually a list of wsn ints: [11, 22, 33, 44] but may
-        also be "compound" str : ['1-11', '1-22', '1-33', '2-22', '2-44'].
+        also be "compound" tuples: [(1, 11), (1, 22), (2, 22), (2, 44)].
     :param chunk: The preferred batch size to process in a single query
+    :param first_chunk: Optional smaller size for the first batch only, used
+        by streamed responses to get the first docs out quickly
+    :param split_groups: Sort ids by wsn and cut every chunk at exactly
+        chunk ids, even inside a group. Aggregation must then carry a split
+        group over to the next chunk (see post_process.GroupCarry).
     :return: List of id lists
     """
+    if split_groups:
+        ordered = sorted(ids, key=id_wsn)
+        limit = first_chunk or chunk
+        result = [ordered[:limit]] if ordered else []
+        for i in range(limit, len(ordered), chunk):
+            result.append(ordered[i : i + chunk])
+        return result
+
     id_groups = {}
 
     for item in ids:
-        left = str(item).split("-", maxsplit=1)[0]
+        left = id_wsn(item)
         if left not in id_groups:
             id_groups[left] = []
         id_groups[left].append(item)
@@ -105,12 +180,16 @@ def chunk_ids(ids, chunk):
     result = []
     current_subarray = []
 
+    limit = first_chunk or chunk
+
     for group in id_groups.values():
-        if len(current_subarray) + len(group) <= chunk:
+        if len(current_subarray) + len(group) <= limit:
             current_subarray.extend(group)
         else:
-            result.append(current_subarray)
+            if current_subarray:
+                result.append(current_subarray)
             current_subarray = group[:]
+            limit = chunk
 
     if current_subarray:
         result.append(current_subarray)
@@ -0,0 +1,240 @@
+"""The transform stage of a collection: formatting, curve windows, sentinel
+masking, sidecar references and post processing of one fetched chunk
+
+Chunks are transformed in the querying thread by default. With
+PURR_PETRA_TRANSFORM_PROCS > 0 (and pyarrow installed), JSON exports and
+streams hand each chunk to a pool of worker processes shared by all jobs,
+so concurrent exports are no longer serialized on one GIL: the fetched
+(typed) frame goes over as an Arrow IPC stream in a shared memory block,
+and the worker sends back its docs already serialized to JSON.
+
+Sidecar exports (the .bin file is written by this process) and chunks that
+Arrow cannot carry are transformed in this process, as are LAS exports.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+import pandas as pd
+from purr_petra.assets.collect.post_process import post_process
+from purr_petra.assets.collect.resample import resample_curves
+from purr_petra.assets.collect.schema import STRING_DTYPE, pyarrow as pa
+from purr_petra.assets.collect.sentinels import (
+    recipe_sentinels,
+    scrub_array_columns,
+    scrub_float_columns,
+)
+from purr_petra.assets.collect.sidecar import SidecarWriter
+from purr_petra.assets.collect.xformer import (
+    column_formatters,
+    formatters,
+    transform_dataframe_to_json,
+)
+from purr_petra.core.logger import logger
+from purr_petra.core.schemas import CurveWindow
+
+# worker processes for the transform stage (0: transform in the job's thread)
+TRANSFORM_PROCS = int(os.environ.get("PURR_PETRA_TRANSFORM_PROCS", "0"))
+
+pool: Optional[ProcessPoolExecutor] = None
+pool_lock = threading.Lock()
+
+
+def transform_frame(
+    df: pd.DataFrame,
+    recipe: Dict[str, Any],
+    window: Optional[CurveWindow] = None,
+    sidecar: Optional[SidecarWriter] = None,
+) -> pd.DataFrame:
+    """Format and post-process a chunk of fetched rows (see build_frame). A
+    wsn's rows must all be in the same chunk (see GroupCarry).
+
+    Args:
+        df (pd.DataFrame): typed rows, not empty
+        recipe (Dict[str, Any]): the asset recipe
+        window (Optional[CurveWindow]): depth window/resampling for curves
+        sidecar (Optional[SidecarWriter]): takes the recipe's sidecar columns
+
+    Returns:
+        pd.DataFrame: formatted (and aggregated) rows
+    """
+    xforms = recipe["xforms"]
+    sentinels = recipe_sentinels(recipe)
+
+    df = scrub_float_columns(df, recipe, sentinels)
+
+    for col in df.columns:
+        col_type = str(df.dtypes[col])
+
+        xform = xforms.get(col, col_type)
+
+        if xform in column_formatters:
+            df[col] = column_formatters[xform](df[col])
+            continue
+
+        formatter = formatters.get(xform, lambda x: x)
+
+        # pylint: disable=cell-var-from-loop
+        df[col] = df[col].apply(formatter)
+
+    # trim/resample curve digits before they are stored or serialized
+    if window is not None and recipe.get("curves"):
+        df = resample_curves(df, recipe["curves"], window)
+
+    df = scrub_array_columns(df, recipe, sentinels)
+
+    # swap bulky values for references into the binary sidecar
+    if sidecar is not None:
+        for col in recipe.get("sidecar", []):
+            if col in df.columns:
+                df[col] = df[col].map(sidecar.ref)
+
+    if postproc := recipe.get("post_process"):
+        post_processor = post_process[postproc]
+        if post_processor:
+            logger.info(f"post-processing: {postproc}")
+            df = post_processor(df)
+
+    return df
+
+
+def serialize_docs(
+    df: pd.DataFrame, recipe: Dict[str, Any], window: Optional[CurveWindow]
+) -> List[str]:
+    """Transform a chunk and serialize each of its docs to JSON"""
+    df = transform_frame(df, recipe, window)
+    docs = transform_dataframe_to_json(df, recipe["prefixes"])
+    return [json.dumps(doc, default=str) for doc in docs]
+
+
+################################################################################
+
+
+def arrow_dtype(arrow_type: Any) -> Any:
+    """Restore build_frame's dtypes when a shared chunk is read back"""
+    if pa.types.is_integer(arrow_type):
+        return pd.Int64Dtype()
+    if pa.types.is_boolean(arrow_type):
+        return pd.BooleanDtype()
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return STRING_DTYPE
+    return None
+
+
+def share_frame(df: pd.DataFrame) -> Optional[shared_memory.SharedMemory]:
+    """Write a chunk to a new shared memory block as an Arrow IPC stream
+
+    Args:
+        df (pd.DataFrame): typed rows from build_frame
+
+    Returns:
+        Optional[SharedMemory]: the block (its size is the stream's size,
+        rounded up by the OS), or None if Arrow cannot carry a column
+    """
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        logger.debug(f"transforming chunk in process: {e}")
+        return None
+
+    def write(sink: Any) -> None:
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    # size the stream first, then write it straight into the block
+    mock = pa.MockOutputStream()
+    write(mock)
+    block = shared_memory.SharedMemory(create=True, size=max(mock.size(), 1))
+    write(pa.FixedSizeBufferWriter(pa.py_buffer(block.buf)))
+    return block
+
+
+def transform_shared(
+    name: str, recipe: Dict[str, Any], window: Optional[CurveWindow]
+) -> List[str]:
+    """Worker: read a shared chunk (see share_frame) and serialize its docs
+
+    Args:
+        name (str): the shared memory block
+        recipe (Dict[str, Any]): the asset recipe
+        window (Optional[CurveWindow]): depth window/resampling for curves
+
+    Returns:
+        List[str]: one JSON doc per row, after post processing
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        # copied out, so no Arrow buffer outlives the block
+        data = bytes(block.buf)
+    finally:
+        block.close()
+    table = pa.ipc.open_stream(data).read_all()
+    df = table.to_pandas(types_mapper=arrow_dtype)
+    del table, data
+    return serialize_docs(df, recipe, window)
+
+
+def warn_if_unpooled() -> None:
+    """At startup: without pyarrow, TRANSFORM_PROCS starts no workers"""
+    if TRANSFORM_PROCS > 0 and pa is None:
+        logger.warning(
+            "pyarrow is not installed: PURR_PETRA_TRANSFORM_PROCS is ignored "
+            "and chunks are transformed in the job's thread"
+        )
+
+
+def transform_pool() -> Optional[ProcessPoolExecutor]:
+    """The shared worker pool, started on first use; None if disabled"""
+    global pool  # pylint: disable=global-statement
+    if TRANSFORM_PROCS <= 0 or pa is None:
+        return None
+    with pool_lock:
+        if pool is None:
+            logger.info(f"starting {TRANSFORM_PROCS} transform processes")
+            pool = ProcessPoolExecutor(max_workers=TRANSFORM_PROCS)
+        return pool
+
+
+def shutdown_transform_pool() -> None:
+    """Stop the worker pool (at app shutdown)"""
+    global pool  # pylint: disable=global-statement
+    with pool_lock:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+            pool = None
+
+
+def submit_chunk(
+    executor: ProcessPoolExecutor,
+    df: pd.DataFrame,
+    recipe: Dict[str, Any],
+    window: Optional[CurveWindow],
+) -> "Future[List[str]]":
+    """Start transforming a chunk in the pool (or here, if it cannot be
+    shared); its shared memory is released once the worker is done
+
+    Args:
+        executor (ProcessPoolExecutor): from transform_pool
+        df (pd.DataFrame): typed rows from build_frame
+        recipe (Dict[str, Any]): the asset recipe
+        window (Optional[CurveWindow]): depth window/resampling for curves
+
+    Returns:
+        Future[List[str]]: the chunk's JSON docs
+    """
+    block = None if df.empty else share_frame(df)
+    if block is None:
+        done: "Future[List[str]]" = Future()
+        done.set_result([] if df.empty else serialize_docs(df, recipe, window))
+        return done
+
+    def release(_: Future) -> None:
+        block.close()
+        block.unlink()
+
+    future = executor.submit(transform_shared, block.name, recipe, window)
+    future.add_done_callback(release)
+    return future
@@ -3,9 +3,10 @@
 import re
 import struct
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, List, Union, TypeAlias
+from typing import Any, Callable, Dict, Optional, List, Union, TypeAlias
 import pandas as pd
 import numpy as np
+from purr_petra.assets.collect.schema import STRING_DTYPE
 
 
 PURR_NULL = "_purrNULL_"
@@ -38,35 +39,32 @@ def unpack_int(buffer, start):
 ################################################################################
 
 
-def standardize_df_columns(df: pd.DataFrame, column_types: Dict[str, str]):
-    """todo"""
-    for col, col_type in column_types.items():
-        if "int" in col_type:
-            df[col] = df[col].apply(lambda x: None if pd.isna(x) else x)
-            df[col] = df[col].astype("Int64")
-        elif "str" in col_type:
-            df[col] = df[col].apply(lambda x: None if pd.isna(x) else x)
-            df[col] = df[col].astype("string")
-        else:
-            df[col] = df[col].astype(col_type)
-    return df
+CONTROL_CHARS = re.compile(r"[\u0000-\u001F\u007F-\u009F]")
 
 
-################################################################################
+def strip_control(x: str) -> str:
+    """Remove C0/C1 control chars; printable strings have none to remove"""
+    return x if x.isprintable() else CONTROL_CHARS.sub("", x)
 
 
 def safe_string(x: Optional[str]) -> Optional[str]:
     """remove control, non-printable chars, ensure UTF-8, strip whitespace."""
     if x is None:
         return None
-    if str(x) == "<NA>":  # probably pandas._libs.missing.NAType'
+    x = str(x)
+    if x == "<NA>":  # probably pandas._libs.missing.NAType'
         return None
-    cleaned = re.sub(r"[\u0000-\u001F\u007F-\u009F]", "", str(x))
+    cleaned = strip_control(x)
+    if cleaned.isascii():
+        # nothing to re-decode, and all ASCII left after cleaning is printable
+        return cleaned.strip()
     try:
         utf8_string = cleaned.encode("latin1").decode("utf-8")
     except UnicodeEncodeError:
         # If the string is already in UTF-8, use the cleaned version
         utf8_string = cleaned
+    if utf8_string.isprintable():
+        return utf8_string.strip()
     return "".join(char for char in utf8_string if char.isprintable()).strip()
 
 
@@ -96,9 +94,10 @@ def memo_to_string(x) -> Optional[str]:
     """Strip control chars from DBISAM memo, return str or None"""
     if x is None:
         return None
-    if str(x) == "<NA>":  # probably pandas._libs.missing.NAType'
+    x = str(x)
+    if x == "<NA>":  # probably pandas._libs.missing.NAType'
         return None
-    return re.sub(r"[\u0000-\u001F\u007F-\u009F]", "", str(x))
+    return strip_control(x)
 
 
 def blob_to_hex(x) -> Optional[str]:
@@ -226,6 +225,247 @@ def parse_zztops(x: Optional[bytes]) -> List[float]:
     return [unpack_double(x, i) for i in range(4, len(x), num_bytes)]
 
 
+################################################################################
+# Column-level blob decoders: a chunk's blobs are joined and viewed through a
+# NumPy structured dtype built from the same byte offsets as the per-cell
+# parsers above. Blobs too short (or ragged) for that fall back to the per-cell
+# parser, so output (and errors) match it exactly.
+
+# (name, format, start, end); "S" fields are NUL-terminated strings
+RecordFields: TypeAlias = List[tuple[str, str, int, int]]
+
+CONGRESS_SIZE = 412
+CONGRESS_FIELDS: RecordFields = [
+    ("township", "S", 4, 6),
+    ("township_ns", "S", 71, 72),
+    ("range", "S", 21, 23),
+    ("range_ew", "S", 70, 71),
+    ("section", "S", 38, 54),
+    ("section_suffix", "S", 54, 70),
+    ("meridian", "S", 153, 155),
+    ("footage_ref", "S", 137, 152),
+    ("spot", "S", 96, 136),
+    ("footage_call_ns", "<f8", 88, 96),
+    ("footage_call_ns_ref", "<i2", 76, 78),
+    ("footage_call_ew", "<f8", 80, 88),
+    ("footage_call_ew_ref", "<i2", 72, 74),
+    ("remarks", "S", 156, 412),
+]
+
+TREATMENT_SIZE = 110
+TREATMENT_FIELDS: RecordFields = [
+    ("type", "S", 0, 9),
+    ("top", "<f8", 9, 17),
+    ("base", "<f8", 17, 25),
+    ("amount1", "<f8", 25, 33),
+    ("units1", "S", 61, 65),
+    ("desc", "S", 68, 89),
+    ("agent", "S", 89, 96),
+    ("amount2", "<f8", 33, 41),
+    ("units2", "S", 96, 100),
+    ("fmbrk", "<f8", 41, 49),
+    ("num_stages", "<i4", 57, 61),
+    ("additive", "S", 103, 110),
+    ("inj_rate", "<f8", 49, 57),
+]
+
+RECOVERY_SIZE = 36
+RECOVERY_FIELDS: RecordFields = [
+    ("amount", "<f8", 0, 8),
+    ("units", "S", 8, 15),
+    ("descriptions", "S", 15, 36),
+]
+
+ZZTOPS_SIZE = 28
+ZZTOPS_OFFSET = 4
+
+# strings up to this wide are cut at their first NUL in bulk (wider ones, like
+# remarks, are cheaper to cut one by one)
+NUL_MASK_WIDTH = 32
+
+
+def is_blob(x: Any) -> bool:
+    """True for the bytes-like values pyodbc returns for BLOB columns"""
+    return isinstance(x, (bytes, bytearray, memoryview))
+
+
+def unpack_records(data: bytes, fields: RecordFields, size: int) -> List[Dict]:
+    """Decode back-to-back fixed-size records into dicts (in fields order)
+
+    Args:
+        data (bytes): a multiple of size bytes
+        fields (RecordFields): field names, formats and byte offsets
+        size (int): bytes per record
+
+    Returns:
+        List[Dict]: one dict per record
+    """
+    raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, size).copy()
+    for _, fmt, start, end in fields:
+        if fmt == "S" and end - start <= NUL_MASK_WIDTH:
+            # blank out everything after each string's first NUL
+            text = raw[:, start:end]
+            text[np.logical_or.accumulate(text == 0, axis=1)] = 0
+    dtype = np.dtype(
+        {
+            "names": [f[0] for f in fields],
+            "formats": [f"S{e - s}" if fmt == "S" else fmt for _, fmt, s, e in fields],
+            "offsets": [f[2] for f in fields],
+            "itemsize": size,
+        }
+    )
+    records = raw.view(dtype).ravel()
+
+    def decode(name: str, fmt: str, start: int, end: int) -> List[Any]:
+        values = records[name].tolist()
+        if fmt != "S":
+            return values
+        if end - start <= NUL_MASK_WIDTH:
+            return list(map(bytes.decode, values))
+        # S fields drop trailing NULs; cut each string at its first NUL
+        return [b.partition(b"\x00")[0].decode() for b in values]
+
+    columns = [decode(*field) for field in fields]
+    names = [f[0] for f in fields]
+    return [dict(zip(names, values)) for values in zip(*columns)]
+
+
+def record_column(
+    col: pd.Series,
+    fields: RecordFields,
+    size: int,
+    fallback: Callable[[Any], Any],
+    many: bool = False,
+) -> pd.Series:
+    """Decode a column of blobs, each holding one record (or, with many, a
+    run of back-to-back records returned as a list)
+
+    Args:
+        col (pd.Series): blobs (or None)
+        fields (RecordFields): field names, formats and byte offsets
+        size (int): bytes per record
+        fallback (Callable[[Any], Any]): the per-cell parser
+        many (bool): each blob holds zero or more records
+
+    Returns:
+        pd.Series: the same values fallback would give
+    """
+    values = col.tolist()
+    lengths = [len(x) if is_blob(x) else -1 for x in values]
+    sizes = np.array(lengths, dtype=np.int64)
+    if many:
+        ok = (sizes >= 0) & (sizes % size == 0)
+        counts = sizes // size
+    else:
+        ok = sizes >= size
+        counts = np.ones(len(values), dtype=np.int64)
+
+    out = [None] * len(values)
+    for i in np.flatnonzero(~ok).tolist():
+        out[i] = fallback(values[i])
+
+    bulk = np.flatnonzero(ok).tolist()
+    if bulk:
+        data = b"".join(
+            values[i] if many or lengths[i] == size else values[i][:size] for i in bulk
+        )
+        records = unpack_records(data, fields, size)
+        ends = np.cumsum(counts[ok]).tolist()
+        if many:
+            starts = [0] + ends[:-1]
+            for i, a, b in zip(bulk, starts, ends):
+                out[i] = records[a:b]
+        else:
+            for i, record in zip(bulk, records):
+                out[i] = record
+
+    return pd.Series(out, index=col.index, dtype=object)
+
+
+def congressional_column(col: pd.Series) -> pd.Series:
+    """Column-level parse_congressional"""
+    return record_column(col, CONGRESS_FIELDS, CONGRESS_SIZE, parse_congressional)
+
+
+def treatment_column(col: pd.Series) -> pd.Series:
+    """Column-level pdtest_treatment"""
+    return record_column(
+        col, TREATMENT_FIELDS, TREATMENT_SIZE, pdtest_treatment, many=True
+    )
+
+
+def recovery_column(col: pd.Series) -> pd.Series:
+    """Column-level fmtest_recovery"""
+    return record_column(
+        col, RECOVERY_FIELDS, RECOVERY_SIZE, fmtest_recovery, many=True
+    )
+
+
+def zztops_column(col: pd.Series) -> pd.Series:
+    """Column-level parse_zztops: gathers the double at byte 4 of every 28
+    byte record across the whole column at once"""
+    values = col.tolist()
+    out = [None] * len(values)
+    bulk, counts = [], []
+    for i, x in enumerate(values):
+        n = len(range(ZZTOPS_OFFSET, len(x), ZZTOPS_SIZE)) if is_blob(x) else 0
+        # the last double must be complete, or parse_zztops raises
+        if n and ZZTOPS_OFFSET + (n - 1) * ZZTOPS_SIZE + 8 <= len(x):
+            bulk.append(i)
+            counts.append(n)
+        else:
+            out[i] = parse_zztops(x)
+
+    if bulk:
+        blobs = [bytes(values[i]) for i in bulk]
+        data = np.frombuffer(b"".join(blobs), dtype=np.uint8)
+        ends = np.cumsum(counts)
+        # k-th top of a blob is at its base offset + ZZTOPS_OFFSET + k * 28
+        bases = np.cumsum([0] + [len(b) for b in blobs[:-1]])
+        k = np.arange(ends[-1]) - np.repeat(ends - counts, counts)
+        starts = np.repeat(bases, counts) + ZZTOPS_OFFSET + ZZTOPS_SIZE * k
+        tops = data[starts[:, None] + np.arange(8)].view("<f8").ravel().tolist()
+        for i, a, b in zip(bulk, (ends - counts).tolist(), ends.tolist()):
+            out[i] = tops[a:b]
+
+    return pd.Series(out, index=col.index, dtype=object)
+
+
+def string_column(col: pd.Series) -> pd.Series:
+    """Column-level safe_string. Repeated non-ASCII values (operators,
+    counties...) are only cleaned once per chunk."""
+    cleaned: Dict[str, Optional[str]] = {}
+
+    def clean(x: Any) -> Optional[str]:
+        if x is None:
+            return None
+        x = str(x)
+        if x.isascii():
+            return safe_string(x)
+        if x not in cleaned:
+            cleaned[x] = safe_string(x)
+        return cleaned[x]
+
+    return pd.Series(
+        pd.array(list(map(clean, col.tolist())), dtype=STRING_DTYPE), index=col.index
+    )
+
+
+def memo_column(col: pd.Series) -> pd.Series:
+    """Column-level memo_to_string"""
+    return pd.Series(
+        pd.array(list(map(memo_to_string, col.tolist())), dtype=STRING_DTYPE),
+        index=col.index,
+    )
+
+
+def nullable_column(col: pd.Series) -> pd.Series:
+    """Column-level safe_int/safe_float: Int64 and float64 columns from
+    build_frame are already clean, and their NA/NaN become None when
+    serialized (see none_if_null)"""
+    return col
+
+
 ################################################################################
 
 
@@ -257,28 +497,113 @@ def array_of_excel_date(x: Optional[str]) -> List[Optional[str]]:
     return [excel_date(v) if v != PURR_NULL else None for v in x.split(PURR_DELIM)]
 
 
+def map_unique(tokens: List[str], convert: Callable[[str], Any]) -> List[Any]:
+    """Convert each distinct token once (PURR_NULL to None), then look up the
+    rest; LIST columns repeat the same dates, units and names a lot"""
+    lookup = {t: convert(t) for t in set(tokens)}
+    lookup[PURR_NULL] = None
+    return list(map(lookup.__getitem__, tokens))
+
+
+def int_tokens(tokens: List[str]) -> List[Optional[int]]:
+    """array_of_int conversion for a flat list of tokens"""
+    try:
+        return [None if t == PURR_NULL else int(t) for t in tokens]
+    except ValueError:
+        return map_unique(tokens, safe_int)
+
+
+def float_tokens(tokens: List[str]) -> List[Optional[float]]:
+    """array_of_float conversion for a flat list of tokens (NaN is None)"""
+    try:
+        return [None if t == PURR_NULL or (v := float(t)) != v else v for t in tokens]
+    except ValueError:
+        return map_unique(tokens, safe_float)
+
+
+def delimited_column(
+    col: pd.Series,
+    convert: Callable[[List[str]], List[Any]],
+    fallback: Callable[[Any], List[Any]],
+) -> pd.Series:
+    """Parse a column of PURR_DELIM-joined LIST values in one pass: every
+    cell is split at once, all tokens are converted together, and each row
+    gets its slice of the result.
+
+    Args:
+        col (pd.Series): LIST strings (or nulls)
+        convert (Callable[[List[str]], List[Any]]): converts a flat token list
+        fallback (Callable[[Any], List[Any]]): the per-cell parser, for nulls
+
+    Returns:
+        pd.Series: the same lists fallback would give
+    """
+    values = col.tolist()
+    texts = [x for x in values if isinstance(x, str)]
+    converted = convert(PURR_DELIM.join(texts).split(PURR_DELIM)) if texts else []
+
+    out = []
+    end = 0
+    for x in values:
+        if isinstance(x, str):
+            start, end = end, end + x.count(PURR_DELIM) + 1
+            out.append(converted[start:end])
+        else:
+            out.append(fallback(x))
+    return pd.Series(out, index=col.index, dtype=object)
+
+
+def int_list_column(col: pd.Series) -> pd.Series:
+    """Column-level array_of_int"""
+    return delimited_column(col, int_tokens, array_of_int)
+
+
+def float_list_column(col: pd.Series) -> pd.Series:
+    """Column-level array_of_float"""
+    return delimited_column(col, float_tokens, array_of_float)
+
+
+def string_list_column(col: pd.Series) -> pd.Series:
+    """Column-level array_of_string"""
+    return delimited_column(
+        col, lambda tokens: map_unique(tokens, safe_string), array_of_string
+    )
+
+
+def excel_date_list_column(col: pd.Series) -> pd.Series:
+    """Column-level array_of_excel_date"""
+    return delimited_column(
+        col, lambda tokens: map_unique(tokens, excel_date), array_of_excel_date
+    )
+
+
 ###############################################################################
 
 
+def none_if_null(value: Any) -> Any:
+    """NaN, NA and NaT scalars (left in typed columns) to None; NumPy arrays
+    to lists, with NaN samples (see sentinels) as None"""
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "f" and np.isnan(value).any():
+            value = np.where(np.isnan(value), None, value)
+        return value.tolist()
+    if isinstance(value, (list, dict, bytes, bytearray)):
+        return value
+    return None if pd.isna(value) else value
+
+
 def series_row_to_json(
-    row: pd.Series, prefix_mapping: Dict[str, str]
+    row: Union[pd.Series, Dict[str, Any]], prefix_mapping: Dict[str, str]
 ) -> Dict[str, Any]:
-    """Convert a pandas Series row to a JSON-like dictionary structure."""
+    """Convert a pandas Series row (or a dict, see inline) to a JSON-like
+    dictionary structure."""
     result: Dict[str, Dict[str, Union[None, int, float, str, List[Any]]]] = {}
     for column, value in row.items():
-        if isinstance(value, np.ndarray):
-            value = value.tolist()
-
-        # Handle list of numpy arrays
-        elif isinstance(value, list):
-            value = [
-                item.tolist() if isinstance(item, np.ndarray) else item
-                for item in value
-            ]
-
-        elif not isinstance(value, list):
-            if pd.isna(value):
-                value = None
+        # Handle list of numpy arrays (or aggregated scalars)
+        if isinstance(value, list):
+            value = [none_if_null(item) for item in value]
+        else:
+            value = none_if_null(value)
 
         for prefix, table_name in prefix_mapping.items():
             if column.startswith(prefix):
@@ -292,8 +617,24 @@ def series_row_to_json(
 def transform_dataframe_to_json(
     df: pd.DataFrame, prefix_mapping: Dict[str, str]
 ) -> List[Dict[str, Dict[str, Union[None, int, float, str, List[Any]]]]]:
-    """Convert a DataFrame to a list of JSON-like dictionary structures."""
-    return [series_row_to_json(row, prefix_mapping) for _, row in df.iterrows()]
+    """Convert a DataFrame to a list of JSON-like dictionary structures.
+
+    Same docs as series_row_to_json on each row, but built a column at a
+    time: typed (Arrow, Int64...) columns are converted once each, instead of
+    the whole frame being cast to object for iterrows."""
+    docs: List[Dict[str, Any]] = [{} for _ in range(len(df))]
+    for column in df.columns:
+        prefix = next((p for p in prefix_mapping if column.startswith(p)), None)
+        if prefix is None:
+            continue
+        table_name, key = prefix_mapping[prefix], column[len(prefix) :]
+        for doc, value in zip(docs, df[column].tolist()):
+            if isinstance(value, list):
+                value = [none_if_null(item) for item in value]
+            else:
+                value = none_if_null(value)
+            doc.setdefault(table_name, {})[key] = value
+    return docs
 
 
 ###############################################################################
@@ -316,3 +657,19 @@ formatters = {
     "pdtest_treatment": pdtest_treatment,
     "parse_zztops": parse_zztops,
 }
+
+# xforms that decode a whole column at once (see record_column)
+column_formatters = {
+    "Int64": nullable_column,
+    "float64": nullable_column,
+    "string": string_column,
+    "memo_to_string": memo_column,
+    "array_of_int": int_list_column,
+    "array_of_float": float_list_column,
+    "array_of_string": string_list_column,
+    "array_of_excel_date": excel_date_list_column,
+    "parse_congressional": congressional_column,
+    "fmtest_recovery": recovery_column,
+    "pdtest_treatment": treatment_column,
+    "parse_zztops": zztops_column,
+}
@@ -1,9 +1,12 @@
 """SQLite database CRUD"""
 
+import os
 import tempfile
-from typing import Dict, Union, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, Union, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import insert, update
+from sqlalchemy import delete, func, insert, or_, select, text, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 import purr_petra.core.models as models
 from purr_petra.core.logger import logger
@@ -87,6 +90,8 @@ def upsert_repos(db: Session, repos: List[models.Repo]) -> List[models.Repo]:
         List[models.Repo]: List of updated Repo objects
     """
     logger.info(f"Upserting {len(repos)} repos")
+    if not repos:
+        return []
     stmt = sqlite_insert(models.Repo).values(repos)
     update_dict = {c.name: c for c in stmt.excluded if c.name != "id"}
     stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=update_dict)
@@ -135,3 +140,461 @@ def fetch_repo_ids(db: Session) -> List[str]:
     """
     repo_ids = db.query(models.Repo.id).all()
     return [repo_id[0] for repo_id in repo_ids]
+
+
+def create_task(db: Session, task: Dict[str, Any]) -> models.Task:
+    """Insert a new (pending) Task, owned by this worker process
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        task (Dict[str, Any]): Task columns; at least id, kind and task_status
+
+    Returns:
+        models.Task: The new Task
+    """
+    now = datetime.now()
+    new_task = models.Task(
+        created=now,
+        updated=now,
+        **{"progress": {}, "worker_pid": os.getpid(), **task},
+    )
+    db.add(new_task)
+    db.commit()
+    db.refresh(new_task)
+    return new_task
+
+
+def find_active_task(db: Session, request_key: str) -> Optional[models.Task]:
+    """Fetch the pending or in_progress Task for a normalized request, if any
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        request_key (str): Normalized request key
+
+    Returns:
+        Optional[models.Task]: The active Task, or None
+    """
+    return (
+        db.query(models.Task)
+        .filter(models.Task.request_key == request_key)
+        .filter(models.Task.task_status.in_(["pending", "in_progress"]))
+        .first()
+    )
+
+
+def create_or_attach_task(
+    db: Session, task: Dict[str, Any]
+) -> Tuple[models.Task, bool]:
+    """Insert a new Task unless an identical request (same request_key) is
+    already active, in which case the caller attaches to that Task instead.
+    A partial unique index settles the race between workers.
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        task (Dict[str, Any]): Task columns, including request_key
+
+    Returns:
+        Tuple[models.Task, bool]: The Task, and True if it was newly created
+    """
+    for _ in range(3):
+        if leader := find_active_task(db, task["request_key"]):
+            return leader, False
+        try:
+            return create_task(db, task), True
+        except IntegrityError:
+            db.rollback()
+    # the active Task kept finishing between lookup and insert; run a new one
+    return create_task(db, {**task, "request_key": None}), True
+
+
+def get_task(db: Session, task_id: str, kind: str) -> Optional[models.Task]:
+    """Fetch a specific Task based on its ID and kind
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        task_id (str): A Task.id (uuid) string
+        kind (str): "asset" or "recon"
+
+    Returns:
+        Optional[models.Task]: The selected Task, or None
+    """
+    return db.query(models.Task).filter_by(id=task_id, kind=kind).first()
+
+
+def transition_task(
+    db: Session,
+    task_id: str,
+    to_status: str,
+    from_statuses: List[str],
+    **values: Any,
+) -> bool:
+    """Atomically move a Task to a new status, but only if it is currently in
+    one of from_statuses. Concurrent writers (e.g. a cancel request racing the
+    worker finishing the job) cannot both win.
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        task_id (str): A Task.id (uuid) string
+        to_status (str): The new TaskStatus value
+        from_statuses (List[str]): TaskStatus values the transition is valid from
+        **values: Other columns to set, e.g. task_message
+
+    Returns:
+        bool: True if the transition happened
+    """
+    stmt = (
+        update(models.Task)
+        .where(models.Task.id == task_id)
+        .where(models.Task.task_status.in_(from_statuses))
+        .values(task_status=to_status, updated=datetime.now(), **values)
+    )
+    res = db.execute(stmt)
+    db.commit()
+    return res.rowcount == 1
+
+
+def update_task_progress(db: Session, task_id: str, progress: Dict[str, Any]):
+    """Save the latest progress snapshot of a running Task
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        task_id (str): A Task.id (uuid) string
+        progress (Dict[str, Any]): A dumped TaskProgress
+    """
+    stmt = (
+        update(models.Task)
+        .where(models.Task.id == task_id)
+        .values(progress=progress, updated=datetime.now())
+    )
+    db.execute(stmt)
+    db.commit()
+
+
+def request_task_cancel(db: Session, task_id: str, active: List[str]) -> bool:
+    """Flag an active Task for cancellation; the worker running it stops at
+    its next checkpoint.
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        task_id (str): A Task.id (uuid) string
+        active (List[str]): TaskStatus values that can still be cancelled
+
+    Returns:
+        bool: True if the Task was active and is now flagged
+    """
+    stmt = (
+        update(models.Task)
+        .where(models.Task.id == task_id)
+        .where(models.Task.task_status.in_(active))
+        .values(cancel_requested=True, updated=datetime.now())
+    )
+    res = db.execute(stmt)
+    db.commit()
+    return res.rowcount == 1
+
+
+def is_task_cancel_requested(db: Session, task_id: str) -> bool:
+    """Check a Task's cancel flag (indexed primary key lookup)
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        task_id (str): A Task.id (uuid) string
+
+    Returns:
+        bool: True if cancellation was requested
+    """
+    stmt = select(models.Task.cancel_requested).where(models.Task.id == task_id)
+    return bool(db.execute(stmt).scalar())
+
+
+def get_active_tasks(db: Session, active: List[str]) -> List[models.Task]:
+    """Select every Task that has not finished
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        active (List[str]): TaskStatus values considered active
+
+    Returns:
+        List[models.Task]: The active Tasks
+    """
+    return db.query(models.Task).filter(models.Task.task_status.in_(active)).all()
+
+
+def evict_expired_tasks(db: Session, ttl_seconds: int, finished: List[str]) -> int:
+    """Delete finished Tasks not touched within ttl_seconds
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        ttl_seconds (int): How long finished Tasks remain available to poll
+        finished (List[str]): TaskStatus values considered finished
+
+    Returns:
+        int: Number of Tasks deleted
+    """
+    cutoff = datetime.now() - timedelta(seconds=ttl_seconds)
+    stmt = (
+        delete(models.Task)
+        .where(models.Task.task_status.in_(finished))
+        .where(models.Task.updated < cutoff)
+    )
+    res = db.execute(stmt)
+    db.commit()
+    if res.rowcount:
+        logger.info(f"Evicted {res.rowcount} expired tasks")
+    return res.rowcount
+
+
+def count_tasks(
+    db: Session,
+    statuses: List[str],
+    repo_id: Optional[str] = None,
+    lane: Optional[str] = None,
+) -> int:
+    """Count Tasks in the given statuses, optionally for one repo or lane
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        statuses (List[str]): TaskStatus values to count
+        repo_id (Optional[str]): Only count Tasks for this Repo.id
+        lane (Optional[str]): Only count Tasks in this scheduler lane
+
+    Returns:
+        int: Number of matching Tasks
+    """
+    stmt = select(func.count()).where(models.Task.task_status.in_(statuses))
+    if repo_id is not None:
+        stmt = stmt.where(models.Task.repo_id == repo_id)
+    if lane is not None:
+        stmt = stmt.where(models.Task.lane == lane)
+    return db.execute(stmt).scalar_one()
+
+
+def queue_position(db: Session, task: models.Task) -> Optional[int]:
+    """1-based position of a pending Task among pending Tasks in its lane
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        task (models.Task): A Task
+
+    Returns:
+        Optional[int]: Queue position, or None if the Task is not pending
+    """
+    if task.task_status != "pending":
+        return None
+    stmt = (
+        select(func.count())
+        .where(models.Task.task_status == "pending")
+        .where(models.Task.lane == task.lane)
+        .where(models.Task.created < task.created)
+    )
+    return db.execute(stmt).scalar_one() + 1
+
+
+def get_export(db: Session, key: str) -> Optional[models.Export]:
+    """Fetch a previous Export by its content key
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        key (str): Export key (see export_key)
+
+    Returns:
+        Optional[models.Export]: The Export, or None
+    """
+    return db.query(models.Export).filter_by(key=key).first()
+
+
+def save_export(db: Session, export: Dict[str, Any]) -> None:
+    """Record (or replace) the Export for a content key
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        export (Dict[str, Any]): Export columns, including key and out_file
+    """
+    stmt = sqlite_insert(models.Export).values(created=datetime.now(), **export)
+    update_dict = {c.name: c for c in stmt.excluded if c.name != "key"}
+    stmt = stmt.on_conflict_do_update(index_elements=["key"], set_=update_dict)
+    db.execute(stmt)
+    db.commit()
+
+
+def delete_export(db: Session, key: str) -> None:
+    """Forget an Export, e.g. when its depot file has been removed
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        key (str): Export key
+    """
+    db.execute(delete(models.Export).where(models.Export.key == key))
+    db.commit()
+
+
+def replace_well_index(
+    db: Session, repo_id: str, fingerprint: str, wells: List[Dict[str, Any]]
+) -> None:
+    """Swap in a freshly built WellIndex for a Repo (in one transaction)
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        repo_id (str): A Repo.id string
+        fingerprint (str): Repo fingerprint taken before the wells were read
+        wells (List[Dict[str, Any]]): wsn, uwi, sortname, label, lon, lat,
+            api, api10 and chgdate per well
+    """
+    params = {"repo_id": repo_id}
+    db.execute(
+        text(
+            "DELETE FROM well_rtree WHERE id IN "
+            "(SELECT rowid FROM well_index WHERE repo_id = :repo_id)"
+        ),
+        params,
+    )
+    db.execute(delete(models.WellIndex).where(models.WellIndex.repo_id == repo_id))
+    if wells:
+        db.execute(insert(models.WellIndex), [{"repo_id": repo_id, **w} for w in wells])
+        db.execute(
+            text(
+                "INSERT INTO well_rtree "
+                "SELECT rowid, lon, lon, lat, lat FROM well_index "
+                "WHERE repo_id = :repo_id AND lon IS NOT NULL AND lat IS NOT NULL"
+            ),
+            params,
+        )
+    stmt = sqlite_insert(models.WellIndexBuild).values(
+        repo_id=repo_id, fingerprint=fingerprint, wells=len(wells), built=datetime.now()
+    )
+    update_dict = {c.name: c for c in stmt.excluded if c.name != "repo_id"}
+    stmt = stmt.on_conflict_do_update(index_elements=["repo_id"], set_=update_dict)
+    db.execute(stmt)
+    db.commit()
+    logger.info(f"Indexed {len(wells)} wells for {repo_id}")
+
+
+def get_well_index_build(db: Session, repo_id: str) -> Optional[models.WellIndexBuild]:
+    """Fetch the WellIndexBuild for a Repo, if its wells have been indexed
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        repo_id (str): A Repo.id string
+
+    Returns:
+        Optional[models.WellIndexBuild]: The WellIndexBuild, or None
+    """
+    return db.query(models.WellIndexBuild).filter_by(repo_id=repo_id).first()
+
+
+def resolve_wsns(db: Session, repo_id: str, uwi_list: List[str]) -> List[int]:
+    """Resolve UWI patterns (as from parse_uwis, with % and _ wildcards) to
+    wsns using the local WellIndex. An empty uwi_list selects every well.
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        repo_id (str): A Repo.id string
+        uwi_list (List[str]): UWI strings with optional wildcard chars
+
+    Returns:
+        List[int]: Sorted, distinct wsns
+    """
+    stmt = select(models.WellIndex.wsn).where(models.WellIndex.repo_id == repo_id)
+    if uwi_list:
+        stmt = stmt.where(or_(*[models.WellIndex.uwi.like(u) for u in uwi_list]))
+    stmt = stmt.distinct().order_by(models.WellIndex.wsn)
+    return list(db.execute(stmt).scalars())
+
+
+def wells_in_bounds(
+    db: Session, repo_id: str, bounds: Tuple[float, float, float, float]
+) -> List[Tuple[int, float, float]]:
+    """Find a Repo's indexed wells whose surface location is inside a bounding
+    box, using the well_rtree spatial index. R*Tree stores 32-bit floats, so
+    this may include wells just outside the box; check lon and lat exactly.
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        repo_id (str): A Repo.id string
+        bounds (Tuple[float, float, float, float]): min_lon, min_lat, max_lon,
+            max_lat (as from shapely's geometry.bounds)
+
+    Returns:
+        List[Tuple[int, float, float]]: wsn, lon and lat of each well
+    """
+    min_lon, min_lat, max_lon, max_lat = bounds
+    stmt = text(
+        "SELECT i.wsn, i.lon, i.lat FROM well_rtree r "
+        "JOIN well_index i ON i.rowid = r.id "
+        "WHERE r.max_lon >= :min_lon AND r.min_lon <= :max_lon "
+        "AND r.max_lat >= :min_lat AND r.min_lat <= :max_lat "
+        "AND i.repo_id = :repo_id"
+    )
+    params = {
+        "repo_id": repo_id,
+        "min_lon": min_lon,
+        "max_lon": max_lon,
+        "min_lat": min_lat,
+        "max_lat": max_lat,
+    }
+    return [tuple(row) for row in db.execute(stmt, params)]
+
+
+def lookup_wells(
+    db: Session, api10: Optional[str] = None, uwi: Optional[str] = None
+) -> List[Tuple[models.WellIndex, str]]:
+    """Find a well in every indexed Repo: by 10-digit surface API if the UWI
+    is API-like (matching any sidetrack or format), otherwise by exact UWI
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        api10 (Optional[str]): A surface API (see surface_api)
+        uwi (Optional[str]): A UWI, used when api10 is None
+
+    Returns:
+        List[Tuple[models.WellIndex, str]]: Each indexed copy of the well,
+        with its Repo name
+    """
+    stmt = select(models.WellIndex, models.Repo.name).join(
+        models.Repo, models.Repo.id == models.WellIndex.repo_id
+    )
+    if api10 is not None:
+        stmt = stmt.where(models.WellIndex.api10 == api10)
+    else:
+        stmt = stmt.where(models.WellIndex.uwi == uwi)
+    stmt = stmt.order_by(models.WellIndex.chgdate.desc(), models.WellIndex.repo_id)
+    return [tuple(row) for row in db.execute(stmt)]
+
+
+def find_duplicate_wells(
+    db: Session, limit: int = 100, offset: int = 0, surface: bool = False
+) -> List[Tuple[models.WellIndex, str]]:
+    """Find wellbores (by full 14-digit API) indexed in more than one Repo, or
+    with surface, surface wells (by 10-digit API, so sidetracks match)
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        limit (int): Most duplicated APIs to return
+        offset (int): Duplicated APIs to skip, for paging
+        surface (bool): Match on the surface API (api10) instead of the api
+
+    Returns:
+        List[Tuple[models.WellIndex, str]]: Every copy of each duplicated API,
+        with its Repo name, ordered by API and newest chgdate first
+    """
+    key = models.WellIndex.api10 if surface else models.WellIndex.api
+    dupes = (
+        select(key)
+        .where(key.is_not(None))
+        .group_by(key)
+        .having(func.count(models.WellIndex.repo_id.distinct()) > 1)
+        .order_by(key)
+        .limit(limit)
+        .offset(offset)
+    )
+    stmt = (
+        select(models.WellIndex, models.Repo.name)
+        .join(models.Repo, models.Repo.id == models.WellIndex.repo_id)
+        .where(key.in_(dupes.scalar_subquery()))
+        .order_by(
+            key,
+            models.WellIndex.chgdate.desc(),
+            models.WellIndex.repo_id,
+        )
+    )
+    return [tuple(row) for row in db.execute(stmt)]
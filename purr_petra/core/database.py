@@ -1,17 +1,57 @@
 """SQLAlchemy configuration (SQLite)"""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 import purr_petra.core.models as models
+from purr_petra.core.logger import logger
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./purr_petra.sqlite"
 
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False, "timeout": 30}
 )
+
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragma(dbapi_connection, _connection_record):
+    """WAL lets the uvicorn workers read (task status, repos) while another
+    worker writes, so the sqlite file can be shared across processes."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-models.Base.metadata.create_all(bind=engine)
+# tables of transient or derived state, dropped (with the tables derived from
+# them) and created afresh when an existing purr_petra.sqlite has other columns
+# (create_all never alters a table). A dropped well index is rebuilt by recon.
+REBUILT_TABLES = {
+    "tasks": [],
+    "well_index": ["well_index_builds", "well_rtree"],
+}
+
+
+def rebuild_outdated_tables(conn) -> None:
+    """Drop any REBUILT_TABLES whose columns differ from the models"""
+    for name, derived in REBUILT_TABLES.items():
+        table = models.Base.metadata.tables[name]
+        rows = conn.execute(text(f"PRAGMA table_info({name})")).fetchall()
+        existing = {row[1] for row in rows}
+        if existing and existing != {c.name for c in table.columns}:
+            logger.warning(f"rebuilding outdated table: {name}")
+            for other in derived:
+                conn.execute(text(f"DROP TABLE IF EXISTS {other}"))
+            table.drop(conn)
+
+
+with engine.begin() as conn:
+    rebuild_outdated_tables(conn)
+    models.Base.metadata.create_all(bind=conn)
+
+with engine.begin() as conn:
+    conn.execute(text(models.WELL_RTREE))
 
 
 def get_db():
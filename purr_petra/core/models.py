@@ -1,6 +1,16 @@
 """SQLAlchemy Model definition"""
 
-from sqlalchemy import Boolean, Column, Integer, String, JSON, TIMESTAMP
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Float,
+    Integer,
+    String,
+    JSON,
+    TIMESTAMP,
+    Index,
+    text,
+)
 
 # from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import DeclarativeBase
@@ -58,3 +68,103 @@ class Settings(Base):
         nullable=True,
         server_default="C:/temp",
     )
+
+
+class Task(Base):
+    """Definition of SQLAlchemy Task object (asset and recon jobs). Shared by
+    all uvicorn workers, so any worker can answer a status poll."""
+
+    __tablename__ = "tasks"
+
+    id = Column(String, primary_key=True, index=True, unique=True)
+    kind = Column(String, nullable=False)
+    task_status = Column(String, nullable=False)
+    repo_id = Column(String)
+    lane = Column(String)
+    request_key = Column(String)
+    task_message = Column(JSON)
+    recon_root = Column(String)
+    progress = Column(JSON)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    # the uvicorn worker that runs it (see fail_orphaned_tasks)
+    worker_pid = Column(Integer)
+    created = Column(TIMESTAMP, nullable=False)
+    updated = Column(TIMESTAMP, nullable=False)
+
+    __table_args__ = (
+        Index("ix_tasks_kind_status", "kind", "task_status"),
+        Index("ix_tasks_status_updated", "task_status", "updated"),
+        Index("ix_tasks_status_lane_created", "task_status", "lane", "created"),
+        Index("ix_tasks_repo_status", "repo_id", "task_status"),
+        # at most one active task per normalized request (see coalescing)
+        Index(
+            "ux_tasks_active_request_key",
+            "request_key",
+            unique=True,
+            sqlite_where=text("task_status IN ('pending', 'in_progress')"),
+        ),
+    )
+
+
+class Export(Base):
+    """Definition of SQLAlchemy Export object: a finished export file keyed by
+    what went into it (repo fingerprint, asset, filter and format), so an
+    identical request against an unchanged repo can reuse the file."""
+
+    __tablename__ = "exports"
+
+    key = Column(String, primary_key=True, index=True, unique=True)
+    repo_id = Column(String, nullable=False)
+    asset = Column(String, nullable=False)
+    fingerprint = Column(String, nullable=False)
+    out_file = Column(String, nullable=False)
+    task_message = Column(JSON)
+    created = Column(TIMESTAMP, nullable=False)
+
+    __table_args__ = (Index("ix_exports_repo_asset", "repo_id", "asset"),)
+
+
+class WellIndex(Base):
+    """Definition of SQLAlchemy WellIndex object: a local copy of each repo's
+    well identifiers, so UWI filters resolve to wsns without touching DBISAM.
+    Across all repos it doubles as the well catalog (see api and api10)."""
+
+    __tablename__ = "well_index"
+
+    repo_id = Column(String, primary_key=True)
+    wsn = Column(Integer, primary_key=True)
+    uwi = Column(String)
+    sortname = Column(String)
+    label = Column(String)
+    lon = Column(Float)
+    lat = Column(Float)
+    api = Column(String)
+    api10 = Column(String)
+    chgdate = Column(TIMESTAMP)
+
+    __table_args__ = (
+        Index("ix_well_index_repo_uwi", "repo_id", "uwi"),
+        Index("ix_well_index_uwi", "uwi"),
+        Index("ix_well_index_api", "api", "repo_id"),
+        Index("ix_well_index_api10", "api10", "repo_id"),
+    )
+
+
+# R*Tree over WellIndex surface locations, keyed by well_index.rowid. Virtual
+# tables are outside the ORM, so database.py creates it after create_all.
+WELL_RTREE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS well_rtree "
+    "USING rtree(id, min_lon, max_lon, min_lat, max_lat)"
+)
+
+
+class WellIndexBuild(Base):
+    """Definition of SQLAlchemy WellIndexBuild object: when a repo's WellIndex
+    was built, and the repo fingerprint it is valid for"""
+
+    __tablename__ = "well_index_builds"
+
+    repo_id = Column(String, primary_key=True, index=True, unique=True)
+    fingerprint = Column(String, nullable=False)
+    wells = Column(Integer, nullable=False)
+    built = Column(TIMESTAMP, nullable=False)
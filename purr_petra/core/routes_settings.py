@@ -3,33 +3,54 @@
 import asyncio
 import json
 import uuid
-from typing import Dict
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Dict, List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 import purr_petra.core.schemas as schemas
 import purr_petra.core.crud as crud
 from purr_petra.core.database import get_db
-from purr_petra.core.util import is_valid_dir
+from purr_petra.core.util import is_valid_dir, normalize_api, surface_api
+from purr_petra.core.scheduler import Lane, admit, scheduler
+from purr_petra.core.tasks import (
+    ProgressTracker,
+    TaskCancelled,
+    cancel_task,
+    describe_task,
+    evict_tasks,
+    finish_task,
+    start_task,
+)
 
 from purr_petra.recon.recon import repo_recon
 from purr_petra.core.logger import logger
 
 router = APIRouter()
 
-task_storage: Dict[str, schemas.RepoReconResponse] = {}
-
 
 async def process_repo_recon(task_id: str, recon_root: str):
-    """Trigger repo_recon and update task_storage"""
+    """Wait for a (bulk) scheduler slot, trigger repo_recon and update the
+    task's status"""
+    async with scheduler.slot(Lane.BULK):
+        await run_repo_recon_task(task_id, recon_root)
+
+
+async def run_repo_recon_task(task_id: str, recon_root: str):
+    """Trigger repo_recon and update the task's status"""
     try:
-        task_storage[task_id].task_status = schemas.TaskStatus.IN_PROGRESS
-        repos = await repo_recon(recon_root)
+        if not start_task(task_id):
+            logger.info(f"Task cancelled before start: {task_id}")
+            return
+        tracker = ProgressTracker(task_id)
+        repos = await repo_recon(recon_root, task_id, tracker)
         for r in repos:
             logger.info(json.dumps(r, indent=4))
 
-        task_storage[task_id].task_status = schemas.TaskStatus.COMPLETED
+        finish_task(task_id, schemas.TaskStatus.COMPLETED)
+    except TaskCancelled:
+        finish_task(task_id, schemas.TaskStatus.CANCELLED)
+        logger.info(f"Task cancelled: {task_id}")
     except Exception as e:  # pylint: disable=broad-except
-        task_storage[task_id].task_status = schemas.TaskStatus.FAILED
+        finish_task(task_id, schemas.TaskStatus.FAILED, task_message=str(e))
         logger.error(f"Task failed for {task_id}: {str(e)}")
 
 
@@ -125,6 +146,95 @@ def get_repo_by_id(repo_id: str, db: Session = Depends(get_db)):
     return repo
 
 
+# WELLS #######################################################################
+
+
+def well_copy(well, repo_name: str) -> schemas.WellCopy:
+    """Build a WellCopy from an indexed well and its Repo name"""
+    return schemas.WellCopy(
+        repo_id=well.repo_id,
+        repo_name=repo_name,
+        wsn=well.wsn,
+        uwi=well.uwi,
+        api=well.api,
+        api10=well.api10,
+        label=well.label,
+        chgdate=well.chgdate,
+    )
+
+
+@router.get(
+    "/wells/lookup",
+    response_model=schemas.WellLookup,
+    summary="Find every Repo containing a well",
+    description=(
+        "Look up a UWI in the well catalog built by repo recon. API-like UWIs "
+        "(10, 12 or 14 digits, dashes optional) match any copy of the same "
+        "10-digit surface API, sidetracks included (compare each copy's full "
+        "14-digit api); anything else must match exactly. Copies are newest "
+        "(by chgdate) first."
+    ),
+)
+def lookup_well(
+    uwi: str = Query(..., min_length=3, description="UWI or API number"),
+    db: Session = Depends(get_db),
+):
+    """Find every Repo containing a well"""
+    api10 = surface_api(normalize_api(uwi))
+    rows = crud.lookup_wells(db, api10=api10, uwi=uwi.strip())
+    return schemas.WellLookup(
+        uwi=uwi, api10=api10, copies=[well_copy(w, name) for w, name in rows]
+    )
+
+
+@router.get(
+    "/wells/duplicates",
+    response_model=list[schemas.WellDuplicate],
+    summary="List wells found in more than one Repo",
+    description=(
+        "Report wellbores (by full 14-digit API, a 10 or 12-digit UWI padded "
+        "with zeros) that appear in more than one Repo, with each copy's "
+        "chgdate so you can see which Repo is most current. With surface=true, "
+        "report surface wells (by 10-digit API) instead, so different "
+        "sidetracks of the same well are grouped as the same surface well. "
+        "Use limit and offset to page through the report."
+    ),
+)
+def well_duplicates(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    surface: bool = Query(False, description="group by 10-digit surface API"),
+    db: Session = Depends(get_db),
+):
+    """List wells found in more than one Repo"""
+    groups: Dict[str, List[schemas.WellCopy]] = {}
+    for well, repo_name in crud.find_duplicate_wells(db, limit, offset, surface):
+        key = well.api10 if surface else well.api
+        groups.setdefault(key, []).append(well_copy(well, repo_name))
+
+    report = []
+    for api, copies in groups.items():
+        dates = [c.chgdate for c in copies if c.chgdate is not None]
+        newest = max(dates) if dates else None
+        oldest = min(dates) if dates else None
+        report.append(
+            schemas.WellDuplicate(
+                api=api,
+                surface=surface,
+                repo_count=len({c.repo_id for c in copies}),
+                newest_chgdate=newest,
+                oldest_chgdate=oldest,
+                chgdate_spread_days=(
+                    round((newest - oldest).total_seconds() / 86400, 2)
+                    if dates
+                    else None
+                ),
+                copies=copies,
+            )
+        )
+    return report
+
+
 # REPOS RECON #################################################################
 
 
@@ -141,7 +251,7 @@ def get_repo_by_id(repo_id: str, db: Session = Depends(get_db)):
     ),
     status_code=status.HTTP_202_ACCEPTED,
 )
-async def run_repo_recon(recon_root: str):
+async def run_repo_recon(recon_root: str, db: Session = Depends(get_db)):
     """Scan network path for Petra projects"""
     valid_recon_root = is_valid_dir(recon_root)
     if not valid_recon_root:
@@ -149,18 +259,25 @@ async def run_repo_recon(recon_root: str):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid directory: {recon_root}",
         )
+    evict_tasks()
+    admit(db)
+
     task_id = str(uuid.uuid4())
-    new_repo_recon = schemas.RepoReconResponse(
-        id=task_id,
-        recon_root=valid_recon_root,
-        task_status=schemas.TaskStatus.PENDING,
+    new_repo_recon = crud.create_task(
+        db,
+        {
+            "id": task_id,
+            "kind": "recon",
+            "lane": Lane.BULK.value,
+            "recon_root": valid_recon_root,
+            "task_status": schemas.TaskStatus.PENDING.value,
+        },
     )
-    task_storage[task_id] = new_repo_recon
 
     # do not await create_task, or it will block the 202 response
     # noinspection PyAsyncCall
     asyncio.create_task(process_repo_recon(task_id, valid_recon_root))
-    return new_repo_recon
+    return describe_task(db, new_repo_recon, schemas.RepoReconResponse)
 
 
 @router.get(
@@ -170,11 +287,38 @@ async def run_repo_recon(recon_root: str):
     description=(
         "A recon job may take several minutes, so use the task_id returned "
         "by the original POST to (periodically) check the job status. Possible "
-        "status values are: pending, in_progress, completed or failed."
+        "status values are: pending, in_progress, completed, failed or "
+        "cancelled."
     ),
 )
-async def get_repo_recon_status(task_id: str):
+async def get_repo_recon_status(task_id: str, db: Session = Depends(get_db)):
     """Check the status of a /repos/recon job using the task_id"""
-    if task_id not in task_storage:
+    task = crud.get_task(db, task_id, "recon")
+    if task is None:
+        raise HTTPException(status_code=404, detail="repo recon not found")
+    return describe_task(db, task, schemas.RepoReconResponse)
+
+
+@router.delete(
+    "/repos/recon/{task_id}",
+    response_model=schemas.RepoReconResponse,
+    summary="Cancel a running /repos/recon job using the task_id.",
+    description=(
+        "Request cancellation of a pending or in_progress recon job. The job "
+        "stops before the next repo, saves nothing and ends with a "
+        "task_status of cancelled."
+    ),
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def cancel_repo_recon(task_id: str, db: Session = Depends(get_db)):
+    """Cancel a running /repos/recon job using the task_id"""
+    task = crud.get_task(db, task_id, "recon")
+    if task is None:
         raise HTTPException(status_code=404, detail="repo recon not found")
-    return task_storage[task_id]
+    if not cancel_task(task_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Task already {task.task_status}",
+        )
+    db.refresh(task)
+    return describe_task(db, task, schemas.RepoReconResponse)
@@ -0,0 +1,184 @@
+"""Job scheduling: worker slots per priority lane plus admission control
+
+Asset and recon jobs wait for a slot in their lane before they start. Small,
+exact-UWI lookups go to the interactive lane so they never queue behind bulk
+exports. Slots are per uvicorn worker; queue and per-repo limits are counted
+across all workers from the shared tasks table. Streams and inline queries
+have no task: they count toward their repo's limit only in the worker that
+serves them (see RepoQueries).
+"""
+
+import asyncio
+import os
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from enum import Enum
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from purr_petra.core.crud import count_tasks
+from purr_petra.core.logger import logger
+from purr_petra.core.tasks import ACTIVE_STATUSES
+from purr_petra.core.schemas import TaskStatus
+
+try:
+    import psutil  # optional: enables CPU and memory admission limits
+except ImportError:
+    psutil = None
+
+
+INTERACTIVE_SLOTS = int(os.environ.get("PURR_PETRA_INTERACTIVE_SLOTS", "2"))
+BULK_SLOTS = int(os.environ.get("PURR_PETRA_BULK_SLOTS", "2"))
+MAX_QUEUED = int(os.environ.get("PURR_PETRA_MAX_QUEUED", "50"))
+MAX_REPO_JOBS = int(os.environ.get("PURR_PETRA_MAX_REPO_JOBS", "3"))
+MAX_CPU_PERCENT = float(os.environ.get("PURR_PETRA_MAX_CPU_PERCENT", "90"))
+MAX_MEMORY_PERCENT = float(os.environ.get("PURR_PETRA_MAX_MEMORY_PERCENT", "90"))
+
+# up to this many exact (no wildcard) UWIs counts as an interactive lookup
+INTERACTIVE_MAX_UWIS = 10
+
+# seconds between resource checks while a bulk job is deferred
+DEFER_INTERVAL = 2.0
+
+
+class Lane(str, Enum):
+    """Priority lanes; each has its own worker slots"""
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+def pick_lane(uwi_list: Optional[List[str]]) -> Lane:
+    """A handful of exact UWIs is interactive, anything else is bulk
+
+    Args:
+        uwi_list (Optional[List[str]]): parsed UWIs (see parse_uwis)
+
+    Returns:
+        Lane: The lane to queue the job in
+    """
+    if (
+        uwi_list
+        and len(uwi_list) <= INTERACTIVE_MAX_UWIS
+        and not any("%" in u or "_" in u for u in uwi_list)
+    ):
+        return Lane.INTERACTIVE
+    return Lane.BULK
+
+
+def system_overloaded() -> Optional[str]:
+    """Check CPU and memory against the configured limits (needs psutil)
+
+    Returns:
+        Optional[str]: A reason if overloaded, otherwise None
+    """
+    if psutil is None:
+        return None
+    cpu = psutil.cpu_percent(interval=None)
+    if cpu >= MAX_CPU_PERCENT:
+        return f"cpu at {cpu}%"
+    mem = psutil.virtual_memory().percent
+    if mem >= MAX_MEMORY_PERCENT:
+        return f"memory at {mem}%"
+    return None
+
+
+def warn_if_unmonitored() -> None:
+    """At startup: without psutil the CPU and memory limits do nothing"""
+    if psutil is None:
+        logger.warning(
+            "psutil is not installed: PURR_PETRA_MAX_CPU_PERCENT and "
+            "PURR_PETRA_MAX_MEMORY_PERCENT are not enforced"
+        )
+
+
+class RepoQueries:
+    """Streams and inline queries in flight in this worker, per repo. They
+    take no task or scheduler slot, so admit adds them to the repo's active
+    jobs. Counts are taken on the event loop, but the lock keeps count()
+    safe wherever it is called from."""
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def count(self, repo_id: str) -> int:
+        """Queries in flight for a repo"""
+        with self.lock:
+            return self.counts.get(repo_id, 0)
+
+    def acquire(self, repo_id: str) -> None:
+        """Count a new query (call right after admit, with no await between)"""
+        with self.lock:
+            self.counts[repo_id] = self.counts.get(repo_id, 0) + 1
+
+    def release(self, repo_id: str) -> None:
+        """Stop counting a finished query"""
+        with self.lock:
+            self.counts[repo_id] -= 1
+            if self.counts[repo_id] <= 0:
+                del self.counts[repo_id]
+
+    @contextmanager
+    def hold(self, repo_id: str) -> Iterator[None]:
+        """Count a query for the duration of the block"""
+        self.acquire(repo_id)
+        try:
+            yield
+        finally:
+            self.release(repo_id)
+
+
+repo_queries = RepoQueries()
+
+
+def admit(db: Session, repo_id: Optional[str] = None) -> None:
+    """Admission control for a new job, checked before the task is created
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        repo_id (Optional[str]): The repo the job will query, if any
+
+    Raises:
+        HTTPException: 429 if the queue is full or the repo already has too
+        many active jobs (tasks, plus this worker's streams and inline queries)
+    """
+    queued = count_tasks(db, [TaskStatus.PENDING.value])
+    if queued >= MAX_QUEUED:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Job queue is full ({queued} pending); try again later",
+            headers={"Retry-After": "30"},
+        )
+    if repo_id is not None:
+        active = count_tasks(db, ACTIVE_STATUSES, repo_id=repo_id)
+        active += repo_queries.count(repo_id)
+        if active >= MAX_REPO_JOBS:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Repo {repo_id} already has {active} active jobs",
+                headers={"Retry-After": "30"},
+            )
+
+
+class JobScheduler:
+    """Per-process worker slots for each lane. Waiters are served in FIFO
+    order (asyncio.Semaphore), and bulk jobs are deferred while the host is
+    overloaded."""
+
+    def __init__(self, slots: Dict[Lane, int]):
+        self.slots = slots
+        self.semaphores = {lane: asyncio.Semaphore(n) for lane, n in slots.items()}
+
+    @asynccontextmanager
+    async def slot(self, lane: Lane) -> AsyncIterator[None]:
+        """Wait for a free slot in the lane, then hold it for the job"""
+        async with self.semaphores[lane]:
+            if lane == Lane.BULK:
+                while reason := system_overloaded():
+                    logger.info(f"deferring bulk job: {reason}")
+                    await asyncio.sleep(DEFER_INTERVAL)
+            yield
+
+
+scheduler = JobScheduler({Lane.INTERACTIVE: INTERACTIVE_SLOTS, Lane.BULK: BULK_SLOTS})
@@ -1,9 +1,9 @@
 """Pydantic Schemas"""
 
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 
 class SettingsBase(BaseModel):
@@ -95,6 +95,74 @@ class RepoMinimal(BaseModel):
         from_attributes = True
 
 
+class WellCopy(BaseModel):
+    """Pydantic model for one Repo's copy of a well in the well catalog"""
+
+    repo_id: str
+    repo_name: str
+    wsn: int
+    uwi: Optional[str] = None
+    api: Optional[str] = None
+    api10: Optional[str] = None
+    label: Optional[str] = None
+    chgdate: Optional[datetime] = None
+
+
+class WellLookup(BaseModel):
+    """Pydantic model for WellLookup: every Repo containing a well"""
+
+    uwi: str
+    api10: Optional[str] = None
+    copies: List[WellCopy]
+
+
+class WellDuplicate(BaseModel):
+    """Pydantic model for WellDuplicate: one wellbore (14-digit API), or with
+    surface, one surface well (10-digit API), found in several Repos.
+    Copies are newest first; chgdate_spread_days is newest minus oldest."""
+
+    api: str
+    surface: bool = False
+    repo_count: int
+    newest_chgdate: Optional[datetime] = None
+    oldest_chgdate: Optional[datetime] = None
+    chgdate_spread_days: Optional[float] = None
+    copies: List[WellCopy]
+
+
+class ExportFormat(str, Enum):
+    """Output format of an asset export"""
+
+    JSON = "json"
+    LAS = "las"
+
+
+class ResampleMethod(str, Enum):
+    """How vector_log curves are resampled to a new step"""
+
+    LINEAR = "linear"
+    NEAREST = "nearest"
+    MEAN = "mean"
+    DECIMATE = "decimate"
+
+
+class CurveWindow(BaseModel):
+    """Pydantic model for CurveWindow: the depth interval (top/base) and
+    optional target step to cut vector_log curves down to"""
+
+    top: Optional[float] = None
+    base: Optional[float] = None
+    step: Optional[float] = Field(default=None, gt=0)
+    method: ResampleMethod = ResampleMethod.LINEAR
+
+    @model_validator(mode="after")
+    def check_interval(self) -> "CurveWindow":
+        """top must be above (less than) base"""
+        if self.top is not None and self.base is not None and self.top > self.base:
+            raise ValueError("top must not be below base")
+        return self
+
+
 class TaskStatus(str, Enum):
     """TaskStatus Enum"""
 
@@ -102,6 +170,21 @@ class TaskStatus(str, Enum):
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class TaskProgress(BaseModel):
+    """Pydantic model for TaskProgress (for recon, each 'chunk' is a repo)"""
+
+    stage: str = "pending"
+    chunks_total: int = 0
+    chunks_completed: int = 0
+    ids_resolved: int = 0
+    docs_written: int = 0
+    bytes_written: int = 0
+    rows_per_second: float = 0.0
+    elapsed_seconds: float = 0.0
+    eta_seconds: Optional[float] = None
 
 
 class RepoReconCreate(BaseModel):
@@ -116,6 +199,14 @@ class RepoReconResponse(BaseModel):
     id: str
     recon_root: str
     task_status: TaskStatus
+    lane: Optional[str] = None
+    queue_position: Optional[int] = None
+    progress: TaskProgress = Field(default_factory=TaskProgress)
+
+    class Config:
+        """Pydantic voodoo"""
+
+        from_attributes = True
 
 
 class AssetCollectionResponse(BaseModel):
@@ -123,4 +214,13 @@ class AssetCollectionResponse(BaseModel):
 
     id: str
     task_status: TaskStatus
-    task_message: str
+    task_message: Union[str, Dict[str, Any]]
+    coalesced: bool = False
+    lane: Optional[str] = None
+    queue_position: Optional[int] = None
+    progress: TaskProgress = Field(default_factory=TaskProgress)
+
+    class Config:
+        """Pydantic voodoo"""
+
+        from_attributes = True
@@ -0,0 +1,288 @@
+"""Cooperative cancellation and progress reporting for asset and recon tasks
+
+Task state lives in the shared sqlite tasks table (see crud), not in process
+memory, so a task started by one uvicorn worker can be polled or cancelled
+through any other worker.
+"""
+
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Type, TypeVar
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from purr_petra.core.crud import (
+    evict_expired_tasks,
+    get_active_tasks,
+    is_task_cancel_requested,
+    queue_position,
+    request_task_cancel,
+    transition_task,
+    update_task_progress,
+)
+from purr_petra.core.database import get_db
+from purr_petra.core.logger import logger
+from purr_petra.core.models import Task
+from purr_petra.core.schemas import TaskProgress, TaskStatus
+
+try:
+    import psutil  # optional: tells whether another worker is still running
+except ImportError:
+    psutil = None
+
+TaskResponse = TypeVar("TaskResponse", bound=BaseModel)
+
+# finished tasks stay available to status polls this long (seconds)
+TASK_TTL = int(os.environ.get("PURR_PETRA_TASK_TTL", "86400"))
+
+# minimum seconds between progress writes to sqlite (stage changes always write)
+PROGRESS_INTERVAL = 1.0
+
+ACTIVE_STATUSES = [TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value]
+FINISHED_STATUSES = [
+    TaskStatus.COMPLETED.value,
+    TaskStatus.FAILED.value,
+    TaskStatus.CANCELLED.value,
+]
+
+
+class TaskCancelled(Exception):
+    """Raised inside a running task once cancellation has been requested"""
+
+
+def raise_if_cancelled(task_id: Optional[str]) -> None:
+    """Checkpoint called from within task loops (between chunks or repos). A
+    None task_id (i.e. work not tied to a task, like a streamed response) is
+    never cancelled.
+
+    Args:
+        task_id (Optional[str]): The task uuid
+
+    Raises:
+        TaskCancelled: If cancellation was requested for this task
+    """
+    if task_id is None:
+        return
+    db = next(get_db())
+    try:
+        cancelled = is_task_cancel_requested(db, task_id)
+    finally:
+        db.close()
+    if cancelled:
+        raise TaskCancelled(f"task cancelled: {task_id}")
+
+
+def start_task(task_id: str) -> bool:
+    """Move a task from pending to in_progress. This fails if the task was
+    cancelled (or otherwise finished) before it got started.
+
+    Args:
+        task_id (str): The task uuid
+
+    Returns:
+        bool: True if the task should run
+    """
+    db = next(get_db())
+    try:
+        return transition_task(
+            db, task_id, TaskStatus.IN_PROGRESS.value, [TaskStatus.PENDING.value]
+        )
+    finally:
+        db.close()
+
+
+def finish_task(task_id: str, to_status: TaskStatus, **values) -> bool:
+    """Move an active task to completed, failed or cancelled
+
+    Args:
+        task_id (str): The task uuid
+        to_status (TaskStatus): A finished TaskStatus
+        **values: Other Task columns to set, e.g. task_message
+
+    Returns:
+        bool: True if the task was still active
+    """
+    db = next(get_db())
+    try:
+        return transition_task(db, task_id, to_status.value, ACTIVE_STATUSES, **values)
+    finally:
+        db.close()
+
+
+def cancel_task(task_id: str) -> bool:
+    """Cancel a task: a pending task is cancelled outright, an in_progress task
+    is flagged and stops at its next checkpoint.
+
+    Args:
+        task_id (str): The task uuid
+
+    Returns:
+        bool: False if the task had already finished
+    """
+    db = next(get_db())
+    try:
+        if transition_task(
+            db,
+            task_id,
+            TaskStatus.CANCELLED.value,
+            [TaskStatus.PENDING.value],
+            task_message="cancelled by request",
+            cancel_requested=True,
+        ):
+            return True
+        return request_task_cancel(db, task_id, ACTIVE_STATUSES)
+    finally:
+        db.close()
+
+
+def evict_tasks() -> int:
+    """Drop finished tasks older than TASK_TTL so the tasks table stays small
+
+    Returns:
+        int: Number of tasks deleted
+    """
+    db = next(get_db())
+    try:
+        return evict_expired_tasks(db, TASK_TTL, FINISHED_STATUSES)
+    finally:
+        db.close()
+
+
+def worker_alive(pid: Optional[int]) -> Optional[bool]:
+    """Whether the worker process that created a task is still running
+
+    Args:
+        pid (Optional[int]): Task.worker_pid
+
+    Returns:
+        Optional[bool]: None if it cannot be told (Windows without psutil)
+    """
+    if pid is None or pid == os.getpid():
+        # no owner, or a previous process whose pid this worker now has
+        return False
+    if psutil is not None:
+        return psutil.pid_exists(pid)
+    if os.name != "posix":
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+def fail_orphaned_tasks() -> int:
+    """Fail tasks left pending or in_progress by a worker that crashed or was
+    restarted, so they stop counting toward the queue and per-repo limits and
+    release their request_key. Run at startup. Tasks idle for TASK_TTL are
+    failed too, whatever their worker (its pid may have been reused).
+
+    Returns:
+        int: Number of tasks failed
+    """
+    cutoff = datetime.now() - timedelta(seconds=TASK_TTL)
+    db = next(get_db())
+    try:
+        failed = 0
+        for task in get_active_tasks(db, ACTIVE_STATUSES):
+            if task.updated >= cutoff and worker_alive(task.worker_pid) is not False:
+                continue
+            failed += transition_task(
+                db,
+                task.id,
+                TaskStatus.FAILED.value,
+                ACTIVE_STATUSES,
+                task_message="worker stopped before the task finished",
+            )
+        if failed:
+            logger.warning(f"failed {failed} tasks orphaned by a stopped worker")
+        return failed
+    finally:
+        db.close()
+
+
+def describe_task(
+    db: Session, task: Task, schema: Type[TaskResponse]
+) -> TaskResponse:
+    """Build a task's API response, including its current queue position
+
+    Args:
+        db (Session): Current SQLAlchemy Session (SQLite)
+        task (Task): The stored Task
+        schema (Type[TaskResponse]): AssetCollectionResponse or RepoReconResponse
+
+    Returns:
+        TaskResponse: The response model
+    """
+    res = schema.model_validate(task)
+    res.queue_position = queue_position(db, task)
+    return res
+
+
+class ProgressTracker:
+    """Keeps a task's TaskProgress current as work proceeds.
+
+    Progress is saved to the task's row (throttled to PROGRESS_INTERVAL) so it
+    is visible to status polls on any worker. Work that is not tied to a task
+    just keeps its TaskProgress in memory.
+    """
+
+    def __init__(self, task_id: Optional[str] = None):
+        self.task_id = task_id
+        self.progress = TaskProgress()
+        self.started = time.monotonic()
+        self.rows = 0
+        self.published = 0.0
+
+    def stage(self, name: str) -> None:
+        """Set the current stage, e.g. 'identify', 'collect'"""
+        self.progress.stage = name
+        self._tick(force=True)
+
+    def plan(self, chunks_total: int, ids_resolved: int = 0) -> None:
+        """Record how much work there is once ids (or repos) are known"""
+        self.progress.chunks_total = chunks_total
+        self.progress.ids_resolved = ids_resolved
+        self._tick(force=True)
+
+    def fetched(self, rows: int) -> None:
+        """Count rows fetched from the project database (for rows_per_second)"""
+        self.rows += rows
+        self._tick()
+
+    def chunk_done(self, docs: int = 0, bytes_written: int = 0) -> None:
+        """Count a finished chunk (or repo) along with the docs it produced
+
+        Args:
+            docs (int): docs written from this chunk
+            bytes_written (int): total bytes written so far (not a delta)
+        """
+        self.progress.chunks_completed += 1
+        self.progress.docs_written += docs
+        if bytes_written:
+            self.progress.bytes_written = bytes_written
+        self._tick()
+
+    def _tick(self, force: bool = False) -> None:
+        """Recompute elapsed time, throughput and ETA, then publish"""
+        p = self.progress
+        now = time.monotonic()
+        elapsed = now - self.started
+        p.elapsed_seconds = round(elapsed, 2)
+        p.rows_per_second = round(self.rows / elapsed, 1) if elapsed > 0 else 0.0
+        if p.chunks_completed and p.chunks_total:
+            remaining = max(p.chunks_total - p.chunks_completed, 0)
+            p.eta_seconds = round(elapsed / p.chunks_completed * remaining, 1)
+
+        if self.task_id is None:
+            return
+        if not force and now - self.published < PROGRESS_INTERVAL:
+            return
+        self.published = now
+        db = next(get_db())
+        try:
+            update_task_progress(db, self.task_id, p.model_dump())
+        finally:
+            db.close()
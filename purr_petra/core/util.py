@@ -4,6 +4,7 @@ import asyncio
 import functools
 import hashlib
 import json
+import re
 import socket
 import time
 import importlib.util
@@ -172,6 +173,42 @@ def datetime_formatter(
     return format_datetime
 
 
+def normalize_api(uwi: Optional[str]) -> Optional[str]:
+    """Expand a US API number (10, 12 or 14 digits, with or without dashes)
+    to its full 14 digits, padding a missing sidetrack and event code with
+    zeros, so formatting variants of the same wellbore compare equal. Its
+    first 10 digits (see surface_api) identify the surface well.
+
+    Examples:
+        "42-501-20130-03" ~~> "42501201300300"
+        "4250120130" ~~> "42501201300000"
+
+    Args:
+        uwi (Optional[str]): A UWI string
+
+    Returns:
+        Optional[str]: The 14-digit API, or None if the UWI isn't API-like
+    """
+    if not uwi:
+        return None
+    digits = re.sub(r"[\s\-.]", "", str(uwi))
+    if not digits.isdigit() or len(digits) not in (10, 12, 14):
+        return None
+    return digits.ljust(14, "0")
+
+
+def surface_api(api: Optional[str]) -> Optional[str]:
+    """The 10-digit surface well API shared by all sidetracks of a wellbore
+
+    Args:
+        api (Optional[str]): A 14-digit API from normalize_api
+
+    Returns:
+        Optional[str]: Its first 10 digits, or None
+    """
+    return api[:10] if api else None
+
+
 def timestamp_filename(repo_id: str, asset: str, ext: str = "json"):
     """Simple file name generator for JSON exports
 
@@ -6,9 +6,15 @@ import os
 import uvicorn
 from purr_petra.core import routes_settings
 from purr_petra.assets.collect import routes_assets
+from purr_petra.assets.collect.transform import (
+    shutdown_transform_pool,
+    warn_if_unpooled,
+)
 from purr_petra.core.crud import init_file_depot
 from purr_petra.core.database import get_db
 from purr_petra.core.logger import logger
+from purr_petra.core.scheduler import warn_if_unmonitored
+from purr_petra.core.tasks import evict_tasks, fail_orphaned_tasks
 from purr_petra.prep.setup import prepare
 
 
@@ -21,7 +27,13 @@ async def lifespan(fastapp: FastAPI):  # pylint: disable=unused-argument
     """
     db = next(get_db())
     init_file_depot(db)
+    db.close()
+    evict_tasks()
+    fail_orphaned_tasks()
+    warn_if_unmonitored()
+    warn_if_unpooled()
     yield
+    shutdown_transform_pool()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -1,20 +1,31 @@
 """Main entry for Repo Recon"""
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
-from purr_petra.core.crud import upsert_repos
+from typing import Dict, List, Any, Optional
+from purr_petra.core.crud import replace_well_index, upsert_repos
 from purr_petra.core.database import get_db
 from purr_petra.core.dbisam import make_conn_params
 from purr_petra.core.util import generate_repo_id
 from purr_petra.recon.epsg import epsg_codes
-from purr_petra.recon.repo_db import well_counts, get_polygon, check_dbisam
-from purr_petra.recon.repo_fs import network_repo_scan, dir_stats, repo_mod
+from purr_petra.recon.repo_db import well_counts, get_polygon, check_dbisam, well_index
+from purr_petra.recon.repo_fs import (
+    network_repo_scan,
+    dir_stats,
+    repo_fingerprint,
+    repo_mod,
+)
 from purr_petra.core.schemas import Repo
 from purr_petra.core.logger import logger
+from purr_petra.core.tasks import ProgressTracker, raise_if_cancelled
 
 
-async def repo_recon(recon_root: str) -> List[Dict[str, Any]]:
+async def repo_recon(
+    recon_root: str,
+    task_id: Optional[str] = None,
+    tracker: Optional[ProgressTracker] = None,
+) -> List[Dict[str, Any]]:
     """Recursively crawl a network path for Petra project metadata.
 
     1. repo_paths: identify potential repos by file structure
@@ -22,48 +33,111 @@ async def repo_recon(recon_root: str) -> List[Dict[str, Any]]:
     3. repo_list: check DBISAM connectivity, reject (but log) failures
     4. define and run 'augment' functions to add metadata to each repo_base
     5. validate dict against pydantic Repo schema and save to sqlite
-    6. reformat repo.repo_mod to string to permit json serialization
+    6. save each repo's well identifiers to the local well index
+    7. reformat repo.repo_mod to string to permit json serialization
+
+    Cancellation is checked between repos. Nothing is saved to sqlite until
+    every repo has been augmented, so a cancelled recon leaves no partial state.
 
     Args:
         recon_root (str): A directory containing Petra repos (projects).
+        task_id (Optional[str]): Task uuid, used to check for cancellation
+        tracker (Optional[ProgressTracker]): Reports progress (one chunk per
+            repo) to task status
 
     Returns:
         List[dict]: List of repo dicts containing metadata
     """
+    tracker = tracker or ProgressTracker()
+
+    tracker.stage("scan")
     repo_paths = await network_repo_scan(recon_root)
+    raise_if_cancelled(task_id)
     repo_list = [create_repo_base(rp) for rp in repo_paths]
 
-    # make another pass to verify dbisam
-    repo_list = [repo_base for repo_base in repo_list if check_dbisam(repo_base)]
-
     augment_funcs = [well_counts, get_polygon, epsg_codes, dir_stats, repo_mod]
 
-    async def update_repo(repo_base):
+    # repo_id -> (fingerprint, wells); the fingerprint is taken first so that
+    # a write during the read leaves the index stale rather than wrong
+    well_indexes = {}
+
+    def update_repo(repo_base):
         """Could not use memory tables in SQL if using async_wrap without
         getting DBISAM Engine Error # 11013. I think it's because DBISAM lets
         Windows deal with file locking so connection/cursor closing in pyodbc
-        wasn't happening in the thread context.
+        wasn't happening in the thread context. So every DBISAM call of a
+        recon runs in one dedicated thread (see below), never hopping threads.
         """
         for func in augment_funcs:
-            # repo_base.update(await async_wrap(func)(repo_base))
             repo_base.update(func(repo_base))
             logger.debug(f"{repo_base} applied function: {func}")
+        fingerprint = repo_fingerprint(repo_base["fs_path"])
+        wells = well_index(repo_base)
+        if fingerprint and wells is not None:
+            well_indexes[repo_base["id"]] = (fingerprint, wells)
         return repo_base
 
-    repos = await asyncio.gather(*[update_repo(repo) for repo in repo_list])
-
+    # repos are read one at a time off the event loop, so cancellation and
+    # status polls are served while recon runs
+    loop = asyncio.get_running_loop()
+    repos = []
+    with ThreadPoolExecutor(max_workers=1) as dbisam_thread:
+        # make another pass to verify dbisam
+        checked = await asyncio.gather(
+            *[loop.run_in_executor(dbisam_thread, check_dbisam, r) for r in repo_list]
+        )
+        repo_list = [r for r, ok in zip(repo_list, checked) if ok]
+
+        tracker.plan(len(repo_list))
+        tracker.stage("augment")
+
+        for repo_base in repo_list:
+            raise_if_cancelled(task_id)
+            repos.append(
+                await loop.run_in_executor(dbisam_thread, update_repo, repo_base)
+            )
+            tracker.chunk_done()
+
+    raise_if_cancelled(task_id)
+
+    tracker.stage("save")
     valid_repo_dicts = [Repo(**r).model_dump() for r in repos]
 
     db = next(get_db())
     upsert_repos(db, valid_repo_dicts)
+    for repo_id, (fingerprint, wells) in well_indexes.items():
+        replace_well_index(db, repo_id, fingerprint, wells)
     db.close()
 
     for r in valid_repo_dicts:
         r["repo_mod"] = r["repo_mod"].strftime("%Y-%m-%d %H:%M:%S")
 
+    tracker.stage("done")
     return valid_repo_dicts
 
 
+def refresh_well_index(repo_base: Dict[str, Any]) -> bool:
+    """Rebuild one repo's well index outside of a full recon, e.g. when its
+    DB files have changed since recon last ran
+
+    Args:
+        repo_base (Dict[str, Any]): A stub repo dict (id, fs_path and conn)
+
+    Returns:
+        bool: True if the index was rebuilt
+    """
+    fingerprint = repo_fingerprint(repo_base["fs_path"])
+    wells = well_index(repo_base)
+    if not fingerprint or wells is None:
+        return False
+    db = next(get_db())
+    try:
+        replace_well_index(db, repo_base["id"], fingerprint, wells)
+    finally:
+        db.close()
+    return True
+
+
 def create_repo_base(rp: str) -> Dict[str, Any]:
     """
     See repo_recon for details
@@ -1,10 +1,13 @@
 """Stuff involving metadata within Repo databases"""
 
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from shapely.geometry import Polygon, MultiPolygon
 import numpy as np
 import alphashape  # mypy: ignore-missing-imports
+from purr_petra.assets.collect.xformer import excel_date
 from purr_petra.core.dbisam import db_exec
+from purr_petra.core.util import normalize_api, surface_api
 from purr_petra.core.logger import logger
 
 # DBISAM cannot do COUNT(DISTINCT *) and suggests using memory tables as an
@@ -129,6 +132,14 @@ WELLS_WITH_ZONE = (
 )
 
 
+WELL_INDEX = (
+    "SELECT w.wsn, u.uwi, u.sortname, w.label, w.chgdate, s.lon, s.lat "
+    "FROM well w "
+    "LEFT JOIN uwi u ON u.wsn = w.wsn "
+    "LEFT JOIN locat s ON s.wsn = w.wsn"
+)
+
+
 def check_dbisam(repo_base) -> bool:
     """A simple query to see if the database WELL table is accessible. This will
     cause a DBISAM error if the tables have not been updated to v4.
@@ -195,6 +206,37 @@ def well_counts(repo_base) -> dict:
     return counts
 
 
+def well_index(repo_base) -> Optional[List[Dict[str, Any]]]:
+    """Read every well's identifiers, surface location and last change date
+    for the local WellIndex (see crud)
+
+    Args:
+        repo_base (dict): A stub repo dict.
+
+    Returns:
+        Optional[List[dict]]: wsn, uwi, sortname, label, lon, lat, api, api10
+        and chgdate for each well, or None if the query failed (an empty index
+        would hide every well)
+    """
+    logger.info(f"well_index: {repo_base['fs_path']}")
+
+    try:
+        res = db_exec(repo_base["conn"], WELL_INDEX)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.error({"context": repo_base["fs_path"], "error": e})
+        return None
+    keys = ["wsn", "uwi", "sortname", "label", "lon", "lat"]
+    wells = []
+    for r in res:
+        well = {k: r[k] for k in keys}
+        well["api"] = normalize_api(r["uwi"])
+        well["api10"] = surface_api(well["api"])
+        chgdate = excel_date(r["chgdate"])
+        well["chgdate"] = datetime.fromisoformat(chgdate) if chgdate else None
+        wells.append(well)
+    return wells
+
+
 def concave_hull(points, alpha=0.5) -> Optional[List[Tuple[float, float]]]:
     """Computes a concave hull of a set of points using alpha shape.
 
@@ -1,12 +1,13 @@
 """Stuff involving metadata about a Repo filesystem"""
 
 import asyncio
+import hashlib
 import os
 import re
 from datetime import datetime
 from pathlib import Path
 from subprocess import run
-from typing import List
+from typing import List, Optional
 from purr_petra.core.logger import logger
 
 
@@ -158,3 +159,28 @@ def repo_mod(repo_base) -> dict:
                 continue
 
     return {"repo_mod": last_mod.strftime("%Y-%m-%d %H:%M:%S")}
+
+
+def repo_fingerprint(fs_path: str) -> Optional[str]:
+    """Fingerprint a project's DB files (name, size and mtime of each), which
+    changes whenever Petra writes to the project database. This only stats
+    the DB directory, so it is cheap enough to check on every request.
+
+    Args:
+        fs_path (str): Full path to a repo (project) directory.
+
+    Returns:
+        Optional[str]: A sha1 hex digest, or None if the DB directory is
+        unreadable
+    """
+    digest = hashlib.sha1()
+    try:
+        with os.scandir(Path(fs_path) / "DB") as entries:
+            files = sorted(
+                (e.name.upper(), e.stat()) for e in entries if e.is_file()
+            )
+    except OSError:
+        return None
+    for name, stat in files:
+        digest.update(f"{name}|{stat.st_size}|{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()